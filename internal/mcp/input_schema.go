@@ -37,6 +37,9 @@ func buildInputSchema(tool contract.ToolContract) map[string]any {
 }
 
 func inputPropertySchema(name string) map[string]any {
+	if schema, ok := arrayObjectFields[name]; ok {
+		return schema
+	}
 	if schema, ok := arrayStringFields[name]; ok {
 		return schema
 	}
@@ -76,6 +79,7 @@ var stringFields = map[string]map[string]any{
 	"stage":           {"type": "string"},
 	"strictness_mode": {"type": "string"},
 	"tone":            {"type": "string"},
+	"tool_name":       {"type": "string"},
 	"user_id":         {"type": "string"},
 }
 
@@ -114,3 +118,10 @@ var arrayStringFields = map[string]map[string]any{
 		"items": map[string]any{"type": "string"},
 	},
 }
+
+var arrayObjectFields = map[string]map[string]any{
+	"jobs": {
+		"type":  "array",
+		"items": map[string]any{"type": "object"},
+	},
+}
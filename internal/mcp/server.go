@@ -6,6 +6,7 @@ import (
 	"errors"
 	"fmt"
 	"io"
+	"maps"
 	"strings"
 	"sync"
 
@@ -26,6 +27,7 @@ var Version = "0.3.1"
 
 var implementedToolHandlers = map[string]toolHandler{
 	"get_mcp_capabilities":                getMCPCapabilities,
+	"get_mcp_tool_contract":               getMCPToolContract,
 	"set_user_preferences":                user.SetUserPreferences,
 	"set_user_constraints":                user.SetUserConstraints,
 	"get_user_preferences":                user.GetUserPreferences,
@@ -39,9 +41,11 @@ var implementedToolHandlers = map[string]toolHandler{
 	"export_user_data":                    user.ExportUserData,
 	"delete_user_data":                    user.DeleteUserData,
 	"save_job_for_later":                  user.SaveJobForLater,
+	"save_jobs_bulk":                      user.SaveJobsBulk,
 	"list_saved_jobs":                     user.ListSavedJobs,
 	"delete_saved_job":                    user.DeleteSavedJob,
 	"ignore_job":                          user.IgnoreJob,
+	"ignore_jobs_bulk":                    user.IgnoreJobsBulk,
 	"list_ignored_jobs":                   user.ListIgnoredJobs,
 	"unignore_job":                        user.UnignoreJob,
 	"ignore_company":                      user.IgnoreCompany,
@@ -108,13 +112,17 @@ func newServer() (*mcpSDK.Server, error) {
 	if err != nil {
 		return nil, err
 	}
+	contracts, err := toolContractPayloads()
+	if err != nil {
+		return nil, err
+	}
 	for _, tc := range tools {
 		tool := tc
 		handler := resolveToolHandler(tool.Name)
 		mcpSDK.AddTool(server, &mcpSDK.Tool{
 			Name:        tool.Name,
 			Description: tool.Description,
-			InputSchema: buildInputSchema(tool),
+			InputSchema: contracts[tool.Name]["input_schema"],
 		}, func(
 			_ context.Context,
 			_ *mcpSDK.CallToolRequest,
@@ -130,7 +138,7 @@ func newServer() (*mcpSDK.Server, error) {
 				return nil, nil, err
 			}
 
-			contentText, err := prettyJSON(payload)
+			contentText, err := toolResultText(tool.Name, payload)
 			if err != nil {
 				contentText = fmt.Sprintf("%v", payload)
 			}
@@ -163,13 +171,106 @@ func prettyJSON(value map[string]any) (string, error) {
 	return string(content), nil
 }
 
-func getMCPCapabilities(_ map[string]any) (map[string]any, error) {
+// capabilitiesPayload builds the get_mcp_capabilities response once; every
+// field comes from the embedded contract and the runtime version, so there is
+// nothing to recompute per call. Callers must treat it as read-only. Agents
+// should list tools from the name/description index and fetch a tool's inputs
+// on demand with get_mcp_tool_contract; the full tools list is still returned
+// while it is deprecated (see deprecations in the contract).
+var capabilitiesPayload = sync.OnceValues(func() (map[string]any, error) {
 	payload, err := contract.Capabilities()
 	if err != nil {
 		return nil, fmt.Errorf("failed to load capabilities: %w", err)
 	}
+	tools, err := contract.ToolContracts()
+	if err != nil {
+		return nil, fmt.Errorf("failed to load tool contracts: %w", err)
+	}
+	index := make([]any, 0, len(tools))
+	for _, tool := range tools {
+		index = append(index, map[string]any{"name": tool.Name, "description": tool.Description})
+	}
+	payload["tools_index"] = index
 	payload["version"] = Version
 	return payload, nil
+})
+
+// toolContractPayloads holds each tool's full get_mcp_tool_contract entry,
+// built once from the embedded contract. The input schemas are shared with
+// tool registration, so every entry is read-only.
+var toolContractPayloads = sync.OnceValues(func() (map[string]map[string]any, error) {
+	tools, err := contract.ToolContracts()
+	if err != nil {
+		return nil, fmt.Errorf("failed to load tool contracts: %w", err)
+	}
+	out := make(map[string]map[string]any, len(tools))
+	for _, tool := range tools {
+		optional := tool.OptionalInputs
+		if optional == nil {
+			optional = []string{}
+		}
+		out[tool.Name] = map[string]any{
+			"name":            tool.Name,
+			"description":     tool.Description,
+			"required_inputs": append([]string{}, tool.RequiredInputs...),
+			"optional_inputs": optional,
+			"input_schema":    buildInputSchema(tool),
+		}
+	}
+	return out, nil
+})
+
+// capabilitiesText renders the constant capabilities payload once instead of
+// re-indenting the same JSON on every call.
+var capabilitiesText = sync.OnceValues(func() (string, error) {
+	payload, err := capabilitiesPayload()
+	if err != nil {
+		return "", err
+	}
+	return prettyJSON(payload)
+})
+
+// constantToolTexts holds pre-rendered text content for tools whose response
+// never changes.
+var constantToolTexts = map[string]func() (string, error){
+	"get_mcp_capabilities": capabilitiesText,
+}
+
+func toolResultText(name string, payload map[string]any) (string, error) {
+	if text, ok := constantToolTexts[name]; ok {
+		return text()
+	}
+	return prettyJSON(payload)
+}
+
+// The cached payloads are handed out behind a fresh top-level map, so a
+// caller that adds or drops a key cannot change what the next call returns.
+// Nested values stay shared and must be treated as read-only.
+func getMCPCapabilities(_ map[string]any) (map[string]any, error) {
+	payload, err := capabilitiesPayload()
+	if err != nil {
+		return nil, err
+	}
+	return maps.Clone(payload), nil
+}
+
+func getMCPToolContract(args map[string]any) (map[string]any, error) {
+	name := ""
+	if value, ok := args["tool_name"].(string); ok {
+		name = strings.TrimSpace(value)
+	}
+	if name == "" {
+		return nil, fmt.Errorf("tool_name is required")
+	}
+	contracts, err := toolContractPayloads()
+	if err != nil {
+		return nil, err
+	}
+	entry, ok := contracts[name]
+	if !ok {
+		return nil, fmt.Errorf("unknown tool_name '%s'; see tools_index from get_mcp_capabilities", name)
+	}
+	return map[string]any{"tool": maps.Clone(entry)}, nil
 }
 
 func asReadCloser(in io.Reader) io.ReadCloser {
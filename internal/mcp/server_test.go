@@ -102,6 +102,55 @@ func TestCapabilitiesVersionUsesRuntimeVersion(t *testing.T) {
 	}
 }
 
+func TestCapabilitiesIndexAndToolContractLookup(t *testing.T) {
+	_, session, cleanup := connectTestSession(t)
+	defer cleanup()
+
+	result, err := session.CallTool(context.Background(), &mcpSDK.CallToolParams{
+		Name:      "get_mcp_capabilities",
+		Arguments: map[string]any{},
+	})
+	if err != nil || result.IsError {
+		t.Fatalf("get_mcp_capabilities failed: %v %#v", err, result)
+	}
+	structured, _ := result.StructuredContent.(map[string]any)
+	index, _ := structured["tools_index"].([]any)
+	if len(index) == 0 {
+		t.Fatalf("expected tools_index entries, got %#v", structured["tools_index"])
+	}
+	// The full list stays until the deprecation period ends.
+	if tools, _ := structured["tools"].([]any); len(tools) != len(index) {
+		t.Fatalf("expected deprecated tools list alongside tools_index, got %#v", structured["tools"])
+	}
+
+	result, err = session.CallTool(context.Background(), &mcpSDK.CallToolParams{
+		Name:      "get_mcp_tool_contract",
+		Arguments: map[string]any{"tool_name": "save_job_for_later"},
+	})
+	if err != nil || result.IsError {
+		t.Fatalf("get_mcp_tool_contract failed: %v %#v", err, result)
+	}
+	structured, _ = result.StructuredContent.(map[string]any)
+	tool := toMap(structured["tool"])
+	if getStringFromAnyMap(tool, "name") != "save_job_for_later" {
+		t.Fatalf("unexpected tool contract: %#v", tool)
+	}
+	if required := toStringSlice(tool["required_inputs"]); len(required) == 0 {
+		t.Fatalf("expected required inputs in tool contract, got %#v", tool)
+	}
+	if toMap(tool["input_schema"])["type"] != "object" {
+		t.Fatalf("expected object input schema, got %#v", tool["input_schema"])
+	}
+
+	result, err = session.CallTool(context.Background(), &mcpSDK.CallToolParams{
+		Name:      "get_mcp_tool_contract",
+		Arguments: map[string]any{"tool_name": "not_a_tool"},
+	})
+	if err == nil && !result.IsError {
+		t.Fatalf("expected unknown tool_name to fail, got %#v", result)
+	}
+}
+
 func TestCallPortedTools(t *testing.T) {
 	tmpDir := t.TempDir()
 	prefsPath := filepath.Join(tmpDir, "prefs.json")
@@ -471,3 +520,40 @@ func waitForTerminalRunStatusViaTool(t *testing.T, session *mcpSDK.ClientSession
 	})
 	t.Fatalf("timeout waiting for search run to reach terminal status: run_id=%s", runID)
 }
+
+func TestCapabilitiesTextMatchesPayload(t *testing.T) {
+	payload, err := getMCPCapabilities(nil)
+	if err != nil {
+		t.Fatalf("getMCPCapabilities failed: %v", err)
+	}
+	want, err := prettyJSON(payload)
+	if err != nil {
+		t.Fatalf("prettyJSON failed: %v", err)
+	}
+	got, err := toolResultText("get_mcp_capabilities", payload)
+	if err != nil || got != want {
+		t.Fatalf("expected pre-rendered capabilities text to match payload, err=%v", err)
+	}
+}
+
+func TestCachedContractPayloadsSurviveCallerMutation(t *testing.T) {
+	first, err := getMCPCapabilities(nil)
+	if err != nil {
+		t.Fatalf("getMCPCapabilities failed: %v", err)
+	}
+	delete(first, "tools_index")
+	again, _ := getMCPCapabilities(nil)
+	if _, ok := again["tools_index"]; !ok {
+		t.Fatalf("expected caller mutation not to reach the cached capabilities")
+	}
+
+	contract, err := getMCPToolContract(map[string]any{"tool_name": "get_user_preferences"})
+	if err != nil {
+		t.Fatalf("getMCPToolContract failed: %v", err)
+	}
+	contract["tool"].(map[string]any)["description"] = "changed"
+	fresh, _ := getMCPToolContract(map[string]any{"tool_name": "get_user_preferences"})
+	if fresh["tool"].(map[string]any)["description"] == "changed" {
+		t.Fatalf("expected caller mutation not to reach the cached tool contract")
+	}
+}
@@ -2,6 +2,7 @@ package user
 
 import (
 	"fmt"
+	"regexp"
 	"strings"
 )
 
@@ -39,20 +40,39 @@ var relatedTitleHints = map[string][]string{
 	},
 }
 
+// relatedTitleHintKeys fixes the match priority of relatedTitleHints; the
+// combined pattern below finds any hint key in a title with a single scan.
+var relatedTitleHintKeys = []string{"software engineer", "data engineer", "product manager"}
+
+var relatedTitleHintPattern = compileRelatedTitleHintPattern(relatedTitleHintKeys)
+
+func compileRelatedTitleHintPattern(keys []string) *regexp.Regexp {
+	quoted := make([]string, 0, len(keys))
+	for _, key := range keys {
+		quoted = append(quoted, regexp.QuoteMeta(key))
+	}
+	return regexp.MustCompile(strings.Join(quoted, "|"))
+}
+
+func matchRelatedTitleHints(normalized string) []string {
+	if key := relatedTitleHintPattern.FindString(normalized); key != "" {
+		return relatedTitleHints[key]
+	}
+	for _, key := range relatedTitleHintKeys {
+		if strings.Contains(key, normalized) {
+			return relatedTitleHints[key]
+		}
+	}
+	return nil
+}
+
 func findRelatedTitlesInternal(jobTitle string, limit int) []string {
 	base := strings.TrimSpace(jobTitle)
 	if base == "" {
 		return []string{}
 	}
 	normalized := strings.ToLower(base)
-	related := []string{}
-
-	for key, values := range relatedTitleHints {
-		if strings.Contains(normalized, key) || strings.Contains(key, normalized) {
-			related = append(related, values...)
-			break
-		}
-	}
+	related := append([]string{}, matchRelatedTitleHints(normalized)...)
 	if len(related) == 0 {
 		switch {
 		case strings.Contains(normalized, "engineer"):
@@ -141,10 +161,30 @@ func getFirstContact(resolved map[string]any) map[string]any {
 	return first
 }
 
+// contactStrategySteps holds the fixed steps for each recommended channel.
+// Responses share these slices; they are only ever serialized.
+var contactStrategySteps = map[string][]string{
+	"email": {
+		"Send a short intro email referencing role fit and visa type.",
+		"Attach or link a targeted resume with matching skills.",
+		"Follow up once in 48 hours if no response.",
+	},
+	"phone": {
+		"Call during business hours and ask for recruiter/hiring manager routing.",
+		"Leave a concise voicemail with callback and role context.",
+		"Follow with a short email or LinkedIn note if available.",
+	},
+	"application_plus_linkedin": {
+		"Submit the application immediately using the job URL.",
+		"Find the recruiter/hiring manager on LinkedIn and send a short intro note.",
+		"Track this role in saved jobs and follow up in 3-5 days.",
+	},
+}
+
 func GetBestContactStrategy(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	resolved, err := resolveJobReference(args, userID)
 	if err != nil {
@@ -158,26 +198,12 @@ func GetBestContactStrategy(args map[string]any) (map[string]any, error) {
 	primaryPhone := getString(primary, "phone")
 
 	channel := "application_plus_linkedin"
-	strategy := []string{
-		"Submit the application immediately using the job URL.",
-		"Find the recruiter/hiring manager on LinkedIn and send a short intro note.",
-		"Track this role in saved jobs and follow up in 3-5 days.",
-	}
 	if primaryEmail != "" {
 		channel = "email"
-		strategy = []string{
-			"Send a short intro email referencing role fit and visa type.",
-			"Attach or link a targeted resume with matching skills.",
-			"Follow up once in 48 hours if no response.",
-		}
 	} else if primaryPhone != "" {
 		channel = "phone"
-		strategy = []string{
-			"Call during business hours and ask for recruiter/hiring manager routing.",
-			"Leave a concise voicemail with callback and role context.",
-			"Follow with a short email or LinkedIn note if available.",
-		}
 	}
+	strategy := contactStrategySteps[channel]
 
 	return map[string]any{
 		"user_id": userID,
@@ -201,7 +227,7 @@ func GetBestContactStrategy(args map[string]any) (map[string]any, error) {
 }
 
 func preferredVisaLabelForUser(userID string) string {
-	prefs, err := loadPrefs()
+	prefs, err := cachedPrefs()
 	if err != nil {
 		return "work visa sponsorship"
 	}
@@ -228,10 +254,17 @@ func preferredVisaLabelForUser(userID string) string {
 	return "work visa sponsorship"
 }
 
+const (
+	outreachFitLine         = "I align strongly with the role requirements and can contribute quickly."
+	outreachAskProfessional = "If this role is still open, I’d appreciate the chance to share my background and discuss fit."
+	outreachAskUrgent       = "Given timing constraints on my side, a quick conversation would be very helpful if sponsorship is possible."
+	outreachSignOff         = "Thanks for your time,\n[Your Name]"
+)
+
 func GenerateOutreachMessage(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	resolved, err := resolveJobReference(args, userID)
 	if err != nil {
@@ -257,29 +290,21 @@ func GenerateOutreachMessage(args map[string]any) (map[string]any, error) {
 	}
 	url := getString(resolved, "job_url")
 
-	greeting := "Hi " + toName + ","
-	intro := "I’m reaching out about " + role + " at " + company + " (" + url + ")."
-	fit := "I align strongly with the role requirements and can contribute quickly."
-	visaLine := "I am specifically looking for opportunities that support " + visaLabel + "."
-	ask := "If this role is still open, I’d appreciate the chance to share my background and discuss fit."
+	ask := outreachAskProfessional
 	tone := getString(args, "tone")
 	if tone == "" {
 		tone = "professional"
 	}
-	if strings.ToLower(tone) == "urgent" {
-		ask = "Given timing constraints on my side, a quick conversation would be very helpful if sponsorship is possible."
+	if strings.EqualFold(tone, "urgent") {
+		ask = outreachAskUrgent
 	}
-	body := strings.Join([]string{
-		greeting,
-		"",
-		intro,
-		fit,
-		visaLine,
-		ask,
-		"",
-		"Thanks for your time,",
-		"[Your Name]",
-	}, "\n")
+	// A single concatenation expression builds the body in one allocation.
+	body := "Hi " + toName + ",\n\n" +
+		"I’m reaching out about " + role + " at " + company + " (" + url + ").\n" +
+		outreachFitLine + "\n" +
+		"I am specifically looking for opportunities that support " + visaLabel + ".\n" +
+		ask + "\n\n" +
+		outreachSignOff
 
 	return map[string]any{
 		"user_id": userID,
@@ -302,6 +327,7 @@ func GenerateOutreachMessage(args map[string]any) (map[string]any, error) {
 }
 
 func RefreshCompanyDatasetCache(args map[string]any) (map[string]any, error) {
+	refreshDefaultDatasetPath()
 	datasetPath := datasetPathOrDefault(getString(args, "dataset_path"))
 	clearDatasetCache(datasetPath)
 	dataset, err := loadCompanyDataset(datasetPath)
@@ -20,6 +20,17 @@ func TestFindRelatedTitles(t *testing.T) {
 	}
 }
 
+func TestFindRelatedTitlesUsesHintPriority(t *testing.T) {
+	titles := findRelatedTitlesInternal("Senior Data Engineer", 3)
+	if len(titles) == 0 || titles[0] != "Data Platform Engineer" {
+		t.Fatalf("expected data engineer hints, got %#v", titles)
+	}
+	titles = findRelatedTitlesInternal("engineer", 1)
+	if len(titles) != 1 || titles[0] != "Software Developer" {
+		t.Fatalf("expected software engineer hints for bare engineer title, got %#v", titles)
+	}
+}
+
 func TestGetBestContactStrategy(t *testing.T) {
 	setupUserToolPaths(t)
 
@@ -52,6 +63,7 @@ func TestGetBestContactStrategy(t *testing.T) {
 					},
 				},
 			},
+			"s2": map[string]any{"query": map[string]any{"user_id": "u2"}},
 		},
 	}
 	if err := saveSearchSessions(store); err != nil {
@@ -67,6 +79,14 @@ func TestGetBestContactStrategy(t *testing.T) {
 	if got := getString(withContact, "recommended_channel"); got != "email" {
 		t.Fatalf("expected email channel, got %q", got)
 	}
+	sessions := mapOrNil(loadSearchSessions()["sessions"])
+	if _, indexed := mapOrNil(sessions["s1"])["result_id_index"]; indexed || mapOrNil(sessions["s2"]) == nil {
+		t.Fatalf("expected resolving a result to leave the session store untouched, got %#v", sessions)
+	}
+	again, err := GetBestContactStrategy(map[string]any{"user_id": "u1", "result_id": "1", "session_id": "s1"})
+	if err != nil || getString(again, "recommended_channel") != "email" {
+		t.Fatalf("expected a bare result_id to resolve the same job, got %#v %v", again, err)
+	}
 }
 
 func TestGenerateOutreachMessageUsesPreferences(t *testing.T) {
@@ -96,6 +116,30 @@ func TestGenerateOutreachMessageUsesPreferences(t *testing.T) {
 	}
 }
 
+func TestGenerateOutreachMessageBody(t *testing.T) {
+	setupUserToolPaths(t)
+
+	message, err := GenerateOutreachMessage(map[string]any{
+		"user_id":        "u1",
+		"job_url":        "https://example.com/jobs/1",
+		"recipient_name": "Alex",
+		"visa_type":      "H-1B",
+		"tone":           "Urgent",
+	})
+	if err != nil {
+		t.Fatalf("GenerateOutreachMessage failed: %v", err)
+	}
+	want := "Hi Alex,\n\n" +
+		"I’m reaching out about this role at your team (https://example.com/jobs/1).\n" +
+		"I align strongly with the role requirements and can contribute quickly.\n" +
+		"I am specifically looking for opportunities that support H-1B.\n" +
+		"Given timing constraints on my side, a quick conversation would be very helpful if sponsorship is possible.\n\n" +
+		"Thanks for your time,\n[Your Name]"
+	if got := getString(message, "message"); got != want {
+		t.Fatalf("unexpected message body:\n%s", got)
+	}
+}
+
 func TestRefreshCompanyDatasetCache(t *testing.T) {
 	tmp := t.TempDir()
 	datasetPath := filepath.Join(tmp, "companies.csv")
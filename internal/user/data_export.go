@@ -1,17 +1,12 @@
 package user
 
-import "fmt"
-
-func loadUserScopedStore(path string) map[string]any {
-	return loadJSONMap(path, map[string]any{"users": map[string]any{}})
-}
-
-func saveUserScopedStore(path string, data map[string]any) error {
-	return saveJSONMap(path, data)
-}
+import (
+	"fmt"
+	"sync"
+)
 
 func getUserList(path string, userID, listKey string) []any {
-	store := loadUserScopedStore(path)
+	store := loadJournaledUserStore(path, userID)
 	users := getUsersMap(store)
 	entry := mapOrNil(users[userID])
 	if entry == nil {
@@ -20,17 +15,26 @@ func getUserList(path string, userID, listKey string) []any {
 	return listOrEmpty(entry[listKey])
 }
 
+// removeUserFromStore checks the user's own entry first, and only then copies
+// and rewrites the whole store, so users without data in a store cost one
+// subtree read instead of a full load.
 func removeUserFromStore(path string, userID, listKey string) (int, error) {
-	store := loadUserScopedStore(path)
-	users := getUsersMap(store)
-	entry := mapOrNil(users[userID])
-	if entry == nil {
+	if mapOrNil(getUsersMap(loadJournaledUserStore(path, userID))[userID]) == nil {
 		return 0, nil
 	}
-	count := len(listOrEmpty(entry[listKey]))
-	delete(users, userID)
-	store["users"] = users
-	if err := saveUserScopedStore(path, store); err != nil {
+	count := 0
+	err := updateJournaledStore(path, func(store map[string]any) (bool, error) {
+		users := getUsersMap(store)
+		entry := mapOrNil(users[userID])
+		if entry == nil {
+			return false, nil
+		}
+		count = len(listOrEmpty(entry[listKey]))
+		delete(users, userID)
+		store["users"] = users
+		return true, nil
+	})
+	if err != nil {
 		return 0, err
 	}
 	return count, nil
@@ -41,7 +45,7 @@ func loadSearchSessions() map[string]any {
 }
 
 func saveSearchSessions(data map[string]any) error {
-	return saveJSONMap(searchSessionsPath(), data)
+	return saveCompactJSONMap(searchSessionsPath(), data)
 }
 
 func loadSearchRuns() map[string]any {
@@ -49,88 +53,125 @@ func loadSearchRuns() map[string]any {
 }
 
 func saveSearchRuns(data map[string]any) error {
-	return saveJSONMap(searchRunsPath(), data)
+	return saveCompactJSONMap(searchRunsPath(), data)
 }
 
-func exportSearchSessions(userID string) []any {
-	store := loadSearchSessions()
-	sessions := mapOrNil(store["sessions"])
-	if sessions == nil {
-		return []any{}
+type searchIDsByUserCacheEntry struct {
+	Store storeFileStamp
+	IDs   map[string][]string
+}
+
+// searchIDsByUserCache indexes the session and run stores as user_id -> ids,
+// keyed by path, until the file changes. Export and delete then visit only
+// the caller's records instead of checking every user's.
+var (
+	searchIDsByUserCacheMu sync.Mutex
+	searchIDsByUserCache   = map[string]searchIDsByUserCacheEntry{}
+)
+
+// searchIDsForUser returns the ids under group in the store at path whose
+// query belongs to userID.
+func searchIDsForUser(path, group, userID string) []string {
+	stamp := statStoreFile(path)
+	searchIDsByUserCacheMu.Lock()
+	cached, ok := searchIDsByUserCache[path]
+	searchIDsByUserCacheMu.Unlock()
+	if ok && cached.Store.matches(stamp) {
+		return cached.IDs[userID]
 	}
 
-	out := []any{}
-	for sid, recordAny := range sessions {
-		record := mapOrNil(recordAny)
-		if record == nil {
+	index := map[string][]string{}
+	for id, recordAny := range mapOrNil(loadSharedJSONMap(path, nil)[group]) {
+		query := mapOrNil(mapOrNil(recordAny)["query"])
+		if query == nil {
 			continue
 		}
-		query := mapOrNil(record["query"])
-		if query == nil || getString(query, "user_id") != userID {
-			continue
-		}
-		item := map[string]any{
-			"session_id":          sid,
-			"created_at_utc":      record["created_at_utc"],
-			"updated_at_utc":      record["updated_at_utc"],
-			"expires_at_utc":      record["expires_at_utc"],
-			"query":               query,
-			"accepted_jobs_total": intOrZero(record["accepted_jobs_total"]),
-			"latest_scan_target":  intOrZero(record["latest_scan_target"]),
-			"scan_exhausted":      boolOrFalse(record["scan_exhausted"]),
+		owner := getString(query, "user_id")
+		index[owner] = append(index[owner], id)
+	}
+
+	searchIDsByUserCacheMu.Lock()
+	searchIDsByUserCache[path] = searchIDsByUserCacheEntry{Store: stamp, IDs: index}
+	searchIDsByUserCacheMu.Unlock()
+	return index[userID]
+}
+
+// eachUserSearchRecord calls visit for each of userID's records under group
+// in the shared cached store at path, straight from the index, so callers
+// build their output without an intermediate map of the records. The records
+// must not be mutated.
+func eachUserSearchRecord(path, group, userID string, visit func(id string, record map[string]any)) {
+	ids := searchIDsForUser(path, group, userID)
+	if len(ids) == 0 {
+		return
+	}
+	records := mapOrNil(loadSharedJSONMap(path, nil)[group])
+	for _, id := range ids {
+		// The store may have changed since the index was built; recheck the owner.
+		record := mapOrNil(records[id])
+		if query := mapOrNil(record["query"]); query != nil && getString(query, "user_id") == userID {
+			visit(id, record)
 		}
-		out = append(out, item)
 	}
-	return out
 }
 
-func removeSearchSessions(userID string) (int, error) {
-	store := loadSearchSessions()
-	sessions := mapOrNil(store["sessions"])
-	if sessions == nil {
+// removeUserSearchRecords deletes userID's records under group from the store
+// at path, leaving the file untouched when the user has none.
+func removeUserSearchRecords(path, group, userID string, save func(map[string]any) error) (int, error) {
+	var owned []string
+	eachUserSearchRecord(path, group, userID, func(id string, _ map[string]any) {
+		owned = append(owned, id)
+	})
+	if len(owned) == 0 {
 		return 0, nil
 	}
-
+	store := loadJSONMap(path, map[string]any{group: map[string]any{}})
+	records := mapOrNil(store[group])
 	removed := 0
-	for sid, recordAny := range sessions {
-		record := mapOrNil(recordAny)
-		if record == nil {
-			continue
-		}
-		query := mapOrNil(record["query"])
-		if query == nil || getString(query, "user_id") != userID {
-			continue
+	for _, id := range owned {
+		if _, ok := records[id]; ok {
+			delete(records, id)
+			removed++
 		}
-		delete(sessions, sid)
-		removed++
 	}
 	if removed == 0 {
 		return 0, nil
 	}
-	store["sessions"] = sessions
-	if err := saveSearchSessions(store); err != nil {
+	if err := save(store); err != nil {
 		return 0, err
 	}
 	return removed, nil
 }
 
-func exportSearchRuns(userID string) []any {
-	store := loadSearchRuns()
-	runs := mapOrNil(store["runs"])
-	if runs == nil {
-		return []any{}
-	}
-
+// exportSearchSessions reads the shared cached store without copying it;
+// only the query maps it hands out are copied.
+func exportSearchSessions(userID string) []any {
 	out := []any{}
-	for runID, recordAny := range runs {
-		record := mapOrNil(recordAny)
-		if record == nil {
-			continue
-		}
-		query := mapOrNil(record["query"])
-		if query == nil || getString(query, "user_id") != userID {
-			continue
+	eachUserSearchRecord(searchSessionsPath(), "sessions", userID, func(sid string, record map[string]any) {
+		item := map[string]any{
+			"session_id":          sid,
+			"created_at_utc":      record["created_at_utc"],
+			"updated_at_utc":      record["updated_at_utc"],
+			"expires_at_utc":      record["expires_at_utc"],
+			"query":               cloneJSONValue(record["query"]),
+			"accepted_jobs_total": intOrZero(record["accepted_jobs_total"]),
+			"latest_scan_target":  intOrZero(record["latest_scan_target"]),
+			"scan_exhausted":      boolOrFalse(record["scan_exhausted"]),
 		}
+		out = append(out, item)
+	})
+	return out
+}
+
+func removeSearchSessions(userID string) (int, error) {
+	return removeUserSearchRecords(searchSessionsPath(), "sessions", userID, saveSearchSessions)
+}
+
+// exportSearchRuns reads the shared cached store without copying it; only
+// the query maps it hands out are copied.
+func exportSearchRuns(userID string) []any {
+	out := []any{}
+	eachUserSearchRecord(searchRunsPath(), "runs", userID, func(runID string, record map[string]any) {
 		item := map[string]any{
 			"run_id":            runID,
 			"status":            getString(record, "status"),
@@ -140,41 +181,15 @@ func exportSearchRuns(userID string) []any {
 			"expires_at_utc":    record["expires_at_utc"],
 			"attempt_count":     intOrZero(record["attempt_count"]),
 			"search_session_id": getString(record, "search_session_id"),
-			"query":             query,
+			"query":             cloneJSONValue(record["query"]),
 		}
 		out = append(out, item)
-	}
+	})
 	return out
 }
 
 func removeSearchRuns(userID string) (int, error) {
-	store := loadSearchRuns()
-	runs := mapOrNil(store["runs"])
-	if runs == nil {
-		return 0, nil
-	}
-
-	removed := 0
-	for runID, recordAny := range runs {
-		record := mapOrNil(recordAny)
-		if record == nil {
-			continue
-		}
-		query := mapOrNil(record["query"])
-		if query == nil || getString(query, "user_id") != userID {
-			continue
-		}
-		delete(runs, runID)
-		removed++
-	}
-	if removed == 0 {
-		return 0, nil
-	}
-	store["runs"] = runs
-	if err := saveSearchRuns(store); err != nil {
-		return 0, err
-	}
-	return removed, nil
+	return removeUserSearchRecords(searchRunsPath(), "runs", userID, saveSearchRuns)
 }
 
 func intOrZero(value any) int {
@@ -191,38 +206,46 @@ func boolOrFalse(value any) bool {
 	return false
 }
 
+// pipelineRowsAsAny returns entry's rows under key as a list sized exactly
+// for them, or an empty list when entry is nil.
+func pipelineRowsAsAny(entry map[string]any, key string) []any {
+	if entry == nil {
+		return []any{}
+	}
+	rows := entry[key].([]map[string]any)
+	out := make([]any, len(rows))
+	for i, row := range rows {
+		out[i] = row
+	}
+	return out
+}
+
 func ExportUserData(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 
-	prefsStore, err := loadPrefs()
+	prefs, err := loadUserPrefs(userID)
 	if err != nil {
 		return nil, err
 	}
-	prefs := asMap(prefsStore[userID])
 	memoryLines := getUserList(userBlobPath(), userID, "lines")
+	for i, raw := range memoryLines {
+		if line := mapOrNil(raw); line != nil {
+			memoryLines[i] = stripMemorySearchText(line)
+		}
+	}
 	savedJobs := getUserList(savedJobsPath(), userID, "jobs")
 	ignoredJobs := getUserList(ignoredJobsPath(), userID, "jobs")
 	ignoredCompanies := getUserList(ignoredCompaniesPath(), userID, "companies")
 	searchSessions := exportSearchSessions(userID)
 	searchRuns := exportSearchRuns(userID)
-	jobMgmt := getPipelineEntry(loadJobPipeline(), userID)
-	jobMgmtJobs := []any{}
-	jobMgmtApplications := []any{}
-	jobMgmtEvents := []any{}
-	if jobMgmt != nil {
-		for _, row := range jobMgmt["jobs"].([]map[string]any) {
-			jobMgmtJobs = append(jobMgmtJobs, row)
-		}
-		for _, row := range jobMgmt["applications"].([]map[string]any) {
-			jobMgmtApplications = append(jobMgmtApplications, row)
-		}
-		for _, row := range jobMgmt["events"].([]map[string]any) {
-			jobMgmtEvents = append(jobMgmtEvents, row)
-		}
-	}
+	// One load of the user's pipeline entry serves all three row lists.
+	jobMgmt := getPipelineEntry(loadJobPipelineUser(userID), userID)
+	jobMgmtJobs := pipelineRowsAsAny(jobMgmt, "jobs")
+	jobMgmtApplications := pipelineRowsAsAny(jobMgmt, "applications")
+	jobMgmtEvents := pipelineRowsAsAny(jobMgmt, "events")
 
 	return map[string]any{
 		"user_id":         userID,
@@ -252,23 +275,14 @@ func ExportUserData(args map[string]any) (map[string]any, error) {
 			"job_management_applications": len(jobMgmtApplications),
 			"job_management_events":       len(jobMgmtEvents),
 		},
-		"paths": map[string]any{
-			"preferences_path":       prefsPath(),
-			"memory_blob_path":       userBlobPath(),
-			"saved_jobs_path":        savedJobsPath(),
-			"ignored_jobs_path":      ignoredJobsPath(),
-			"ignored_companies_path": ignoredCompaniesPath(),
-			"search_sessions_path":   searchSessionsPath(),
-			"search_runs_path":       searchRunsPath(),
-			"job_db_path":            jobDBPath(),
-		},
+		"paths": userStorePaths(0),
 	}, nil
 }
 
 func DeleteUserData(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	confirm, hasConfirm, err := getOptionalBool(args, "confirm")
 	if !hasConfirm || !confirm {
@@ -333,12 +347,13 @@ func DeleteUserData(args map[string]any) (map[string]any, error) {
 	} else {
 		deleted["search_runs"] = count
 	}
-	pipeline := loadJobPipeline()
-	entry := getPipelineEntry(pipeline, userID)
-	if entry != nil {
+	// Check the user's own entry before copying and rewriting the whole
+	// pipeline for a user who never tracked a job.
+	if entry := getPipelineEntry(loadJobPipelineUser(userID), userID); entry != nil {
 		deleted["job_management_jobs"] = len(entry["jobs"].([]map[string]any))
 		deleted["job_management_applications"] = len(entry["applications"].([]map[string]any))
 		deleted["job_management_events"] = len(entry["events"].([]map[string]any))
+		pipeline := loadJobPipeline()
 		users := getUsersMap(pipeline)
 		delete(users, userID)
 		pipeline["users"] = users
@@ -350,15 +365,6 @@ func DeleteUserData(args map[string]any) (map[string]any, error) {
 	return map[string]any{
 		"user_id": userID,
 		"deleted": deleted,
-		"paths": map[string]any{
-			"preferences_path":       prefsPath(),
-			"memory_blob_path":       userBlobPath(),
-			"saved_jobs_path":        savedJobsPath(),
-			"ignored_jobs_path":      ignoredJobsPath(),
-			"ignored_companies_path": ignoredCompaniesPath(),
-			"search_sessions_path":   searchSessionsPath(),
-			"search_runs_path":       searchRunsPath(),
-			"job_db_path":            jobDBPath(),
-		},
+		"paths":   userStorePaths(0),
 	}, nil
 }
@@ -69,6 +69,11 @@ func TestExportAndDeleteUserData(t *testing.T) {
 				},
 				"accepted_jobs_total": 4,
 			},
+			"s2": map[string]any{
+				"query": map[string]any{
+					"user_id": "u2",
+				},
+			},
 		},
 	})
 	writeJSONFile(t, runsPath, map[string]any{
@@ -106,12 +111,19 @@ func TestExportAndDeleteUserData(t *testing.T) {
 		t.Fatalf("expected search_runs=1, got %#v", counts["search_runs"])
 	}
 
-	if _, err := DeleteUserData(map[string]any{
+	deletedResult, err := DeleteUserData(map[string]any{
 		"user_id": "u1",
 		"confirm": true,
-	}); err != nil {
+	})
+	if err != nil {
 		t.Fatalf("DeleteUserData failed: %v", err)
 	}
+	deleted, _ := deletedResult["deleted"].(map[string]any)
+	for _, key := range []string{"memory_lines", "saved_jobs", "ignored_jobs", "ignored_companies"} {
+		if got, _ := deleted[key].(int); got != 1 {
+			t.Fatalf("expected %s=1 deleted, got %#v", key, deleted[key])
+		}
+	}
 
 	afterDelete, err := ExportUserData(map[string]any{"user_id": "u1"})
 	if err != nil {
@@ -130,6 +142,13 @@ func TestExportAndDeleteUserData(t *testing.T) {
 			t.Fatalf("expected %s=0 after delete, got %#v", key, afterCounts[key])
 		}
 	}
+	otherUser, err := ExportUserData(map[string]any{"user_id": "u2"})
+	if err != nil {
+		t.Fatalf("ExportUserData for another user failed: %v", err)
+	}
+	if got, _ := otherUser["counts"].(map[string]any)["search_sessions"].(int); got != 1 {
+		t.Fatalf("expected another user's session to survive the delete, got %#v", otherUser["counts"])
+	}
 }
 
 func TestDeleteUserDataRequiresConfirm(t *testing.T) {
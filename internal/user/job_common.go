@@ -2,18 +2,52 @@ package user
 
 import (
 	"fmt"
-	"regexp"
 	"strings"
 )
 
-var validJobStages = map[string]struct{}{
-	"new":       {},
-	"saved":     {},
-	"applied":   {},
-	"interview": {},
-	"offer":     {},
-	"rejected":  {},
-	"ignored":   {},
+// jobStageNames lists the valid stages in the sorted order error messages
+// use. It is the single stage table: validJobStages is built from it.
+var jobStageNames = [...]string{"applied", "ignored", "interview", "new", "offer", "rejected", "saved"}
+
+// validJobStages maps each valid stage to its position in jobStageNames.
+var validJobStages = buildJobStageIndexes()
+
+func buildJobStageIndexes() map[string]int {
+	indexes := make(map[string]int, len(jobStageNames))
+	for idx, stage := range jobStageNames {
+		indexes[stage] = idx
+	}
+	return indexes
+}
+
+// jobStageIndex returns stage's position in jobStageNames, or -1 when stage
+// is not valid.
+func jobStageIndex(stage string) int {
+	if idx, ok := validJobStages[stage]; ok {
+		return idx
+	}
+	return -1
+}
+
+// countJobStages tallies a pipeline entry's applications by stage, reporting
+// every valid stage even when it has none. Normalized applications always
+// carry a valid stage string, so it is read without re-trimming. Tallies go
+// into a fixed array and the result map is built once at the end.
+func countJobStages(entry map[string]any) map[string]int {
+	var tally [len(jobStageNames)]int
+	if entry != nil {
+		for _, app := range entry["applications"].([]map[string]any) {
+			stage, _ := app["stage"].(string)
+			if idx := jobStageIndex(stage); idx >= 0 {
+				tally[idx]++
+			}
+		}
+	}
+	counts := make(map[string]int, len(jobStageNames))
+	for idx, stage := range jobStageNames {
+		counts[stage] = tally[idx]
+	}
+	return counts
 }
 
 var companyLegalSuffixes = map[string]struct{}{
@@ -33,12 +67,17 @@ var companyLegalSuffixes = map[string]struct{}{
 	"technology":   {},
 }
 
-var nonAlnumCompanyRegex = regexp.MustCompile(`[^A-Za-z0-9\s]`)
+// notCompanyNameChar splits company names into tokens: anything other than
+// an ASCII letter or digit separates tokens, as punctuation and whitespace
+// both do in normalized names.
+func notCompanyNameChar(r rune) bool {
+	return !('a' <= r && r <= 'z' || 'A' <= r && r <= 'Z' || '0' <= r && r <= '9')
+}
 
 func validateJobStage(stage string) (string, error) {
 	clean := strings.ToLower(strings.TrimSpace(stage))
 	if _, ok := validJobStages[clean]; !ok {
-		return "", fmt.Errorf("stage must be one of [applied ignored interview new offer rejected saved]")
+		return "", fmt.Errorf("stage must be one of %v", jobStageNames)
 	}
 	return clean, nil
 }
@@ -53,8 +92,9 @@ func normalizeCompanyName(name string) string {
 	case "nan", "none", "null", "na", "n/a":
 		return ""
 	}
-	cleaned := nonAlnumCompanyRegex.ReplaceAllString(lower, " ")
-	tokens := strings.Fields(cleaned)
+	// Normalizing runs for every dataset row and scanned job, so tokens are
+	// split in one pass rather than blanking punctuation first.
+	tokens := strings.FieldsFunc(lower, notCompanyNameChar)
 	for len(tokens) > 0 {
 		last := tokens[len(tokens)-1]
 		if _, ok := companyLegalSuffixes[last]; !ok {
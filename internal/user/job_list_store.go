@@ -1,23 +1,76 @@
 package user
 
 import (
+	"fmt"
+	"maps"
 	"slices"
+	"strings"
 )
 
+// userListStore describes one journaled, user-scoped list store so loading,
+// saving and entry normalization are implemented once for all of them.
+type userListStore struct {
+	pathEnv     string
+	defaultPath string
+	listKey     string
+	normalize   func(any) (map[string]any, bool)
+}
+
+var (
+	savedJobsStore = userListStore{
+		pathEnv: "VISA_SAVED_JOBS_PATH", defaultPath: defaultSavedJobsPath,
+		listKey: "jobs", normalize: normalizeSavedJob,
+	}
+	ignoredJobsStore = userListStore{
+		pathEnv: "VISA_IGNORED_JOBS_PATH", defaultPath: defaultIgnoredJobsPath,
+		listKey: "jobs", normalize: normalizeIgnoredJob,
+	}
+	memoryLinesStore = userListStore{
+		pathEnv: "VISA_USER_BLOB_PATH", defaultPath: defaultUserBlobPath,
+		listKey: "lines", normalize: normalizeMemoryLine,
+	}
+)
+
+func (s userListStore) path() string {
+	return envOrDefault(s.pathEnv, s.defaultPath)
+}
+
+func (s userListStore) load() map[string]any {
+	return loadJournaledStore(s.path())
+}
+
+// loadUser loads only userID's entry. The result must not be saved back as a
+// whole store; changes to the entry are persisted through the journal.
+func (s userListStore) loadUser(userID string) map[string]any {
+	return loadJournaledUserStore(s.path(), userID)
+}
+
+func (s userListStore) save(data map[string]any) error {
+	return saveJournaledStore(s.path(), data)
+}
+
+func (s userListStore) ensure(data map[string]any, userID string) map[string]any {
+	return ensureUserListEntry(data, userID, s.listKey, s.normalize)
+}
+
+func (s userListStore) get(data map[string]any, userID string) map[string]any {
+	return getUserListEntry(data, userID, s.listKey, s.normalize)
+}
+
 func loadSavedJobs() map[string]any {
-	return loadJSONMap(savedJobsPath(), map[string]any{"users": map[string]any{}})
+	return savedJobsStore.load()
 }
 
 func saveSavedJobs(data map[string]any) error {
-	return saveJSONMap(savedJobsPath(), data)
+	return savedJobsStore.save(data)
 }
 
 func loadIgnoredJobs() map[string]any {
-	return loadJSONMap(ignoredJobsPath(), map[string]any{"users": map[string]any{}})
+	return ignoredJobsStore.load()
 }
 
 func saveIgnoredJobs(data map[string]any) error {
-	return saveJSONMap(ignoredJobsPath(), data)
+	return ignoredJobsStore.save(data)
 }
 
 func loadIgnoredCompanies() map[string]any {
@@ -28,81 +81,67 @@ func saveIgnoredCompanies(data map[string]any) error {
 	return saveJSONMap(ignoredCompaniesPath(), data)
 }
 
-func normalizeSavedJob(raw any) (map[string]any, bool) {
+// Trimmed string fields copied as-is by the list row normalizers.
+var (
+	savedJobStringFields = []string{
+		"job_url", "title", "company", "location", "site", "description",
+		"description_excerpt", "salary_text", "salary_currency", "salary_interval",
+		"salary_source", "job_type", "job_level", "company_industry", "job_function",
+		"job_url_direct", "note", "source_session_id", "saved_at_utc", "updated_at_utc",
+	}
+	ignoredJobStringFields     = []string{"job_url", "reason", "source", "ignored_at_utc", "updated_at_utc"}
+	ignoredCompanyStringFields = []string{"reason", "source", "ignored_at_utc", "updated_at_utc"}
+	memoryLineStringFields     = []string{"text", "kind", "source", "created_at_utc"}
+)
+
+// newNormalizedRow starts a normalized list row: it validates the id and
+// copies the trimmed string fields in one pass over the field table, leaving
+// room for extra typed fields.
+func newNormalizedRow(raw any, stringFields []string, extra int) (map[string]any, map[string]any, bool) {
 	item := mapOrNil(raw)
 	if item == nil {
-		return nil, false
+		return nil, nil, false
 	}
 	id, ok := intFromAny(item["id"])
 	if !ok || id < 1 {
+		return nil, nil, false
+	}
+	row := make(map[string]any, len(stringFields)+extra+1)
+	row["id"] = id
+	for _, field := range stringFields {
+		row[field] = getString(item, field)
+	}
+	return item, row, true
+}
+
+func normalizeSavedJob(raw any) (map[string]any, bool) {
+	item, row, ok := newNormalizedRow(raw, savedJobStringFields, 3)
+	if !ok {
 		return nil, false
 	}
-	salaryMin := any(nil)
+	row["salary_min_amount"] = nil
 	if value, ok := intFromAny(item["salary_min_amount"]); ok {
-		salaryMin = value
+		row["salary_min_amount"] = value
 	}
-	salaryMax := any(nil)
+	row["salary_max_amount"] = nil
 	if value, ok := intFromAny(item["salary_max_amount"]); ok {
-		salaryMax = value
+		row["salary_max_amount"] = value
 	}
-	isRemote := any(nil)
+	row["is_remote"] = nil
 	if value, ok := boolFromAny(item["is_remote"]); ok {
-		isRemote = value
+		row["is_remote"] = value
 	}
-	return map[string]any{
-		"id":                  id,
-		"job_url":             getString(item, "job_url"),
-		"title":               getString(item, "title"),
-		"company":             getString(item, "company"),
-		"location":            getString(item, "location"),
-		"site":                getString(item, "site"),
-		"description":         getString(item, "description"),
-		"description_excerpt": getString(item, "description_excerpt"),
-		"salary_text":         getString(item, "salary_text"),
-		"salary_currency":     getString(item, "salary_currency"),
-		"salary_interval":     getString(item, "salary_interval"),
-		"salary_min_amount":   salaryMin,
-		"salary_max_amount":   salaryMax,
-		"salary_source":       getString(item, "salary_source"),
-		"job_type":            getString(item, "job_type"),
-		"job_level":           getString(item, "job_level"),
-		"company_industry":    getString(item, "company_industry"),
-		"job_function":        getString(item, "job_function"),
-		"job_url_direct":      getString(item, "job_url_direct"),
-		"is_remote":           isRemote,
-		"note":                getString(item, "note"),
-		"source_session_id":   getString(item, "source_session_id"),
-		"saved_at_utc":        getString(item, "saved_at_utc"),
-		"updated_at_utc":      getString(item, "updated_at_utc"),
-	}, true
+	return row, true
 }
 
 func normalizeIgnoredJob(raw any) (map[string]any, bool) {
-	item := mapOrNil(raw)
-	if item == nil {
-		return nil, false
-	}
-	id, ok := intFromAny(item["id"])
-	if !ok || id < 1 {
-		return nil, false
-	}
-	return map[string]any{
-		"id":             id,
-		"job_url":        getString(item, "job_url"),
-		"reason":         getString(item, "reason"),
-		"source":         getString(item, "source"),
-		"ignored_at_utc": getString(item, "ignored_at_utc"),
-		"updated_at_utc": getString(item, "updated_at_utc"),
-	}, true
+	_, row, ok := newNormalizedRow(raw, ignoredJobStringFields, 0)
+	return row, ok
 }
 
 func normalizeIgnoredCompany(raw any) (map[string]any, bool) {
-	item := mapOrNil(raw)
-	if item == nil {
-		return nil, false
-	}
-	id, ok := intFromAny(item["id"])
-	if !ok || id < 1 {
+	item, row, ok := newNormalizedRow(raw, ignoredCompanyStringFields, 2)
+	if !ok {
 		return nil, false
 	}
 	companyName := getString(item, "company_name")
@@ -113,31 +152,257 @@ func normalizeIgnoredCompany(raw any) (map[string]any, bool) {
 	if normalizedCompany == "" {
 		return nil, false
 	}
-	return map[string]any{
-		"id":                 id,
-		"company_name":       companyName,
-		"normalized_company": normalizedCompany,
-		"reason":             getString(item, "reason"),
-		"source":             getString(item, "source"),
-		"ignored_at_utc":     getString(item, "ignored_at_utc"),
-		"updated_at_utc":     getString(item, "updated_at_utc"),
-	}, true
-}
-
-func normalizeSorted(list []any, normalizer func(any) (map[string]any, bool)) []map[string]any {
-	out := make([]map[string]any, 0, len(list))
-	for _, raw := range list {
-		normalized, ok := normalizer(raw)
-		if ok {
-			out = append(out, normalized)
+	row["company_name"] = companyName
+	row["normalized_company"] = normalizedCompany
+	return row, true
+}
+
+// normalizedRowsKey records how many leading rows of a stored list were
+// already normalized and sorted by id when the entry was last written, so
+// reads only normalize rows appended since (for example via the journal).
+// The count is only trusted when normalizedVersionKey matches
+// listRowSchemaVersion; bump the version whenever a row normalizer changes
+// shape so every stored row is normalized again.
+const (
+	normalizedRowsKey    = "normalized_rows"
+	normalizedVersionKey = "normalized_version"
+	listRowSchemaVersion = 2
+)
+
+func normalizeEntryList(
+	entry map[string]any,
+	key string,
+	normalizer func(any) (map[string]any, bool),
+) (rows []map[string]any, maxID int) {
+	trusted := 0
+	if version, _ := intFromAny(entry[normalizedVersionKey]); version == listRowSchemaVersion {
+		trusted, _ = intFromAny(entry[normalizedRowsKey])
+	}
+	if rows, ok := entry[key].([]map[string]any); ok && trusted == len(rows) {
+		// Already normalized by an earlier call on this in-memory entry.
+		if len(rows) > 0 {
+			maxID, _ = intFromAny(rows[len(rows)-1]["id"])
+		}
+		return rows, maxID
+	}
+	raw := listOrEmpty(entry[key])
+	out := make([]map[string]any, 0, len(raw))
+	sorted := true
+	for idx, item := range raw {
+		row := map[string]any(nil)
+		if idx < trusted {
+			row = mapOrNil(item)
+		}
+		if row == nil {
+			normalized, ok := normalizer(item)
+			if !ok {
+				continue
+			}
+			row = normalized
+		}
+		id, _ := intFromAny(row["id"])
+		if id < maxID {
+			sorted = false
+		} else {
+			maxID = id
+		}
+		out = append(out, row)
+	}
+	if !sorted {
+		slices.SortFunc(out, func(a, b map[string]any) int {
+			ai, _ := intFromAny(a["id"])
+			bi, _ := intFromAny(b["id"])
+			return ai - bi
+		})
+	}
+	entry[key] = out
+	entry[normalizedRowsKey] = len(out)
+	entry[normalizedVersionKey] = listRowSchemaVersion
+	return out, maxID
+}
+
+// removeEntryRowByID removes the row with the given id from entry[key], a
+// list kept sorted by normalizeEntryList, locating it by binary search
+// instead of a scan. It returns the removed row, or nil when no row has that
+// id.
+func removeEntryRowByID(entry map[string]any, key string, id int) map[string]any {
+	rows, _ := entry[key].([]map[string]any)
+	idx, found := slices.BinarySearchFunc(rows, id, func(row map[string]any, target int) int {
+		rowID, _ := intFromAny(row["id"])
+		return rowID - target
+	})
+	if !found {
+		return nil
+	}
+	removed := rows[idx]
+	entry[key] = slices.Delete(rows, idx, idx+1)
+	if trusted, _ := intFromAny(entry[normalizedRowsKey]); idx < trusted {
+		entry[normalizedRowsKey] = trusted - 1
+	}
+	return removed
+}
+
+// newestFirstPage returns one page of rows, a list kept in ascending id order
+// by normalizeEntryList, newest first, by walking the matching window from
+// the tail instead of sorting the whole list. offset is clamped to len(rows).
+func newestFirstPage(rows []map[string]any, offset, limit int) ([]any, int) {
+	offset = min(offset, len(rows))
+	end := min(offset+limit, len(rows))
+	page := make([]any, 0, end-offset)
+	for idx := len(rows) - 1 - offset; idx >= len(rows)-end; idx-- {
+		page = append(page, rows[idx])
+	}
+	return page, offset
+}
+
+// indexRowsByURL maps each row's lowercased job_url to the first row holding
+// it, for callers matching many URLs against one list.
+func indexRowsByURL(rows []map[string]any) map[string]map[string]any {
+	index := make(map[string]map[string]any, len(rows))
+	for _, row := range rows {
+		// Normalized rows already hold trimmed strings.
+		if url, _ := row["job_url"].(string); url != "" {
+			key := strings.ToLower(url)
+			if _, ok := index[key]; !ok {
+				index[key] = row
+			}
+		}
+	}
+	return index
+}
+
+// findRowByURL returns the first row whose job_url matches url
+// case-insensitively, looked up in byURL when it is set and scanned otherwise.
+func findRowByURL(rows []map[string]any, byURL map[string]map[string]any, url string) map[string]any {
+	if byURL != nil {
+		return byURL[strings.ToLower(url)]
+	}
+	for _, row := range rows {
+		// Normalized rows already hold trimmed strings.
+		if stored, _ := row["job_url"].(string); strings.EqualFold(stored, url) {
+			return row
 		}
 	}
-	slices.SortFunc(out, func(a, b map[string]any) int {
-		ai, _ := intFromAny(a["id"])
-		bi, _ := intFromAny(b["id"])
-		return ai - bi
+	return nil
+}
+
+// jobListUpsertResult builds the response shared by save_job_for_later and
+// ignore_job: the upserted row under itemKey, the list total under totalKey
+// and where the job landed in the pipeline.
+func jobListUpsertResult(
+	userID, action, itemKey string,
+	item, resolved map[string]any,
+	totalKey string,
+	total, jobID int,
+	application map[string]any,
+	path string,
+) map[string]any {
+	return map[string]any{
+		"user_id":            userID,
+		"action":             action,
+		itemKey:              item,
+		"resolved_result_id": getString(resolved, "result_id"),
+		totalKey:             total,
+		"job_management": map[string]any{
+			"job_id":      jobID,
+			"stage":       getString(application, "stage"),
+			"job_db_path": jobDBPath(),
+		},
+		"path": path,
+	}
+}
+
+// maxBulkJobs caps how many jobs one save_jobs_bulk or ignore_jobs_bulk call
+// may carry.
+const maxBulkJobs = 200
+
+// bulkJobItems returns the jobs array of a bulk tool call.
+func bulkJobItems(args map[string]any) ([]any, error) {
+	items := listOrEmpty(args["jobs"])
+	if len(items) == 0 {
+		return nil, errRequired("jobs")
+	}
+	if len(items) > maxBulkJobs {
+		return nil, fmt.Errorf("jobs accepts at most %d entries per call", maxBulkJobs)
+	}
+	return items, nil
+}
+
+// upsertJobListBatch drives save_jobs_bulk and ignore_jobs_bulk: it resolves
+// each item, upserts it into the user's entry of the list store and stages it
+// in the pipeline, then writes each store once for the whole batch. The list
+// store is rewritten under its journal's lock, so appends from other users'
+// tool calls are not lost with the journal. An item that cannot be resolved
+// or staged is reported under failed, its row change is undone, and the rest
+// of the batch goes on.
+func upsertJobListBatch(
+	store userListStore,
+	userID string,
+	items []any,
+	itemKey string,
+	upsert func(entry map[string]any, byURL map[string]map[string]any, item, resolved map[string]any) (map[string]any, string),
+	stage func(pipelineEntry map[string]any, item, resolved, row map[string]any) (int, map[string]any, error),
+) (applied, failed []map[string]any, total int, err error) {
+	pipeline := loadJobPipeline()
+	pipelineEntry := ensurePipelineEntry(pipeline, userID)
+	applied = make([]map[string]any, 0, len(items))
+	failed = []map[string]any{}
+	err = updateJournaledStore(store.path(), func(data map[string]any) (bool, error) {
+		entry := store.ensure(data, userID)
+		byURL := indexRowsByURL(entry[store.listKey].([]map[string]any))
+		for idx, raw := range items {
+			item := mapOrNil(raw)
+			if item == nil {
+				failed = append(failed, map[string]any{"index": idx, "error": "each job must be an object"})
+				continue
+			}
+			resolved, err := resolveJobReference(item, userID)
+			if err != nil {
+				failed = append(failed, map[string]any{"index": idx, "error": err.Error()})
+				continue
+			}
+			urlKey := strings.ToLower(getString(resolved, "job_url"))
+			existing := byURL[urlKey]
+			previous := maps.Clone(existing)
+			row, action := upsert(entry, byURL, item, resolved)
+			jobID, application, err := stage(pipelineEntry, item, resolved, row)
+			if err != nil {
+				// Keep a job the pipeline rejects out of the list, as the
+				// single-job tools do: restore the row it updated or drop the
+				// row it appended. The stock stage steps only reject inputs
+				// resolveJobReference has already refused, so this guards
+				// callers whose stage step can fail on its own.
+				if existing != nil {
+					clear(existing)
+					maps.Copy(existing, previous)
+				} else {
+					removeEntryRowByID(entry, store.listKey, intOrZero(row["id"]))
+					delete(byURL, urlKey)
+				}
+				failed = append(failed, map[string]any{"index": idx, "error": err.Error()})
+				continue
+			}
+			applied = append(applied, map[string]any{
+				"index":              idx,
+				"action":             action,
+				itemKey:              row,
+				"resolved_result_id": getString(resolved, "result_id"),
+				"job_id":             jobID,
+				"stage":              getString(application, "stage"),
+			})
+		}
+		total = len(entry[store.listKey].([]map[string]any))
+		return len(applied) > 0, nil
 	})
-	return out
+	if err != nil {
+		return nil, nil, 0, err
+	}
+	if len(applied) > 0 {
+		if err := saveJobPipeline(pipeline); err != nil {
+			return nil, nil, 0, err
+		}
+	}
+	return applied, failed, total, nil
 }
 
 func ensureUserListEntry(
@@ -153,14 +418,7 @@ func ensureUserListEntry(
 		users[userID] = entry
 	}
 
-	list := normalizeSorted(listOrEmpty(entry[key]), normalizer)
-	entry[key] = list
-	maxID := 0
-	for _, row := range list {
-		if id, ok := intFromAny(row["id"]); ok && id > maxID {
-			maxID = id
-		}
-	}
+	_, maxID := normalizeEntryList(entry, key, normalizer)
 	nextID, ok := intFromAny(entry["next_id"])
 	if !ok || nextID < 1 {
 		nextID = 1
@@ -183,6 +441,6 @@ func getUserListEntry(
 	if entry == nil {
 		return nil
 	}
-	entry[key] = normalizeSorted(listOrEmpty(entry[key]), normalizer)
+	normalizeEntryList(entry, key, normalizer)
 	return entry
 }
@@ -2,6 +2,7 @@ package user
 
 import (
 	"fmt"
+	"maps"
 	"strings"
 )
 
@@ -12,21 +13,25 @@ func upsertJob(entry map[string]any, userID string, resolved map[string]any, tit
 	}
 	now := utcNowISO()
 	resultID := getString(resolved, "result_id")
+	title = strings.TrimSpace(title)
+	company = strings.TrimSpace(company)
+	location = strings.TrimSpace(location)
+	site = strings.TrimSpace(site)
 	if existing := getJobByURL(entry, cleanURL); existing != nil {
-		if strings.TrimSpace(title) != "" {
-			existing["title"] = strings.TrimSpace(title)
+		if title != "" {
+			existing["title"] = title
 		}
-		if strings.TrimSpace(company) != "" {
-			existing["company"] = strings.TrimSpace(company)
+		if company != "" {
+			existing["company"] = company
 		}
-		if strings.TrimSpace(location) != "" {
-			existing["location"] = strings.TrimSpace(location)
+		if location != "" {
+			existing["location"] = location
 		}
-		if strings.TrimSpace(site) != "" {
-			existing["site"] = strings.TrimSpace(site)
+		if site != "" {
+			existing["site"] = site
 		}
-		if strings.TrimSpace(resultID) != "" {
-			existing["result_id"] = strings.TrimSpace(resultID)
+		if resultID != "" {
+			existing["result_id"] = resultID
 		}
 		existing["updated_at_utc"] = now
 		id, _ := intFromAny(existing["id"])
@@ -37,12 +42,12 @@ func upsertJob(entry map[string]any, userID string, resolved map[string]any, tit
 	job := map[string]any{
 		"id":             nextID,
 		"user_id":        userID,
-		"result_id":      strings.TrimSpace(resultID),
+		"result_id":      resultID,
 		"job_url":        cleanURL,
-		"title":          strings.TrimSpace(title),
-		"company":        strings.TrimSpace(company),
-		"location":       strings.TrimSpace(location),
-		"site":           strings.TrimSpace(site),
+		"title":          title,
+		"company":        company,
+		"location":       location,
+		"site":           site,
 		"created_at_utc": now,
 		"updated_at_utc": now,
 	}
@@ -79,8 +84,51 @@ func setJobStage(
 	if jobID < 1 {
 		return nil, nil, fmt.Errorf("job_id must be a positive integer")
 	}
+	_, existing := findApplicationIndex(entry, jobID)
+	application, event := applyJobStage(entry, userID, jobID, existing, cleanStage, note, sourceSessionID, appliedAtUTC, reason)
+	return application, event, nil
+}
+
+// upsertJobAtStage upserts the job for resolved and moves it to stage in one
+// step. A job it has just created cannot have an application yet, so the
+// application scan setJobStage does is skipped for new jobs.
+func upsertJobAtStage(
+	entry map[string]any,
+	userID string,
+	resolved map[string]any,
+	title, company, location, site string,
+	stage, note, sourceSessionID, reason string,
+) (int, map[string]any, error) {
+	cleanStage, err := validateJobStage(stage)
+	if err != nil {
+		return 0, nil, err
+	}
+	jobCount := len(entry["jobs"].([]map[string]any))
+	jobID, _, err := upsertJob(entry, userID, resolved, title, company, location, site)
+	if err != nil {
+		return 0, nil, err
+	}
+	var existing map[string]any
+	if len(entry["jobs"].([]map[string]any)) == jobCount {
+		_, existing = findApplicationIndex(entry, jobID)
+	}
+	application, _ := applyJobStage(entry, userID, jobID, existing, cleanStage, note, sourceSessionID, "", reason)
+	return jobID, application, nil
+}
 
-	appIndex, existing := findApplicationIndex(entry, jobID)
+// applyJobStage records a move of jobID to the already validated cleanStage,
+// updating existing or creating the application when existing is nil.
+func applyJobStage(
+	entry map[string]any,
+	userID string,
+	jobID int,
+	existing map[string]any,
+	cleanStage string,
+	note string,
+	sourceSessionID string,
+	appliedAtUTC string,
+	reason string,
+) (map[string]any, map[string]any) {
 	var priorStage any = nil
 	priorNote := ""
 	priorAppliedAt := ""
@@ -138,10 +186,13 @@ func setJobStage(
 		existing["source_session_id"] = finalSource
 		existing["note"] = mergedNote
 		existing["updated_at_utc"] = now
-		entry["applications"].([]map[string]any)[appIndex] = existing
 		application = existing
 	}
 
+	eventReason := strings.TrimSpace(reason)
+	if eventReason == "" {
+		eventReason = "stage_update"
+	}
 	nextEventID, _ := intFromAny(entry["next_event_id"])
 	event := map[string]any{
 		"id":             nextEventID,
@@ -149,16 +200,13 @@ func setJobStage(
 		"job_id":         jobID,
 		"from_stage":     priorStage,
 		"to_stage":       cleanStage,
-		"reason":         strings.TrimSpace(reason),
+		"reason":         eventReason,
 		"note":           newNote,
 		"created_at_utc": now,
 	}
-	if getString(event, "reason") == "" {
-		event["reason"] = "stage_update"
-	}
 	entry["events"] = append(entry["events"].([]map[string]any), event)
 	entry["next_event_id"] = nextEventID + 1
-	return application, event, nil
+	return application, event
 }
 
 func appendJobNote(entry map[string]any, userID string, jobID int, note string) (map[string]any, map[string]any, error) {
@@ -166,20 +214,18 @@ func appendJobNote(entry map[string]any, userID string, jobID int, note string)
 	if cleanNote == "" {
 		return nil, nil, fmt.Errorf("note is required")
 	}
-	appIndex, existing := findApplicationIndex(entry, jobID)
-	currentStage := "new"
-	existingNote := ""
+	_, existing := findApplicationIndex(entry, jobID)
 	if existing == nil {
-		_, _, err := setJobStage(entry, userID, jobID, "new", "", "", "", "initialize_application")
+		// setJobStage hands back the application it created, so there is no
+		// need to look it up again.
+		created, _, err := setJobStage(entry, userID, jobID, "new", "", "", "", "initialize_application")
 		if err != nil {
 			return nil, nil, err
 		}
-		appIndex, existing = findApplicationIndex(entry, jobID)
-	}
-	if existing != nil {
-		currentStage = getString(existing, "stage")
-		existingNote = getString(existing, "note")
+		existing = created
 	}
+	currentStage := getString(existing, "stage")
+	existingNote := getString(existing, "note")
 	mergedNote := cleanNote
 	if existingNote != "" {
 		mergedNote = strings.TrimSpace(existingNote + "\n" + cleanNote)
@@ -187,7 +233,6 @@ func appendJobNote(entry map[string]any, userID string, jobID int, note string)
 	now := utcNowISO()
 	existing["note"] = mergedNote
 	existing["updated_at_utc"] = now
-	entry["applications"].([]map[string]any)[appIndex] = existing
 
 	nextEventID, _ := intFromAny(entry["next_event_id"])
 	event := map[string]any{
@@ -205,48 +250,22 @@ func appendJobNote(entry map[string]any, userID string, jobID int, note string)
 	return existing, event, nil
 }
 
-func jobSnapshot(entry map[string]any, userID string, jobID int) (map[string]any, error) {
-	job := getJobByID(entry, jobID)
-	if job == nil {
-		return nil, fmt.Errorf("job record not found")
-	}
-	_, app := findApplicationIndex(entry, jobID)
+// jobSnapshot builds the tool response view from the job and application
+// records the caller already holds, so no second lookup is needed.
+func jobSnapshot(userID string, jobID int, job map[string]any, app map[string]any) map[string]any {
+	snapshot := make(map[string]any, 15)
+	snapshot["job_id"] = jobID
+	snapshot["user_id"] = userID
+	copyStoredStrings(snapshot, job, pipelineJobViewFields)
+	copyStoredStrings(snapshot, job, pipelineJobTimeFields)
 	if app == nil {
-		return map[string]any{
-			"job_id":               jobID,
-			"user_id":              userID,
-			"result_id":            getString(job, "result_id"),
-			"job_url":              getString(job, "job_url"),
-			"title":                getString(job, "title"),
-			"company":              getString(job, "company"),
-			"location":             getString(job, "location"),
-			"site":                 getString(job, "site"),
-			"created_at_utc":       getString(job, "created_at_utc"),
-			"updated_at_utc":       getString(job, "updated_at_utc"),
-			"stage":                "new",
-			"applied_at_utc":       "",
-			"source_session_id":    "",
-			"note":                 "",
-			"stage_updated_at_utc": nil,
-		}, nil
+		maps.Copy(snapshot, pipelineEmptyAppView)
+		snapshot["stage_updated_at_utc"] = nil
+		return snapshot
 	}
-	return map[string]any{
-		"job_id":               jobID,
-		"user_id":              userID,
-		"result_id":            getString(job, "result_id"),
-		"job_url":              getString(job, "job_url"),
-		"title":                getString(job, "title"),
-		"company":              getString(job, "company"),
-		"location":             getString(job, "location"),
-		"site":                 getString(job, "site"),
-		"created_at_utc":       getString(job, "created_at_utc"),
-		"updated_at_utc":       getString(job, "updated_at_utc"),
-		"stage":                getString(app, "stage"),
-		"applied_at_utc":       getString(app, "applied_at_utc"),
-		"source_session_id":    getString(app, "source_session_id"),
-		"note":                 getString(app, "note"),
-		"stage_updated_at_utc": app["updated_at_utc"],
-	}, nil
+	copyStoredStrings(snapshot, app, pipelineAppViewFields)
+	snapshot["stage_updated_at_utc"] = app["updated_at_utc"]
+	return snapshot
 }
 
 func resolveJobManagementTarget(entry map[string]any, args map[string]any, userID string) (int, map[string]any, error) {
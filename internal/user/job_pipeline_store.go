@@ -9,6 +9,12 @@ func loadJobPipeline() map[string]any {
 	return loadJSONMap(jobDBPath(), map[string]any{"users": map[string]any{}})
 }
 
+// loadJobPipelineUser loads only userID's pipeline entry, for tools that read
+// one user's jobs and never save the result.
+func loadJobPipelineUser(userID string) map[string]any {
+	return loadJSONUserSubtree(jobDBPath(), userID)
+}
+
 func saveJobPipeline(data map[string]any) error {
 	return saveJSONMap(jobDBPath(), data)
 }
@@ -142,6 +148,51 @@ func normalizePipelineEvents(list []any, userID string) []map[string]any {
 	return out
 }
 
+// pipelineSchemaVersion is stored under normalizedVersionKey on a pipeline
+// entry whose jobs, applications and events were normalized and sorted by id
+// when it was last written. Every pipeline write goes through
+// ensurePipelineEntry and appends rows already in normalized shape, so loads
+// of a marked entry skip re-normalizing every row. Bump it whenever a
+// pipeline row normalizer changes shape.
+const pipelineSchemaVersion = 1
+
+func normalizePipelineEntry(entry map[string]any, userID string) {
+	if version, _ := intFromAny(entry[normalizedVersionKey]); version == pipelineSchemaVersion {
+		entry["jobs"] = trustedPipelineRows(entry["jobs"])
+		entry["applications"] = trustedPipelineRows(entry["applications"])
+		events := trustedPipelineRows(entry["events"])
+		for _, event := range events {
+			// A first stage change is recorded with a nil from_stage, which
+			// reads have always reported as an empty string.
+			if event["from_stage"] == nil {
+				event["from_stage"] = ""
+			}
+		}
+		entry["events"] = events
+		return
+	}
+	entry["jobs"] = normalizePipelineJobs(listOrEmpty(entry["jobs"]), userID)
+	entry["applications"] = normalizePipelineApplications(listOrEmpty(entry["applications"]), userID)
+	entry["events"] = normalizePipelineEvents(listOrEmpty(entry["events"]), userID)
+	entry[normalizedVersionKey] = pipelineSchemaVersion
+}
+
+// trustedPipelineRows types an already normalized stored list without
+// rebuilding its rows.
+func trustedPipelineRows(value any) []map[string]any {
+	if rows, ok := value.([]map[string]any); ok {
+		return rows
+	}
+	raw := listOrEmpty(value)
+	rows := make([]map[string]any, 0, len(raw))
+	for _, item := range raw {
+		if row := mapOrNil(item); row != nil {
+			rows = append(rows, row)
+		}
+	}
+	return rows
+}
+
 func ensurePipelineEntry(data map[string]any, userID string) map[string]any {
 	users := ensureUsersMap(data)
 	entry := mapOrNil(users[userID])
@@ -150,12 +201,10 @@ func ensurePipelineEntry(data map[string]any, userID string) map[string]any {
 		users[userID] = entry
 	}
 
-	jobs := normalizePipelineJobs(listOrEmpty(entry["jobs"]), userID)
-	apps := normalizePipelineApplications(listOrEmpty(entry["applications"]), userID)
-	events := normalizePipelineEvents(listOrEmpty(entry["events"]), userID)
-	entry["jobs"] = jobs
-	entry["applications"] = apps
-	entry["events"] = events
+	normalizePipelineEntry(entry, userID)
+	jobs := entry["jobs"].([]map[string]any)
+	apps := entry["applications"].([]map[string]any)
+	events := entry["events"].([]map[string]any)
 
 	maxJobID := 0
 	for _, row := range jobs {
@@ -211,9 +260,7 @@ func getPipelineEntry(data map[string]any, userID string) map[string]any {
 	if entry == nil {
 		return nil
 	}
-	entry["jobs"] = normalizePipelineJobs(listOrEmpty(entry["jobs"]), userID)
-	entry["applications"] = normalizePipelineApplications(listOrEmpty(entry["applications"]), userID)
-	entry["events"] = normalizePipelineEvents(listOrEmpty(entry["events"]), userID)
+	normalizePipelineEntry(entry, userID)
 	return entry
 }
 
@@ -227,12 +274,43 @@ func getJobByID(entry map[string]any, jobID int) map[string]any {
 	return nil
 }
 
-func getJobByURL(entry map[string]any, jobURL string) map[string]any {
-	clean := strings.ToLower(strings.TrimSpace(jobURL))
-	for _, row := range entry["jobs"].([]map[string]any) {
-		if strings.ToLower(getString(row, "job_url")) == clean {
-			return row
+// indexJobsByID maps job id to job row so listings that join applications or
+// events back to their job do one lookup per row instead of a list scan.
+func indexJobsByID(entry map[string]any) map[int]map[string]any {
+	jobs := entry["jobs"].([]map[string]any)
+	out := make(map[int]map[string]any, len(jobs))
+	for _, row := range jobs {
+		if id, ok := intFromAny(row["id"]); ok {
+			out[id] = row
 		}
 	}
-	return nil
+	return out
+}
+
+// Fields copied into pipeline tool responses. Normalized pipeline rows hold
+// trimmed strings for all of them, so views copy them as stored instead of
+// re-trimming each field of each row through getString.
+var (
+	pipelineJobViewFields  = []string{"result_id", "job_url", "title", "company", "location", "site"}
+	pipelineEventJobFields = []string{"result_id", "job_url", "title", "company"}
+	pipelineJobTimeFields  = []string{"created_at_utc", "updated_at_utc"}
+	pipelineAppViewFields  = []string{"stage", "applied_at_utc", "source_session_id", "note"}
+	pipelineEmptyAppView   = map[string]any{"stage": "new", "applied_at_utc": "", "source_session_id": "", "note": ""}
+)
+
+func copyStoredStrings(dst, src map[string]any, fields []string) {
+	for _, field := range fields {
+		value, _ := src[field].(string)
+		dst[field] = value
+	}
+}
+
+// getJobByURL matches job URLs case-insensitively. EqualFold compares in
+// place, so the probe no longer lowercases a copy of every stored URL.
+func getJobByURL(entry map[string]any, jobURL string) map[string]any {
+	clean := strings.TrimSpace(jobURL)
+	if clean == "" {
+		return nil
+	}
+	return findRowByURL(entry["jobs"].([]map[string]any), nil, clean)
 }
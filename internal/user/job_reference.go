@@ -2,6 +2,7 @@ package user
 
 import (
 	"fmt"
+	"strconv"
 	"strings"
 )
 
@@ -53,9 +54,8 @@ func resolveJobReference(args map[string]any, userID string) (map[string]any, er
 		return nil, fmt.Errorf("session_id is required when using result_id without a session prefix")
 	}
 
-	store := loadSearchSessions()
-	sessions := mapOrNil(store["sessions"])
-	record := mapOrNil(sessions[sessionID])
+	// Only this session is decoded.
+	record := mapOrNil(mapOrNil(loadJSONSubtree(searchSessionsPath(), "sessions", sessionID)["sessions"])[sessionID])
 	if record == nil {
 		return nil, fmt.Errorf("unknown session_id '%s'", sessionID)
 	}
@@ -64,68 +64,9 @@ func resolveJobReference(args map[string]any, userID string) (map[string]any, er
 		return nil, fmt.Errorf("session_id does not belong to this user_id")
 	}
 
-	resultIndex := mapOrNil(record["result_id_index"])
-	if resultIndex == nil {
-		acceptedJobs := []map[string]any{}
-		for idx, raw := range listOrEmpty(record["accepted_jobs"]) {
-			item := mapOrNil(raw)
-			if item == nil {
-				continue
-			}
-			normalized := map[string]any{
-				"result_id":                getString(item, "result_id"),
-				"job_url":                  getString(item, "job_url"),
-				"title":                    getString(item, "title"),
-				"company":                  getString(item, "company"),
-				"location":                 getString(item, "location"),
-				"site":                     getString(item, "site"),
-				"description_fetched":      boolOrFalse(item["description_fetched"]),
-				"description":              getString(item, "description"),
-				"description_excerpt":      getString(item, "description_excerpt"),
-				"salary_text":              getString(item, "salary_text"),
-				"salary_currency":          getString(item, "salary_currency"),
-				"salary_interval":          getString(item, "salary_interval"),
-				"salary_min_amount":        item["salary_min_amount"],
-				"salary_max_amount":        item["salary_max_amount"],
-				"salary_source":            getString(item, "salary_source"),
-				"job_type":                 getString(item, "job_type"),
-				"job_level":                getString(item, "job_level"),
-				"company_industry":         getString(item, "company_industry"),
-				"job_function":             getString(item, "job_function"),
-				"job_url_direct":           getString(item, "job_url_direct"),
-				"is_remote":                item["is_remote"],
-				"employer_contacts":        listOrEmpty(item["employer_contacts"]),
-				"visa_counts":              asMap(item["visa_counts"]),
-				"visas_sponsored":          listOrEmpty(item["visas_sponsored"]),
-				"visa_match_strength":      getString(item, "visa_match_strength"),
-				"eligibility_reasons":      listOrEmpty(item["eligibility_reasons"]),
-				"confidence_score":         item["confidence_score"],
-				"confidence_model_version": item["confidence_model_version"],
-			}
-			if normalized["result_id"] == "" {
-				normalized["result_id"] = fmt.Sprintf("%s:%d", sessionID, idx+1)
-			}
-			acceptedJobs = append(acceptedJobs, normalized)
-		}
-		resultIndex = map[string]any{}
-		acceptedOut := make([]any, 0, len(acceptedJobs))
-		for _, row := range acceptedJobs {
-			rid := getString(row, "result_id")
-			if rid != "" {
-				resultIndex[rid] = row
-			}
-			acceptedOut = append(acceptedOut, row)
-		}
-		record["accepted_jobs"] = acceptedOut
-		record["result_id_index"] = resultIndex
-		sessions[sessionID] = record
-		store["sessions"] = sessions
-		_ = saveSearchSessions(store)
-	}
-
-	resolved := mapOrNil(resultIndex[resultID])
+	resolved := lookupSessionResult(record, sessionID, resultID)
 	if resolved == nil && !strings.Contains(resultID, ":") {
-		resolved = mapOrNil(resultIndex[sessionID+":"+resultID])
+		resolved = lookupSessionResult(record, sessionID, sessionID+":"+resultID)
 	}
 	if resolved == nil {
 		return nil, fmt.Errorf("unknown result_id for this session. Pass a result_id returned by get_visa_job_search_results")
@@ -134,7 +75,80 @@ func resolveJobReference(args map[string]any, userID string) (map[string]any, er
 		return nil, fmt.Errorf("resolved result_id does not have a job_url. Save/ignore requires a job URL")
 	}
 
-	out := cloneOrEmptyMap(resolved)
-	out["source_session_id"] = sessionID
-	return out, nil
+	// resolved belongs to this call's private copy of the session.
+	resolved["source_session_id"] = sessionID
+	return resolved, nil
+}
+
+// lookupSessionResult returns the resolved job for resultID in a session.
+// Sessions written by older versions carry a result_id_index; newer ones only
+// store accepted_jobs. Result ids are "<session_id>:<position>", so the job at
+// that position is checked first and the list is only scanned when it does
+// not match; either way only the match is normalized.
+func lookupSessionResult(record map[string]any, sessionID, resultID string) map[string]any {
+	if index := mapOrNil(record["result_id_index"]); index != nil {
+		return mapOrNil(index[resultID])
+	}
+	jobs := listOrEmpty(record["accepted_jobs"])
+	if position, ok := strings.CutPrefix(resultID, sessionID+":"); ok {
+		if idx, err := strconv.Atoi(position); err == nil && idx >= 1 && idx <= len(jobs) {
+			if item := mapOrNil(jobs[idx-1]); item != nil && sessionResultID(item, sessionID, idx-1) == resultID {
+				return sessionResultRow(item, resultID)
+			}
+		}
+	}
+	for idx, raw := range jobs {
+		item := mapOrNil(raw)
+		if item == nil {
+			continue
+		}
+		if rid := sessionResultID(item, sessionID, idx); rid == resultID {
+			return sessionResultRow(item, rid)
+		}
+	}
+	return nil
+}
+
+// sessionResultID returns the result id of the accepted job at idx, deriving
+// it from the position when the job was stored without one.
+func sessionResultID(job map[string]any, sessionID string, idx int) string {
+	if rid := getString(job, "result_id"); rid != "" {
+		return rid
+	}
+	return fmt.Sprintf("%s:%d", sessionID, idx+1)
+}
+
+// sessionResultRow copies the fields save, ignore and outreach tools read
+// from an accepted job.
+func sessionResultRow(job map[string]any, resultID string) map[string]any {
+	return map[string]any{
+		"result_id":                resultID,
+		"job_url":                  getString(job, "job_url"),
+		"title":                    getString(job, "title"),
+		"company":                  getString(job, "company"),
+		"location":                 getString(job, "location"),
+		"site":                     getString(job, "site"),
+		"description_fetched":      boolOrFalse(job["description_fetched"]),
+		"description":              getString(job, "description"),
+		"description_excerpt":      getString(job, "description_excerpt"),
+		"salary_text":              getString(job, "salary_text"),
+		"salary_currency":          getString(job, "salary_currency"),
+		"salary_interval":          getString(job, "salary_interval"),
+		"salary_min_amount":        job["salary_min_amount"],
+		"salary_max_amount":        job["salary_max_amount"],
+		"salary_source":            getString(job, "salary_source"),
+		"job_type":                 getString(job, "job_type"),
+		"job_level":                getString(job, "job_level"),
+		"company_industry":         getString(job, "company_industry"),
+		"job_function":             getString(job, "job_function"),
+		"job_url_direct":           getString(job, "job_url_direct"),
+		"is_remote":                job["is_remote"],
+		"employer_contacts":        listOrEmpty(job["employer_contacts"]),
+		"visa_counts":              asMap(job["visa_counts"]),
+		"visas_sponsored":          listOrEmpty(job["visas_sponsored"]),
+		"visa_match_strength":      getString(job, "visa_match_strength"),
+		"eligibility_reasons":      listOrEmpty(job["eligibility_reasons"]),
+		"confidence_score":         job["confidence_score"],
+		"confidence_model_version": job["confidence_model_version"],
+	}
 }
@@ -2,98 +2,151 @@ package user
 
 import (
 	"fmt"
-	"slices"
 	"strings"
 )
 
 func IgnoreJob(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	resolved, err := resolveJobReference(args, userID)
 	if err != nil {
 		return nil, err
 	}
-	cleanURL := getString(resolved, "job_url")
-	reason := getString(args, "reason")
-	source := getString(args, "source")
-	if source == "" {
-		source = getString(resolved, "source_session_id")
-	}
 	now := utcNowISO()
 
-	store := loadIgnoredJobs()
-	entry := ensureUserListEntry(store, userID, "jobs", normalizeIgnoredJob)
-	jobs := entry["jobs"].([]map[string]any)
-	action := "ignored_new"
-	var ignored map[string]any
-	for _, row := range jobs {
-		if !strings.EqualFold(getString(row, "job_url"), cleanURL) {
-			continue
-		}
-		if reason != "" {
-			row["reason"] = reason
-		}
-		if source != "" {
-			row["source"] = source
-		}
-		row["updated_at_utc"] = now
-		ignored = row
-		action = "updated_existing"
-		break
+	store := ignoredJobsStore.loadUser(userID)
+	entry := ignoredJobsStore.ensure(store, userID)
+	ignored, action := upsertIgnoredJob(entry, nil, args, resolved, now)
+	// Stage the job before writing either store, so a job the pipeline
+	// rejects is not left ignored.
+	pipeline := loadJobPipeline()
+	jobID, application, err := stageIgnoredJob(ensurePipelineEntry(pipeline, userID), userID, args, resolved, ignored, "ignore_job")
+	if err != nil {
+		return nil, err
 	}
-	if ignored == nil {
-		nextID, _ := intFromAny(entry["next_id"])
-		ignored = map[string]any{
-			"id":             nextID,
-			"job_url":        cleanURL,
-			"reason":         reason,
-			"source":         source,
-			"ignored_at_utc": now,
-			"updated_at_utc": now,
-		}
-		entry["jobs"] = append(jobs, ignored)
-		entry["next_id"] = nextID + 1
+	op := ""
+	if action == "updated_existing" {
+		op = storeJournalOpUpsert
+	}
+	if err := appendStoreJournal(ignoredJobsPath(), storeJournalRecord{
+		Op:           op,
+		UserID:       userID,
+		ListKey:      "jobs",
+		Item:         ignored,
+		NextID:       intOrZero(entry["next_id"]),
+		UpdatedAtUTC: now,
+	}); err != nil {
+		return nil, err
 	}
-	entry["updated_at_utc"] = now
-	if err := saveIgnoredJobs(store); err != nil {
+	if err := saveJobPipeline(pipeline); err != nil {
 		return nil, err
 	}
 
-	pipeline := loadJobPipeline()
-	pipelineEntry := ensurePipelineEntry(pipeline, userID)
-	jobID, _, err := upsertJob(pipelineEntry, userID, resolved, getString(args, "title"), getString(args, "company"), getString(args, "location"), getString(args, "site"))
+	return jobListUpsertResult(userID, action, "ignored_job", ignored, resolved,
+		"total_ignored_jobs", len(entry["jobs"].([]map[string]any)), jobID, application, ignoredJobsPath()), nil
+}
+
+// IgnoreJobsBulk ignores many jobs in one call: the ignored-jobs store and the
+// job pipeline are each loaded and written once for the whole batch instead
+// of once per job. A job that cannot be resolved or staged is reported under
+// failed and does not stop the rest of the batch.
+func IgnoreJobsBulk(args map[string]any) (map[string]any, error) {
+	userID, err := requireUserID(args)
 	if err != nil {
 		return nil, err
 	}
-	application, _, err := setJobStage(pipelineEntry, userID, jobID, "ignored", getString(ignored, "reason"), getString(ignored, "source"), "", "ignore_job")
+	items, err := bulkJobItems(args)
 	if err != nil {
 		return nil, err
 	}
-	if err := saveJobPipeline(pipeline); err != nil {
+	now := utcNowISO()
+	ignored, failed, total, err := upsertJobListBatch(ignoredJobsStore, userID, items, "ignored_job",
+		func(entry map[string]any, byURL map[string]map[string]any, item, resolved map[string]any) (map[string]any, string) {
+			return upsertIgnoredJob(entry, byURL, item, resolved, now)
+		},
+		func(pipelineEntry map[string]any, item, resolved, ignoredJob map[string]any) (int, map[string]any, error) {
+			return stageIgnoredJob(pipelineEntry, userID, item, resolved, ignoredJob, "ignore_jobs_bulk")
+		},
+	)
+	if err != nil {
 		return nil, err
 	}
 
 	return map[string]any{
 		"user_id":            userID,
-		"action":             action,
-		"ignored_job":        ignored,
-		"resolved_result_id": getString(resolved, "result_id"),
-		"total_ignored_jobs": len(entry["jobs"].([]map[string]any)),
-		"job_management": map[string]any{
-			"job_id":      jobID,
-			"stage":       getString(application, "stage"),
-			"job_db_path": jobDBPath(),
-		},
-		"path": ignoredJobsPath(),
+		"ignored":            ignored,
+		"failed":             failed,
+		"total_ignored_jobs": total,
+		"path":               ignoredJobsPath(),
+		"job_db_path":        jobDBPath(),
 	}, nil
 }
 
+// upsertIgnoredJob updates the ignored job with the resolved URL in entry, or
+// appends a new one, and reports which it did. byURL, when set, is an
+// indexRowsByURL index of entry's jobs used instead of a scan and kept in sync
+// with appended rows. The caller persists entry.
+func upsertIgnoredJob(entry map[string]any, byURL map[string]map[string]any, args, resolved map[string]any, now string) (map[string]any, string) {
+	cleanURL := getString(resolved, "job_url")
+	reason := getString(args, "reason")
+	source := getString(args, "source")
+	if source == "" {
+		source = getString(resolved, "source_session_id")
+	}
+
+	entry["updated_at_utc"] = now
+	jobs := entry["jobs"].([]map[string]any)
+	if ignored := findRowByURL(jobs, byURL, cleanURL); ignored != nil {
+		if reason != "" {
+			ignored["reason"] = reason
+		}
+		if source != "" {
+			ignored["source"] = source
+		}
+		ignored["updated_at_utc"] = now
+		return ignored, "updated_existing"
+	}
+	nextID, _ := intFromAny(entry["next_id"])
+	ignored := map[string]any{
+		"id":             nextID,
+		"job_url":        cleanURL,
+		"reason":         reason,
+		"source":         source,
+		"ignored_at_utc": now,
+		"updated_at_utc": now,
+	}
+	entry["jobs"] = append(jobs, ignored)
+	entry["next_id"] = nextID + 1
+	if byURL != nil {
+		byURL[strings.ToLower(cleanURL)] = ignored
+	}
+	return ignored, "ignored_new"
+}
+
+// stageIgnoredJob records ignored in the job pipeline at the ignored stage,
+// taking job details from args and attributing the event to source.
+func stageIgnoredJob(pipelineEntry map[string]any, userID string, args, resolved, ignored map[string]any, source string) (int, map[string]any, error) {
+	return upsertJobAtStage(
+		pipelineEntry,
+		userID,
+		resolved,
+		getString(args, "title"),
+		getString(args, "company"),
+		getString(args, "location"),
+		getString(args, "site"),
+		"ignored",
+		getString(ignored, "reason"),
+		getString(ignored, "source"),
+		source,
+	)
+}
+
 func ListIgnoredJobs(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	limit := 50
 	if parsed, has, err := getOptionalInt(args, "limit"); has {
@@ -118,8 +171,8 @@ func ListIgnoredJobs(args map[string]any) (map[string]any, error) {
 		}
 		offset = parsed
 	}
-	store := loadIgnoredJobs()
-	entry := getUserListEntry(store, userID, "jobs", normalizeIgnoredJob)
+	store := ignoredJobsStore.loadUser(userID)
+	entry := ignoredJobsStore.get(store, userID)
 	if entry == nil {
 		return map[string]any{
 			"user_id":            userID,
@@ -132,38 +185,22 @@ func ListIgnoredJobs(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 	jobs := entry["jobs"].([]map[string]any)
-	slices.SortFunc(jobs, func(a, b map[string]any) int {
-		ai, _ := intFromAny(a["id"])
-		bi, _ := intFromAny(b["id"])
-		return bi - ai
-	})
-	if offset > len(jobs) {
-		offset = len(jobs)
-	}
-	end := offset + limit
-	if end > len(jobs) {
-		end = len(jobs)
-	}
-	page := jobs[offset:end]
-	pageAny := make([]any, 0, len(page))
-	for _, row := range page {
-		pageAny = append(pageAny, row)
-	}
+	pageAny, offset := newestFirstPage(jobs, offset, limit)
 	return map[string]any{
 		"user_id":            userID,
 		"offset":             offset,
 		"limit":              limit,
 		"total_ignored_jobs": len(jobs),
-		"returned_jobs":      len(page),
+		"returned_jobs":      len(pageAny),
 		"jobs":               pageAny,
 		"path":               ignoredJobsPath(),
 	}, nil
 }
 
 func UnignoreJob(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	targetID, hasID, err := getOptionalInt(args, "ignored_job_id")
 	if !hasID {
@@ -175,8 +212,8 @@ func UnignoreJob(args map[string]any) (map[string]any, error) {
 	if targetID < 1 {
 		return nil, fmt.Errorf("ignored_job_id must be a positive integer")
 	}
-	store := loadIgnoredJobs()
-	entry := getUserListEntry(store, userID, "jobs", normalizeIgnoredJob)
+	store := ignoredJobsStore.loadUser(userID)
+	entry := ignoredJobsStore.get(store, userID)
 	if entry == nil {
 		return map[string]any{
 			"user_id":            userID,
@@ -188,16 +225,7 @@ func UnignoreJob(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 	jobs := entry["jobs"].([]map[string]any)
-	remaining := make([]map[string]any, 0, len(jobs))
-	var deleted map[string]any
-	for _, row := range jobs {
-		id, _ := intFromAny(row["id"])
-		if deleted == nil && id == targetID {
-			deleted = row
-			continue
-		}
-		remaining = append(remaining, row)
-	}
+	deleted := removeEntryRowByID(entry, "jobs", targetID)
 	if deleted == nil {
 		return map[string]any{
 			"user_id":            userID,
@@ -208,9 +236,17 @@ func UnignoreJob(args map[string]any) (map[string]any, error) {
 			"path":               ignoredJobsPath(),
 		}, nil
 	}
-	entry["jobs"] = remaining
-	entry["updated_at_utc"] = utcNowISO()
-	if err := saveIgnoredJobs(store); err != nil {
+	remaining := entry["jobs"].([]map[string]any)
+	now := utcNowISO()
+	entry["updated_at_utc"] = now
+	if err := appendStoreJournal(ignoredJobsPath(), storeJournalRecord{
+		Op:           storeJournalOpDelete,
+		UserID:       userID,
+		ListKey:      "jobs",
+		Item:         map[string]any{"id": targetID},
+		NextID:       intOrZero(entry["next_id"]),
+		UpdatedAtUTC: now,
+	}); err != nil {
 		return nil, err
 	}
 
@@ -236,9 +272,9 @@ func UnignoreJob(args map[string]any) (map[string]any, error) {
 }
 
 func IgnoreCompany(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 
 	companyName := getString(args, "company_name")
@@ -317,9 +353,9 @@ func IgnoreCompany(args map[string]any) (map[string]any, error) {
 }
 
 func ListIgnoredCompanies(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	limit := 50
 	if parsed, has, err := getOptionalInt(args, "limit"); has {
@@ -358,38 +394,22 @@ func ListIgnoredCompanies(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 	companies := entry["companies"].([]map[string]any)
-	slices.SortFunc(companies, func(a, b map[string]any) int {
-		ai, _ := intFromAny(a["id"])
-		bi, _ := intFromAny(b["id"])
-		return bi - ai
-	})
-	if offset > len(companies) {
-		offset = len(companies)
-	}
-	end := offset + limit
-	if end > len(companies) {
-		end = len(companies)
-	}
-	page := companies[offset:end]
-	pageAny := make([]any, 0, len(page))
-	for _, row := range page {
-		pageAny = append(pageAny, row)
-	}
+	pageAny, offset := newestFirstPage(companies, offset, limit)
 	return map[string]any{
 		"user_id":                 userID,
 		"offset":                  offset,
 		"limit":                   limit,
 		"total_ignored_companies": len(companies),
-		"returned_companies":      len(page),
+		"returned_companies":      len(pageAny),
 		"companies":               pageAny,
 		"path":                    ignoredCompaniesPath(),
 	}, nil
 }
 
 func UnignoreCompany(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	targetID, hasID, err := getOptionalInt(args, "ignored_company_id")
 	if !hasID {
@@ -414,16 +434,7 @@ func UnignoreCompany(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 	companies := entry["companies"].([]map[string]any)
-	remaining := make([]map[string]any, 0, len(companies))
-	var deleted map[string]any
-	for _, row := range companies {
-		id, _ := intFromAny(row["id"])
-		if deleted == nil && id == targetID {
-			deleted = row
-			continue
-		}
-		remaining = append(remaining, row)
-	}
+	deleted := removeEntryRowByID(entry, "companies", targetID)
 	if deleted == nil {
 		return map[string]any{
 			"user_id":                 userID,
@@ -434,7 +445,7 @@ func UnignoreCompany(args map[string]any) (map[string]any, error) {
 			"path":                    ignoredCompaniesPath(),
 		}, nil
 	}
-	entry["companies"] = remaining
+	remaining := entry["companies"].([]map[string]any)
 	entry["updated_at_utc"] = utcNowISO()
 	if err := saveIgnoredCompanies(store); err != nil {
 		return nil, err
@@ -7,13 +7,13 @@ import (
 )
 
 func MarkJobApplied(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	pipeline := loadJobPipeline()
 	entry := ensurePipelineEntry(pipeline, userID)
-	jobID, _, err := resolveJobManagementTarget(entry, args, userID)
+	jobID, job, err := resolveJobManagementTarget(entry, args, userID)
 	if err != nil {
 		return nil, err
 	}
@@ -39,10 +39,7 @@ func MarkJobApplied(args map[string]any) (map[string]any, error) {
 	if err := saveJobPipeline(pipeline); err != nil {
 		return nil, err
 	}
-	snapshot, err := jobSnapshot(entry, userID, jobID)
-	if err != nil {
-		return nil, err
-	}
+	snapshot := jobSnapshot(userID, jobID, job, application)
 	return map[string]any{
 		"user_id":     userID,
 		"job":         snapshot,
@@ -53,9 +50,9 @@ func MarkJobApplied(args map[string]any) (map[string]any, error) {
 }
 
 func UpdateJobStage(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	cleanStage, err := validateJobStage(getString(args, "stage"))
 	if err != nil {
@@ -63,7 +60,7 @@ func UpdateJobStage(args map[string]any) (map[string]any, error) {
 	}
 	pipeline := loadJobPipeline()
 	entry := ensurePipelineEntry(pipeline, userID)
-	jobID, _, err := resolveJobManagementTarget(entry, args, userID)
+	jobID, job, err := resolveJobManagementTarget(entry, args, userID)
 	if err != nil {
 		return nil, err
 	}
@@ -89,10 +86,7 @@ func UpdateJobStage(args map[string]any) (map[string]any, error) {
 	if err := saveJobPipeline(pipeline); err != nil {
 		return nil, err
 	}
-	snapshot, err := jobSnapshot(entry, userID, jobID)
-	if err != nil {
-		return nil, err
-	}
+	snapshot := jobSnapshot(userID, jobID, job, application)
 	return map[string]any{
 		"user_id":     userID,
 		"job":         snapshot,
@@ -103,9 +97,9 @@ func UpdateJobStage(args map[string]any) (map[string]any, error) {
 }
 
 func AddJobNote(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	note := getString(args, "note")
 	if note == "" {
@@ -113,7 +107,7 @@ func AddJobNote(args map[string]any) (map[string]any, error) {
 	}
 	pipeline := loadJobPipeline()
 	entry := ensurePipelineEntry(pipeline, userID)
-	jobID, _, err := resolveJobManagementTarget(entry, args, userID)
+	jobID, job, err := resolveJobManagementTarget(entry, args, userID)
 	if err != nil {
 		return nil, err
 	}
@@ -124,10 +118,7 @@ func AddJobNote(args map[string]any) (map[string]any, error) {
 	if err := saveJobPipeline(pipeline); err != nil {
 		return nil, err
 	}
-	snapshot, err := jobSnapshot(entry, userID, jobID)
-	if err != nil {
-		return nil, err
-	}
+	snapshot := jobSnapshot(userID, jobID, job, application)
 	return map[string]any{
 		"user_id":     userID,
 		"job":         snapshot,
@@ -138,9 +129,9 @@ func AddJobNote(args map[string]any) (map[string]any, error) {
 }
 
 func ListJobsByStage(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	stage, err := validateJobStage(getString(args, "stage"))
 	if err != nil {
@@ -170,7 +161,7 @@ func ListJobsByStage(args map[string]any) (map[string]any, error) {
 		offset = parsed
 	}
 
-	pipeline := loadJobPipeline()
+	pipeline := loadJobPipelineUser(userID)
 	entry := getPipelineEntry(pipeline, userID)
 	if entry == nil {
 		return map[string]any{
@@ -185,48 +176,28 @@ func ListJobsByStage(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 
-	jobs := entry["jobs"].([]map[string]any)
-	filtered := []map[string]any{}
+	// Sort and count the matching applications, then build rows for the
+	// requested page only.
+	jobsByID := indexJobsByID(entry)
+	matched := []map[string]any{}
 	for _, app := range entry["applications"].([]map[string]any) {
-		if getString(app, "stage") != stage {
-			continue
-		}
 		jobID, _ := intFromAny(app["job_id"])
-		job := getJobByID(entry, jobID)
-		if job == nil {
-			continue
+		if getString(app, "stage") == stage && jobsByID[jobID] != nil {
+			matched = append(matched, app)
 		}
-		filtered = append(filtered, map[string]any{
-			"job_id":               jobID,
-			"result_id":            getString(job, "result_id"),
-			"job_url":              getString(job, "job_url"),
-			"title":                getString(job, "title"),
-			"company":              getString(job, "company"),
-			"location":             getString(job, "location"),
-			"site":                 getString(job, "site"),
-			"stage":                getString(app, "stage"),
-			"applied_at_utc":       getString(app, "applied_at_utc"),
-			"source_session_id":    getString(app, "source_session_id"),
-			"note":                 getString(app, "note"),
-			"stage_updated_at_utc": getString(app, "updated_at_utc"),
-		})
-	}
-	_ = jobs
-	slices.SortFunc(filtered, func(a, b map[string]any) int {
-		av := getString(a, "stage_updated_at_utc")
-		bv := getString(b, "stage_updated_at_utc")
-		return strings.Compare(bv, av)
-	})
-	if offset > len(filtered) {
-		offset = len(filtered)
 	}
-	end := offset + limit
-	if end > len(filtered) {
-		end = len(filtered)
-	}
-	page := filtered[offset:end]
-	pageAny := make([]any, 0, len(page))
-	for _, row := range page {
+	offset = min(offset, len(matched))
+	end := min(offset+limit, len(matched))
+	leading := firstNSorted(matched, end, newestStageUpdateFirst)
+	pageAny := make([]any, 0, end-offset)
+	for _, app := range leading[offset:] {
+		jobID, _ := intFromAny(app["job_id"])
+		job := jobsByID[jobID]
+		row := make(map[string]any, 12)
+		row["job_id"] = jobID
+		copyStoredStrings(row, job, pipelineJobViewFields)
+		copyStoredStrings(row, app, pipelineAppViewFields)
+		row["stage_updated_at_utc"], _ = app["updated_at_utc"].(string)
 		pageAny = append(pageAny, row)
 	}
 	return map[string]any{
@@ -234,17 +205,17 @@ func ListJobsByStage(args map[string]any) (map[string]any, error) {
 		"stage":         stage,
 		"offset":        offset,
 		"limit":         limit,
-		"total_jobs":    len(filtered),
-		"returned_jobs": len(page),
+		"total_jobs":    len(matched),
+		"returned_jobs": len(pageAny),
 		"jobs":          pageAny,
 		"job_db_path":   jobDBPath(),
 	}, nil
 }
 
 func ListRecentJobEvents(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	limit := 50
 	if parsed, has, err := getOptionalInt(args, "limit"); has {
@@ -270,7 +241,7 @@ func ListRecentJobEvents(args map[string]any) (map[string]any, error) {
 		offset = parsed
 	}
 
-	pipeline := loadJobPipeline()
+	pipeline := loadJobPipelineUser(userID)
 	entry := getPipelineEntry(pipeline, userID)
 	if entry == nil {
 		return map[string]any{
@@ -283,8 +254,32 @@ func ListRecentJobEvents(args map[string]any) (map[string]any, error) {
 			"job_db_path":     jobDBPath(),
 		}, nil
 	}
-	events := entry["events"].([]map[string]any)
-	slices.SortFunc(events, func(a, b map[string]any) int {
+	pageAny, total := recentJobEventsPage(entry, userID, offset, limit)
+	return map[string]any{
+		"user_id":         userID,
+		"offset":          min(offset, total),
+		"limit":           limit,
+		"total_events":    total,
+		"returned_events": len(pageAny),
+		"events":          pageAny,
+		"job_db_path":     jobDBPath(),
+	}, nil
+}
+
+// recentJobEventsPage returns one page of the entry's events for known jobs,
+// newest first, and how many such events there are. Only the page is joined
+// back to its jobs.
+func recentJobEventsPage(entry map[string]any, userID string, offset, limit int) ([]any, int) {
+	jobsByID := indexJobsByID(entry)
+	events := make([]map[string]any, 0, len(entry["events"].([]map[string]any)))
+	for _, event := range entry["events"].([]map[string]any) {
+		if jobID, _ := intFromAny(event["job_id"]); jobsByID[jobID] != nil {
+			events = append(events, event)
+		}
+	}
+	offset = min(offset, len(events))
+	end := min(offset+limit, len(events))
+	leading := firstNSorted(events, end, func(a, b map[string]any) int {
 		aCreated := getString(a, "created_at_utc")
 		bCreated := getString(b, "created_at_utc")
 		if aCreated == bCreated {
@@ -294,82 +289,42 @@ func ListRecentJobEvents(args map[string]any) (map[string]any, error) {
 		}
 		return strings.Compare(bCreated, aCreated)
 	})
-	enriched := make([]map[string]any, 0, len(events))
-	for _, event := range events {
+	page := make([]any, 0, end-offset)
+	for _, event := range leading[offset:] {
 		jobID, _ := intFromAny(event["job_id"])
-		job := getJobByID(entry, jobID)
-		if job == nil {
-			continue
-		}
+		job := jobsByID[jobID]
 		eventID, _ := intFromAny(event["id"])
-		enriched = append(enriched, map[string]any{
+		row := map[string]any{
 			"event_id":       eventID,
 			"user_id":        userID,
 			"job_id":         jobID,
-			"result_id":      getString(job, "result_id"),
-			"job_url":        getString(job, "job_url"),
-			"title":          getString(job, "title"),
-			"company":        getString(job, "company"),
 			"from_stage":     event["from_stage"],
 			"to_stage":       event["to_stage"],
 			"reason":         event["reason"],
 			"note":           event["note"],
 			"created_at_utc": event["created_at_utc"],
-		})
-	}
-
-	if offset > len(enriched) {
-		offset = len(enriched)
-	}
-	end := offset + limit
-	if end > len(enriched) {
-		end = len(enriched)
-	}
-	page := enriched[offset:end]
-	pageAny := make([]any, 0, len(page))
-	for _, row := range page {
-		pageAny = append(pageAny, row)
+		}
+		copyStoredStrings(row, job, pipelineEventJobFields)
+		page = append(page, row)
 	}
-
-	return map[string]any{
-		"user_id":         userID,
-		"offset":          offset,
-		"limit":           limit,
-		"total_events":    len(enriched),
-		"returned_events": len(page),
-		"events":          pageAny,
-		"job_db_path":     jobDBPath(),
-	}, nil
+	return page, len(events)
 }
 
 func GetJobPipelineSummary(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
-	}
-	stageCounts := map[string]int{
-		"new": 0, "saved": 0, "applied": 0, "interview": 0, "offer": 0, "rejected": 0, "ignored": 0,
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	recentEvents := []any{}
 	totalTrackedJobs := 0
-	pipeline := loadJobPipeline()
+	pipeline := loadJobPipelineUser(userID)
 	entry := getPipelineEntry(pipeline, userID)
+	stageCounts := countJobStages(entry)
 	if entry != nil {
-		for _, app := range entry["applications"].([]map[string]any) {
-			stage := getString(app, "stage")
-			if _, ok := stageCounts[stage]; ok {
-				stageCounts[stage]++
-			}
-		}
 		totalTrackedJobs = len(entry["jobs"].([]map[string]any))
-		eventsResult, err := ListRecentJobEvents(map[string]any{
-			"user_id": userID,
-			"limit":   10,
-			"offset":  0,
-		})
-		if err == nil {
-			recentEvents = listOrEmpty(eventsResult["events"])
-		}
+		// Reuse the loaded entry rather than loading it again through
+		// ListRecentJobEvents.
+		recentEvents, _ = recentJobEventsPage(entry, userID, 0, 10)
 	}
 	return map[string]any{
 		"user_id":            userID,
@@ -382,9 +337,9 @@ func GetJobPipelineSummary(args map[string]any) (map[string]any, error) {
 }
 
 func ClearSearchSession(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	sessionID := getString(args, "session_id")
 	clearAll := false
@@ -395,28 +350,27 @@ func ClearSearchSession(args map[string]any) (map[string]any, error) {
 		clearAll = parsed
 	}
 
-	store := loadSearchSessions()
-	sessions := mapOrNil(store["sessions"])
-	if sessions == nil {
-		sessions = map[string]any{}
+	if !clearAll && sessionID == "" {
+		return nil, fmt.Errorf("session_id is required unless clear_all_for_user=true")
 	}
+
+	// Hold the session store lock like the search runner does, so a run
+	// saving its session cannot bring a cleared one back.
+	searchSessionMu.Lock()
+	defer searchSessionMu.Unlock()
+	store := loadSearchSessionsPruned()
+	sessions := mapOrNil(store["sessions"])
 	deletedIDs := []string{}
+	remaining := 0
 	if clearAll {
+		// Every session of the user is deleted in this one pass, so none remain.
 		for sid, raw := range sessions {
-			record := mapOrNil(raw)
-			if record == nil {
-				continue
-			}
-			query := mapOrNil(record["query"])
-			if query != nil && getString(query, "user_id") == userID {
+			if sessionOwnedBy(raw, userID) {
 				delete(sessions, sid)
 				deletedIDs = append(deletedIDs, sid)
 			}
 		}
 	} else {
-		if sessionID == "" {
-			return nil, fmt.Errorf("session_id is required unless clear_all_for_user=true")
-		}
 		record := mapOrNil(sessions[sessionID])
 		if record == nil {
 			return map[string]any{
@@ -428,29 +382,23 @@ func ClearSearchSession(args map[string]any) (map[string]any, error) {
 				"path":                    searchSessionsPath(),
 			}, nil
 		}
-		query := mapOrNil(record["query"])
-		if query == nil || getString(query, "user_id") != userID {
+		if !sessionOwnedBy(record, userID) {
 			return nil, fmt.Errorf("session_id does not belong to this user_id")
 		}
 		delete(sessions, sessionID)
 		deletedIDs = append(deletedIDs, sessionID)
-	}
-	store["sessions"] = sessions
-	if err := saveSearchSessions(store); err != nil {
-		return nil, err
-	}
-
-	remaining := 0
-	for _, raw := range sessions {
-		record := mapOrNil(raw)
-		if record == nil {
-			continue
+		for _, raw := range sessions {
+			if sessionOwnedBy(raw, userID) {
+				remaining++
+			}
 		}
-		query := mapOrNil(record["query"])
-		if query != nil && getString(query, "user_id") == userID {
-			remaining++
+	}
+	if len(deletedIDs) > 0 {
+		if err := saveSearchSessionsPruned(store); err != nil {
+			return nil, err
 		}
 	}
+
 	deletedAny := make([]any, 0, len(deletedIDs))
 	for _, id := range deletedIDs {
 		deletedAny = append(deletedAny, id)
@@ -466,3 +414,67 @@ func ClearSearchSession(args map[string]any) (map[string]any, error) {
 		"path":                    searchSessionsPath(),
 	}, nil
 }
+
+// sessionOwnedBy reports whether a stored search session belongs to userID.
+func sessionOwnedBy(raw any, userID string) bool {
+	query := mapOrNil(mapOrNil(raw)["query"])
+	return query != nil && getString(query, "user_id") == userID
+}
+
+// newestStageUpdateFirst orders applications by stage update time, newest
+// first. Whole bulk batches share one timestamp, so ties fall back to the id
+// and every page is cut from the same total order.
+func newestStageUpdateFirst(a, b map[string]any) int {
+	aUpdated := getString(a, "updated_at_utc")
+	bUpdated := getString(b, "updated_at_utc")
+	if aUpdated == bUpdated {
+		ai, _ := intFromAny(a["id"])
+		bi, _ := intFromAny(b["id"])
+		return bi - ai
+	}
+	return strings.Compare(bUpdated, aUpdated)
+}
+
+// firstNSorted returns the first n rows in cmp order, reordering rows in
+// place. When n is small next to len(rows), as for the first pages of a
+// long listing, it keeps the n best rows in a bounded heap at the front of
+// rows and sorts only those, instead of sorting every row.
+func firstNSorted(rows []map[string]any, n int, cmp func(a, b map[string]any) int) []map[string]any {
+	n = min(max(n, 0), len(rows))
+	if n >= len(rows)/4 {
+		slices.SortFunc(rows, cmp)
+		return rows[:n]
+	}
+	if n == 0 {
+		return rows[:0]
+	}
+	// rows[:n] is a heap whose root is the row that sorts last among them.
+	heap := rows[:n]
+	siftDown := func(idx int) {
+		for {
+			worst := idx
+			if left := 2*idx + 1; left < n && cmp(heap[left], heap[worst]) > 0 {
+				worst = left
+			}
+			if right := 2*idx + 2; right < n && cmp(heap[right], heap[worst]) > 0 {
+				worst = right
+			}
+			if worst == idx {
+				return
+			}
+			heap[idx], heap[worst] = heap[worst], heap[idx]
+			idx = worst
+		}
+	}
+	for idx := n/2 - 1; idx >= 0; idx-- {
+		siftDown(idx)
+	}
+	for idx := n; idx < len(rows); idx++ {
+		if cmp(rows[idx], heap[0]) < 0 {
+			heap[0], rows[idx] = rows[idx], heap[0]
+			siftDown(0)
+		}
+	}
+	slices.SortFunc(heap, cmp)
+	return heap
+}
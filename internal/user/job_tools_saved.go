@@ -2,252 +2,176 @@ package user
 
 import (
 	"fmt"
-	"slices"
+	"maps"
 	"strings"
 )
 
 func SaveJobForLater(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	resolved, err := resolveJobReference(args, userID)
 	if err != nil {
 		return nil, err
 	}
-	cleanURL := getString(resolved, "job_url")
+	now := utcNowISO()
 
-	title := getString(args, "title")
-	if title == "" {
-		title = getString(resolved, "title")
-	}
-	company := getString(args, "company")
-	if company == "" {
-		company = getString(resolved, "company")
-	}
-	location := getString(args, "location")
-	if location == "" {
-		location = getString(resolved, "location")
-	}
-	site := getString(args, "site")
-	if site == "" {
-		site = getString(resolved, "site")
-	}
-	description := getString(args, "description")
-	if description == "" {
-		description = getString(resolved, "description")
-	}
-	descriptionExcerpt := getString(args, "description_excerpt")
-	if descriptionExcerpt == "" {
-		descriptionExcerpt = getString(resolved, "description_excerpt")
-	}
-	salaryText := getString(args, "salary_text")
-	if salaryText == "" {
-		salaryText = getString(resolved, "salary_text")
-	}
-	salaryCurrency := getString(args, "salary_currency")
-	if salaryCurrency == "" {
-		salaryCurrency = getString(resolved, "salary_currency")
-	}
-	salaryInterval := getString(args, "salary_interval")
-	if salaryInterval == "" {
-		salaryInterval = getString(resolved, "salary_interval")
-	}
-	salarySource := getString(args, "salary_source")
-	if salarySource == "" {
-		salarySource = getString(resolved, "salary_source")
-	}
-	jobType := getString(args, "job_type")
-	if jobType == "" {
-		jobType = getString(resolved, "job_type")
-	}
-	jobLevel := getString(args, "job_level")
-	if jobLevel == "" {
-		jobLevel = getString(resolved, "job_level")
+	store := savedJobsStore.loadUser(userID)
+	entry := savedJobsStore.ensure(store, userID)
+	savedJob, action := upsertSavedJob(entry, nil, args, resolved, now)
+	// Stage the job before writing either store, so a job the pipeline
+	// rejects is not left saved.
+	pipeline := loadJobPipeline()
+	jobID, application, err := stageSavedJob(ensurePipelineEntry(pipeline, userID), userID, resolved, savedJob, "save_job_for_later")
+	if err != nil {
+		return nil, err
 	}
-	companyIndustry := getString(args, "company_industry")
-	if companyIndustry == "" {
-		companyIndustry = getString(resolved, "company_industry")
+	op := ""
+	if action == "updated_existing" {
+		op = storeJournalOpUpsert
+	}
+	if err := appendStoreJournal(savedJobsPath(), storeJournalRecord{
+		Op:           op,
+		UserID:       userID,
+		ListKey:      "jobs",
+		Item:         savedJob,
+		NextID:       intOrZero(entry["next_id"]),
+		UpdatedAtUTC: now,
+	}); err != nil {
+		return nil, err
 	}
-	jobFunction := getString(args, "job_function")
-	if jobFunction == "" {
-		jobFunction = getString(resolved, "job_function")
+	if err := saveJobPipeline(pipeline); err != nil {
+		return nil, err
 	}
-	jobURLDirect := getString(args, "job_url_direct")
-	if jobURLDirect == "" {
-		jobURLDirect = getString(resolved, "job_url_direct")
+
+	return jobListUpsertResult(userID, action, "saved_job", savedJob, resolved,
+		"total_saved_jobs", len(entry["jobs"].([]map[string]any)), jobID, application, savedJobsPath()), nil
+}
+
+// SaveJobsBulk saves many jobs in one call: the saved-jobs store and the job
+// pipeline are each loaded and written once for the whole batch instead of
+// once per job. A job that cannot be resolved or staged is reported under
+// failed and does not stop the rest of the batch.
+func SaveJobsBulk(args map[string]any) (map[string]any, error) {
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
-	salaryMin := args["salary_min_amount"]
-	if salaryMin == nil {
-		salaryMin = resolved["salary_min_amount"]
+	items, err := bulkJobItems(args)
+	if err != nil {
+		return nil, err
 	}
-	salaryMax := args["salary_max_amount"]
-	if salaryMax == nil {
-		salaryMax = resolved["salary_max_amount"]
+	now := utcNowISO()
+	saved, failed, total, err := upsertJobListBatch(savedJobsStore, userID, items, "saved_job",
+		func(entry map[string]any, byURL map[string]map[string]any, item, resolved map[string]any) (map[string]any, string) {
+			return upsertSavedJob(entry, byURL, item, resolved, now)
+		},
+		func(pipelineEntry map[string]any, _, resolved, savedJob map[string]any) (int, map[string]any, error) {
+			return stageSavedJob(pipelineEntry, userID, resolved, savedJob, "save_jobs_bulk")
+		},
+	)
+	if err != nil {
+		return nil, err
 	}
-	isRemote := args["is_remote"]
-	if isRemote == nil {
-		isRemote = resolved["is_remote"]
+
+	return map[string]any{
+		"user_id":          userID,
+		"saved":            saved,
+		"failed":           failed,
+		"total_saved_jobs": total,
+		"path":             savedJobsPath(),
+		"job_db_path":      jobDBPath(),
+	}, nil
+}
+
+// Saved-job fields taken from the tool arguments, falling back to the
+// resolved job reference. Text fields are left untouched on an existing row
+// when empty; value fields when nil.
+var (
+	savedJobTextFields = []string{
+		"title", "company", "location", "site", "description", "description_excerpt",
+		"salary_text", "salary_currency", "salary_interval", "salary_source", "job_type",
+		"job_level", "company_industry", "job_function", "job_url_direct", "source_session_id",
+	}
+	savedJobValueFields = []string{"salary_min_amount", "salary_max_amount", "is_remote"}
+)
+
+// upsertSavedJob updates the saved job with the resolved URL in entry, or
+// appends a new one, and reports which it did. byURL, when set, is an
+// indexRowsByURL index of entry's jobs used instead of a scan and kept in sync
+// with appended rows. The caller persists entry.
+func upsertSavedJob(entry map[string]any, byURL map[string]map[string]any, args, resolved map[string]any, now string) (map[string]any, string) {
+	// Room for note plus the id, URL and timestamps a new row adds.
+	fields := make(map[string]any, len(savedJobTextFields)+len(savedJobValueFields)+5)
+	for _, field := range savedJobTextFields {
+		value := getString(args, field)
+		if value == "" {
+			value = getString(resolved, field)
+		}
+		fields[field] = value
 	}
-	note := getString(args, "note")
-	sourceSessionID := getString(args, "source_session_id")
-	if sourceSessionID == "" {
-		sourceSessionID = getString(resolved, "source_session_id")
+	for _, field := range savedJobValueFields {
+		value := args[field]
+		if value == nil {
+			value = resolved[field]
+		}
+		fields[field] = value
 	}
-	now := utcNowISO()
+	fields["note"] = getString(args, "note")
+	cleanURL := getString(resolved, "job_url")
 
-	store := loadSavedJobs()
-	entry := ensureUserListEntry(store, userID, "jobs", normalizeSavedJob)
+	entry["updated_at_utc"] = now
 	jobs := entry["jobs"].([]map[string]any)
-	action := "saved_new"
-	var savedJob map[string]any
-	for _, row := range jobs {
-		if !strings.EqualFold(getString(row, "job_url"), cleanURL) {
-			continue
-		}
-		if title != "" {
-			row["title"] = title
-		}
-		if company != "" {
-			row["company"] = company
-		}
-		if location != "" {
-			row["location"] = location
-		}
-		if site != "" {
-			row["site"] = site
-		}
-		if description != "" {
-			row["description"] = description
-		}
-		if descriptionExcerpt != "" {
-			row["description_excerpt"] = descriptionExcerpt
-		}
-		if salaryText != "" {
-			row["salary_text"] = salaryText
-		}
-		if salaryCurrency != "" {
-			row["salary_currency"] = salaryCurrency
-		}
-		if salaryInterval != "" {
-			row["salary_interval"] = salaryInterval
-		}
-		if salarySource != "" {
-			row["salary_source"] = salarySource
-		}
-		if salaryMin != nil {
-			row["salary_min_amount"] = salaryMin
-		}
-		if salaryMax != nil {
-			row["salary_max_amount"] = salaryMax
-		}
-		if jobType != "" {
-			row["job_type"] = jobType
-		}
-		if jobLevel != "" {
-			row["job_level"] = jobLevel
-		}
-		if companyIndustry != "" {
-			row["company_industry"] = companyIndustry
-		}
-		if jobFunction != "" {
-			row["job_function"] = jobFunction
-		}
-		if jobURLDirect != "" {
-			row["job_url_direct"] = jobURLDirect
-		}
-		if isRemote != nil {
-			row["is_remote"] = isRemote
-		}
-		if note != "" {
-			row["note"] = note
-		}
-		if sourceSessionID != "" {
-			row["source_session_id"] = sourceSessionID
+	if row := findRowByURL(jobs, byURL, cleanURL); row != nil {
+		for field, value := range fields {
+			if value != nil && value != "" {
+				row[field] = value
+			}
 		}
 		row["updated_at_utc"] = now
-		savedJob = row
-		action = "updated_existing"
-		break
-	}
-	if savedJob == nil {
-		nextID, _ := intFromAny(entry["next_id"])
-		savedJob = map[string]any{
-			"id":                  nextID,
-			"job_url":             cleanURL,
-			"title":               title,
-			"company":             company,
-			"location":            location,
-			"site":                site,
-			"description":         description,
-			"description_excerpt": descriptionExcerpt,
-			"salary_text":         salaryText,
-			"salary_currency":     salaryCurrency,
-			"salary_interval":     salaryInterval,
-			"salary_min_amount":   salaryMin,
-			"salary_max_amount":   salaryMax,
-			"salary_source":       salarySource,
-			"job_type":            jobType,
-			"job_level":           jobLevel,
-			"company_industry":    companyIndustry,
-			"job_function":        jobFunction,
-			"job_url_direct":      jobURLDirect,
-			"is_remote":           isRemote,
-			"note":                note,
-			"source_session_id":   sourceSessionID,
-			"saved_at_utc":        now,
-			"updated_at_utc":      now,
+		// Keep the row normalized so it stays inside the trusted prefix on reload.
+		if normalized, ok := normalizeSavedJob(row); ok {
+			maps.Copy(row, normalized)
 		}
-		entry["jobs"] = append(jobs, savedJob)
-		entry["next_id"] = nextID + 1
-	}
-	entry["updated_at_utc"] = now
-	if err := saveSavedJobs(store); err != nil {
-		return nil, err
-	}
+		return row, "updated_existing"
+	}
+	nextID, _ := intFromAny(entry["next_id"])
+	savedJob := fields
+	savedJob["id"] = nextID
+	savedJob["job_url"] = cleanURL
+	savedJob["saved_at_utc"] = now
+	savedJob["updated_at_utc"] = now
+	entry["jobs"] = append(jobs, savedJob)
+	entry["next_id"] = nextID + 1
+	if byURL != nil {
+		byURL[strings.ToLower(cleanURL)] = savedJob
+	}
+	return savedJob, "saved_new"
+}
 
-	pipeline := loadJobPipeline()
-	pipelineEntry := ensurePipelineEntry(pipeline, userID)
-	jobID, _, err := upsertJob(pipelineEntry, userID, resolved, getString(savedJob, "title"), getString(savedJob, "company"), getString(savedJob, "location"), getString(savedJob, "site"))
-	if err != nil {
-		return nil, err
-	}
-	application, _, err := setJobStage(
+// stageSavedJob records savedJob in the job pipeline at the saved stage,
+// attributing the event to source.
+func stageSavedJob(pipelineEntry map[string]any, userID string, resolved, savedJob map[string]any, source string) (int, map[string]any, error) {
+	return upsertJobAtStage(
 		pipelineEntry,
 		userID,
-		jobID,
+		resolved,
+		getString(savedJob, "title"),
+		getString(savedJob, "company"),
+		getString(savedJob, "location"),
+		getString(savedJob, "site"),
 		"saved",
 		getString(savedJob, "note"),
 		getString(savedJob, "source_session_id"),
-		"",
-		"save_job_for_later",
+		source,
 	)
-	if err != nil {
-		return nil, err
-	}
-	if err := saveJobPipeline(pipeline); err != nil {
-		return nil, err
-	}
-
-	return map[string]any{
-		"user_id":            userID,
-		"action":             action,
-		"saved_job":          savedJob,
-		"resolved_result_id": getString(resolved, "result_id"),
-		"total_saved_jobs":   len(entry["jobs"].([]map[string]any)),
-		"job_management": map[string]any{
-			"job_id":      jobID,
-			"stage":       getString(application, "stage"),
-			"job_db_path": jobDBPath(),
-		},
-		"path": savedJobsPath(),
-	}, nil
 }
 
 func ListSavedJobs(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	limit := 50
 	if parsed, has, err := getOptionalInt(args, "limit"); has {
@@ -272,8 +196,8 @@ func ListSavedJobs(args map[string]any) (map[string]any, error) {
 		}
 		offset = parsed
 	}
-	store := loadSavedJobs()
-	entry := getUserListEntry(store, userID, "jobs", normalizeSavedJob)
+	store := savedJobsStore.loadUser(userID)
+	entry := savedJobsStore.get(store, userID)
 	if entry == nil {
 		return map[string]any{
 			"user_id":          userID,
@@ -286,38 +210,22 @@ func ListSavedJobs(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 	jobs := entry["jobs"].([]map[string]any)
-	slices.SortFunc(jobs, func(a, b map[string]any) int {
-		ai, _ := intFromAny(a["id"])
-		bi, _ := intFromAny(b["id"])
-		return bi - ai
-	})
-	if offset > len(jobs) {
-		offset = len(jobs)
-	}
-	end := offset + limit
-	if end > len(jobs) {
-		end = len(jobs)
-	}
-	page := jobs[offset:end]
-	pageAny := make([]any, 0, len(page))
-	for _, row := range page {
-		pageAny = append(pageAny, row)
-	}
+	pageAny, offset := newestFirstPage(jobs, offset, limit)
 	return map[string]any{
 		"user_id":          userID,
 		"offset":           offset,
 		"limit":            limit,
 		"total_saved_jobs": len(jobs),
-		"returned_jobs":    len(page),
+		"returned_jobs":    len(pageAny),
 		"jobs":             pageAny,
 		"path":             savedJobsPath(),
 	}, nil
 }
 
 func DeleteSavedJob(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	targetID, hasID, err := getOptionalInt(args, "saved_job_id")
 	if !hasID {
@@ -330,8 +238,8 @@ func DeleteSavedJob(args map[string]any) (map[string]any, error) {
 		return nil, fmt.Errorf("saved_job_id must be a positive integer")
 	}
 
-	store := loadSavedJobs()
-	entry := getUserListEntry(store, userID, "jobs", normalizeSavedJob)
+	store := savedJobsStore.loadUser(userID)
+	entry := savedJobsStore.get(store, userID)
 	if entry == nil {
 		return map[string]any{
 			"user_id":          userID,
@@ -343,16 +251,7 @@ func DeleteSavedJob(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 	jobs := entry["jobs"].([]map[string]any)
-	remaining := make([]map[string]any, 0, len(jobs))
-	var deleted map[string]any
-	for _, row := range jobs {
-		id, _ := intFromAny(row["id"])
-		if deleted == nil && id == targetID {
-			deleted = row
-			continue
-		}
-		remaining = append(remaining, row)
-	}
+	deleted := removeEntryRowByID(entry, "jobs", targetID)
 	if deleted == nil {
 		return map[string]any{
 			"user_id":          userID,
@@ -363,9 +262,17 @@ func DeleteSavedJob(args map[string]any) (map[string]any, error) {
 			"path":             savedJobsPath(),
 		}, nil
 	}
-	entry["jobs"] = remaining
-	entry["updated_at_utc"] = utcNowISO()
-	if err := saveSavedJobs(store); err != nil {
+	remaining := entry["jobs"].([]map[string]any)
+	now := utcNowISO()
+	entry["updated_at_utc"] = now
+	if err := appendStoreJournal(savedJobsPath(), storeJournalRecord{
+		Op:           storeJournalOpDelete,
+		UserID:       userID,
+		ListKey:      "jobs",
+		Item:         map[string]any{"id": targetID},
+		NextID:       intOrZero(entry["next_id"]),
+		UpdatedAtUTC: now,
+	}); err != nil {
 		return nil, err
 	}
 
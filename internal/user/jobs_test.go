@@ -1,7 +1,12 @@
 package user
 
 import (
+	"fmt"
 	"path/filepath"
+	"reflect"
+	"regexp"
+	"slices"
+	"strings"
 	"testing"
 )
 
@@ -199,6 +204,50 @@ func TestJobPipelineLifecycle(t *testing.T) {
 	}
 }
 
+func TestAddJobNoteInitializesApplication(t *testing.T) {
+	setupUserToolPaths(t)
+
+	payload, err := AddJobNote(map[string]any{
+		"user_id": "u1",
+		"job_url": "https://example.com/jobs/note-only",
+		"note":    "referral from Sam",
+	})
+	if err != nil {
+		t.Fatalf("AddJobNote failed: %v", err)
+	}
+	application, _ := payload["application"].(map[string]any)
+	if got := getString(application, "stage"); got != "new" {
+		t.Fatalf("expected stage=new, got %q", got)
+	}
+	if got := getString(application, "note"); got != "referral from Sam" {
+		t.Fatalf("expected note to be stored, got %q", got)
+	}
+
+	events, err := ListRecentJobEvents(map[string]any{"user_id": "u1"})
+	if err != nil {
+		t.Fatalf("ListRecentJobEvents failed: %v", err)
+	}
+	if got, _ := events["total_events"].(int); got != 2 {
+		t.Fatalf("expected initialize + note events, got %#v", events["total_events"])
+	}
+}
+
+func TestGetJobByURLIgnoresCase(t *testing.T) {
+	entry := map[string]any{
+		"jobs": []map[string]any{
+			{"id": 1, "job_url": "https://example.com/Jobs/1"},
+			{"id": 2, "job_url": "https://example.com/jobs/2"},
+		},
+	}
+	job := getJobByURL(entry, "  HTTPS://EXAMPLE.COM/jobs/2 ")
+	if job == nil || intOrZero(job["id"]) != 2 {
+		t.Fatalf("expected job 2, got %#v", job)
+	}
+	if job := getJobByURL(entry, "https://example.com/jobs/3"); job != nil {
+		t.Fatalf("expected no match, got %#v", job)
+	}
+}
+
 func TestResolveByResultIDAndClearSearchSession(t *testing.T) {
 	setupUserToolPaths(t)
 
@@ -260,3 +309,498 @@ func setupUserToolPaths(t *testing.T) {
 	t.Setenv("VISA_SEARCH_RUNS_PATH", filepath.Join(root, "search_runs.json"))
 	t.Setenv("VISA_JOB_DB_PATH", filepath.Join(root, "job_pipeline.json"))
 }
+
+func TestIgnoredJobURLSetTracksStoreChanges(t *testing.T) {
+	setupUserToolPaths(t)
+	if got := ignoredJobURLSet("u1"); len(got) != 0 {
+		t.Fatalf("expected empty ignored set, got %#v", got)
+	}
+	first, err := IgnoreJob(map[string]any{"user_id": "u1", "job_url": "https://example.com/jobs/A"})
+	if err != nil {
+		t.Fatalf("IgnoreJob failed: %v", err)
+	}
+	if _, ok := ignoredJobURLSet("u1")["https://example.com/jobs/a"]; !ok {
+		t.Fatalf("expected first ignored url in set")
+	}
+	if _, err := IgnoreJob(map[string]any{"user_id": "u1", "job_url": "https://example.com/jobs/b"}); err != nil {
+		t.Fatalf("IgnoreJob failed: %v", err)
+	}
+	if got := ignoredJobURLSet("u1"); len(got) != 2 {
+		t.Fatalf("expected journal append to refresh set, got %#v", got)
+	}
+	ignoredID := intOrZero(asMap(first["ignored_job"])["id"])
+	if _, err := UnignoreJob(map[string]any{"user_id": "u1", "ignored_job_id": ignoredID}); err != nil {
+		t.Fatalf("UnignoreJob failed: %v", err)
+	}
+	if _, ok := ignoredJobURLSet("u1")["https://example.com/jobs/a"]; ok {
+		t.Fatalf("expected unignored url to drop out of set")
+	}
+}
+
+func TestIgnoredCompanySetTracksStoreChanges(t *testing.T) {
+	setupUserToolPaths(t)
+	if got := ignoredCompanySet("u1"); len(got) != 0 {
+		t.Fatalf("expected empty ignored company set, got %#v", got)
+	}
+	ignored, err := IgnoreCompany(map[string]any{"user_id": "u1", "company_name": "Acme Inc"})
+	if err != nil {
+		t.Fatalf("IgnoreCompany failed: %v", err)
+	}
+	if _, err := IgnoreCompany(map[string]any{"user_id": "u2", "company_name": "Globex"}); err != nil {
+		t.Fatalf("IgnoreCompany failed: %v", err)
+	}
+	if got := ignoredCompanySet("u1"); len(got) != 1 {
+		t.Fatalf("expected only the user's own company in set, got %#v", got)
+	}
+	companyID := intOrZero(asMap(ignored["ignored_company"])["id"])
+	if _, err := UnignoreCompany(map[string]any{"user_id": "u1", "ignored_company_id": companyID}); err != nil {
+		t.Fatalf("UnignoreCompany failed: %v", err)
+	}
+	if got := ignoredCompanySet("u1"); len(got) != 0 {
+		t.Fatalf("expected unignored company to drop out of set, got %#v", got)
+	}
+}
+
+func TestSaveJobsBulkSavesBatchAndReportsFailures(t *testing.T) {
+	setupUserToolPaths(t)
+	if _, err := SaveJobForLater(map[string]any{"user_id": "u1", "job_url": "https://example.com/jobs/a", "title": "Old"}); err != nil {
+		t.Fatalf("SaveJobForLater failed: %v", err)
+	}
+	result, err := SaveJobsBulk(map[string]any{
+		"user_id": "u1",
+		"jobs": []any{
+			map[string]any{"job_url": "https://example.com/jobs/A", "title": "New", "note": "follow up"},
+			map[string]any{"job_url": "https://example.com/jobs/b", "company": "Acme"},
+			map[string]any{"title": "missing reference"},
+			"not an object",
+		},
+	})
+	if err != nil {
+		t.Fatalf("SaveJobsBulk failed: %v", err)
+	}
+	saved, _ := result["saved"].([]map[string]any)
+	if len(saved) != 2 || getString(saved[0], "action") != "updated_existing" || getString(saved[1], "action") != "saved_new" {
+		t.Fatalf("unexpected saved results: %#v", saved)
+	}
+	failed, _ := result["failed"].([]map[string]any)
+	if len(failed) != 2 || failed[0]["index"] != 2 || failed[1]["index"] != 3 {
+		t.Fatalf("unexpected failed results: %#v", failed)
+	}
+
+	listed, err := ListSavedJobs(map[string]any{"user_id": "u1"})
+	if err != nil {
+		t.Fatalf("ListSavedJobs failed: %v", err)
+	}
+	jobs, _ := listed["jobs"].([]any)
+	if len(jobs) != 2 || getString(mapOrNil(jobs[1]), "title") != "New" || getString(mapOrNil(jobs[1]), "note") != "follow up" {
+		t.Fatalf("expected bulk save to update and append rows, got %#v", jobs)
+	}
+	staged, err := ListJobsByStage(map[string]any{"user_id": "u1", "stage": "saved"})
+	if err != nil {
+		t.Fatalf("ListJobsByStage failed: %v", err)
+	}
+	if got, _ := intFromAny(staged["total_jobs"]); got != 2 {
+		t.Fatalf("expected two saved pipeline jobs, got %#v", staged)
+	}
+
+	if _, err := SaveJobsBulk(map[string]any{"user_id": "u1", "jobs": []any{}}); err == nil {
+		t.Fatalf("expected an empty jobs list to be rejected")
+	}
+}
+
+func TestSaveJobsBulkMatchesURLsSavedEarlierInTheBatch(t *testing.T) {
+	setupUserToolPaths(t)
+	result, err := SaveJobsBulk(map[string]any{
+		"user_id": "u1",
+		"jobs": []any{
+			map[string]any{"job_url": "https://example.com/jobs/x", "title": "First"},
+			map[string]any{"job_url": "https://EXAMPLE.com/jobs/x", "note": "same job"},
+		},
+	})
+	if err != nil {
+		t.Fatalf("SaveJobsBulk failed: %v", err)
+	}
+	saved, _ := result["saved"].([]map[string]any)
+	if len(saved) != 2 || getString(saved[1], "action") != "updated_existing" {
+		t.Fatalf("expected the second entry to update the first, got %#v", saved)
+	}
+	if got, _ := intFromAny(result["total_saved_jobs"]); got != 1 {
+		t.Fatalf("expected one saved job, got %#v", result["total_saved_jobs"])
+	}
+}
+
+func TestNewestFirstPageWalksFromTail(t *testing.T) {
+	rows := []map[string]any{{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}}
+	page, offset := newestFirstPage(rows, 1, 2)
+	if offset != 1 || len(page) != 2 || mapOrNil(page[0])["id"] != 3 || mapOrNil(page[1])["id"] != 2 {
+		t.Fatalf("unexpected page %#v at offset %d", page, offset)
+	}
+	page, offset = newestFirstPage(rows, 3, 5)
+	if offset != 3 || len(page) != 1 || mapOrNil(page[0])["id"] != 1 {
+		t.Fatalf("unexpected tail page %#v at offset %d", page, offset)
+	}
+	page, offset = newestFirstPage(rows, 9, 5)
+	if offset != 4 || len(page) != 0 {
+		t.Fatalf("expected an empty page at a clamped offset, got %#v at %d", page, offset)
+	}
+}
+
+func TestPipelineEntryNormalizesLegacyRowsOnceAndTrustsMarkedEntries(t *testing.T) {
+	setupUserToolPaths(t)
+	legacy := map[string]any{"users": map[string]any{"u1": map[string]any{
+		"jobs": []any{
+			map[string]any{"id": 2, "job_url": " https://example.com/jobs/b "},
+			map[string]any{"id": 1, "job_url": "https://example.com/jobs/a"},
+			map[string]any{"id": "bad"},
+		},
+	}}}
+	if err := saveJobPipeline(legacy); err != nil {
+		t.Fatalf("saveJobPipeline failed: %v", err)
+	}
+	entry := getPipelineEntry(loadJobPipeline(), "u1")
+	jobs := entry["jobs"].([]map[string]any)
+	if len(jobs) != 2 || getString(jobs[0], "job_url") != "https://example.com/jobs/a" {
+		t.Fatalf("expected legacy rows to be normalized and sorted, got %#v", jobs)
+	}
+
+	if _, err := SaveJobForLater(map[string]any{"user_id": "u1", "job_url": "https://example.com/jobs/c"}); err != nil {
+		t.Fatalf("SaveJobForLater failed: %v", err)
+	}
+	stored := mapOrNil(getUsersMap(loadJobPipeline())["u1"])
+	if version, _ := intFromAny(stored[normalizedVersionKey]); version != pipelineSchemaVersion {
+		t.Fatalf("expected saved pipeline entry to be marked normalized, got %#v", stored[normalizedVersionKey])
+	}
+	events, err := ListRecentJobEvents(map[string]any{"user_id": "u1"})
+	if err != nil {
+		t.Fatalf("ListRecentJobEvents failed: %v", err)
+	}
+	rows := listOrEmpty(events["events"])
+	if len(rows) != 1 || mapOrNil(rows[0])["from_stage"] != "" {
+		t.Fatalf("expected a first event with an empty from_stage, got %#v", rows)
+	}
+}
+
+func TestRecentJobEventsPageCountsAllAndJoinsOnlyThePage(t *testing.T) {
+	entry := map[string]any{
+		"jobs": []map[string]any{{"id": 1, "job_url": "https://example.com/jobs/a"}},
+		"events": []map[string]any{
+			{"id": 1, "job_id": 1, "to_stage": "saved", "created_at_utc": "2026-01-01T00:00:00Z"},
+			{"id": 2, "job_id": 1, "to_stage": "applied", "created_at_utc": "2026-01-02T00:00:00Z"},
+			{"id": 3, "job_id": 9, "to_stage": "saved", "created_at_utc": "2026-01-03T00:00:00Z"},
+		},
+	}
+	page, total := recentJobEventsPage(entry, "u1", 0, 1)
+	if total != 2 || len(page) != 1 {
+		t.Fatalf("expected one of two events for known jobs, got %d of %d", len(page), total)
+	}
+	if row := mapOrNil(page[0]); row["event_id"] != 2 || row["job_url"] != "https://example.com/jobs/a" {
+		t.Fatalf("expected the newest event joined to its job, got %#v", row)
+	}
+	if page, total := recentJobEventsPage(entry, "u1", 5, 10); total != 2 || len(page) != 0 {
+		t.Fatalf("expected an empty page past the end, got %d of %d", len(page), total)
+	}
+}
+
+func TestClearSearchSessionCountsRemainingUserSessions(t *testing.T) {
+	setupUserToolPaths(t)
+	owned := func(userID string) map[string]any {
+		return map[string]any{"query": map[string]any{"user_id": userID}}
+	}
+	store := map[string]any{"sessions": map[string]any{"s1": owned("u1"), "s2": owned("u1"), "s3": owned("u2")}}
+	if err := saveSearchSessions(store); err != nil {
+		t.Fatalf("saveSearchSessions failed: %v", err)
+	}
+
+	cleared, err := ClearSearchSession(map[string]any{"user_id": "u1", "session_id": "s1"})
+	if err != nil {
+		t.Fatalf("ClearSearchSession failed: %v", err)
+	}
+	if got := cleared["remaining_user_sessions"]; got != 1 {
+		t.Fatalf("expected one remaining u1 session, got %#v", got)
+	}
+	if _, err := ClearSearchSession(map[string]any{"user_id": "u1", "session_id": "s3"}); err == nil {
+		t.Fatalf("expected clearing another user's session to fail")
+	}
+
+	all, err := ClearSearchSession(map[string]any{"user_id": "u1", "clear_all_for_user": true})
+	if err != nil {
+		t.Fatalf("ClearSearchSession failed: %v", err)
+	}
+	if all["deleted_count"] != 1 || all["remaining_user_sessions"] != 0 {
+		t.Fatalf("unexpected clear-all result: %#v", all)
+	}
+	if sessions := mapOrNil(loadSearchSessions()["sessions"]); len(sessions) != 1 || sessions["s3"] == nil {
+		t.Fatalf("expected only u2's session to remain, got %#v", sessions)
+	}
+}
+
+func TestJobSnapshotCopiesStoredFields(t *testing.T) {
+	job := map[string]any{"id": 3, "job_url": "https://example.com/jobs/a", "title": "Engineer", "created_at_utc": "2026-01-01T00:00:00Z"}
+	fresh := jobSnapshot("u1", 3, job, nil)
+	if fresh["stage"] != "new" || fresh["stage_updated_at_utc"] != nil || fresh["title"] != "Engineer" || fresh["company"] != "" {
+		t.Fatalf("unexpected snapshot without application: %#v", fresh)
+	}
+	app := map[string]any{"stage": "applied", "note": "sent", "updated_at_utc": "2026-01-02T00:00:00Z"}
+	applied := jobSnapshot("u1", 3, job, app)
+	if applied["stage"] != "applied" || applied["note"] != "sent" || applied["stage_updated_at_utc"] != "2026-01-02T00:00:00Z" || len(applied) != 15 {
+		t.Fatalf("unexpected snapshot with application: %#v", applied)
+	}
+}
+
+func TestUpsertJobAtStageReusesApplicationOfExistingJob(t *testing.T) {
+	entry := ensurePipelineEntry(map[string]any{"users": map[string]any{}}, "u1")
+	resolved := map[string]any{"job_url": "https://example.com/jobs/a"}
+	jobID, first, err := upsertJobAtStage(entry, "u1", resolved, "Engineer", "", "", "", "saved", "", "", "save_job_for_later")
+	if err != nil {
+		t.Fatalf("upsertJobAtStage failed: %v", err)
+	}
+	againID, second, err := upsertJobAtStage(entry, "u1", resolved, "", "", "", "", "ignored", "", "", "ignore_job")
+	if err != nil {
+		t.Fatalf("upsertJobAtStage failed: %v", err)
+	}
+	if againID != jobID || first["id"] != second["id"] || getString(second, "stage") != "ignored" {
+		t.Fatalf("expected the existing application to move stage, got %#v then %#v", first, second)
+	}
+	if apps := entry["applications"].([]map[string]any); len(apps) != 1 {
+		t.Fatalf("expected one application, got %#v", apps)
+	}
+	if _, _, err := upsertJobAtStage(entry, "u1", resolved, "", "", "", "", "bogus", "", "", ""); err == nil {
+		t.Fatalf("expected an invalid stage to be rejected")
+	}
+}
+
+func TestFirstNSortedMatchesFullSort(t *testing.T) {
+	byID := func(a, b map[string]any) int { return intOrZero(a["id"]) - intOrZero(b["id"]) }
+	for _, n := range []int{0, 1, 3, 10, 40, 100} {
+		rows := make([]map[string]any, 0, 97)
+		for i := 0; i < 97; i++ {
+			rows = append(rows, map[string]any{"id": (i * 37) % 97})
+		}
+		got := firstNSorted(rows, n, byID)
+		if len(got) != min(n, 97) {
+			t.Fatalf("n=%d: expected %d rows, got %d", n, min(n, 97), len(got))
+		}
+		for idx, row := range got {
+			if row["id"] != idx {
+				t.Fatalf("n=%d: expected id %d at %d, got %#v", n, idx, idx, row["id"])
+			}
+		}
+	}
+}
+
+func TestCountJobStagesCoversEveryValidStage(t *testing.T) {
+	for idx, stage := range jobStageNames {
+		if clean, err := validateJobStage(stage); err != nil || clean != stage || jobStageIndex(stage) != idx {
+			t.Fatalf("stage %q is not valid or not at index %d", stage, idx)
+		}
+	}
+	if _, err := validateJobStage("bogus"); err == nil || err.Error() != "stage must be one of [applied ignored interview new offer rejected saved]" {
+		t.Fatalf("unexpected error for an unknown stage: %v", err)
+	}
+	counts := countJobStages(map[string]any{"applications": []map[string]any{
+		{"stage": "applied"}, {"stage": "applied"}, {"stage": "offer"}, {"stage": "bogus"},
+	}})
+	if len(counts) != len(jobStageNames) || counts["applied"] != 2 || counts["offer"] != 1 || counts["new"] != 0 {
+		t.Fatalf("unexpected stage counts %#v", counts)
+	}
+}
+
+func TestIgnoreJobsBulkIgnoresBatchAndReportsFailures(t *testing.T) {
+	setupUserToolPaths(t)
+	if _, err := IgnoreJob(map[string]any{"user_id": "u1", "job_url": "https://example.com/jobs/a"}); err != nil {
+		t.Fatalf("IgnoreJob failed: %v", err)
+	}
+	result, err := IgnoreJobsBulk(map[string]any{
+		"user_id": "u1",
+		"jobs": []any{
+			map[string]any{"job_url": "https://example.com/jobs/A", "reason": "no sponsorship"},
+			map[string]any{"job_url": "https://example.com/jobs/b", "company": "Acme"},
+			map[string]any{"reason": "missing reference"},
+		},
+	})
+	if err != nil {
+		t.Fatalf("IgnoreJobsBulk failed: %v", err)
+	}
+	ignored, _ := result["ignored"].([]map[string]any)
+	if len(ignored) != 2 || getString(ignored[0], "action") != "updated_existing" || getString(ignored[1], "action") != "ignored_new" {
+		t.Fatalf("unexpected ignored results: %#v", ignored)
+	}
+	failed, _ := result["failed"].([]map[string]any)
+	if len(failed) != 1 || failed[0]["index"] != 2 {
+		t.Fatalf("unexpected failed results: %#v", failed)
+	}
+
+	listed, err := ListIgnoredJobs(map[string]any{"user_id": "u1"})
+	if err != nil {
+		t.Fatalf("ListIgnoredJobs failed: %v", err)
+	}
+	jobs, _ := listed["jobs"].([]any)
+	if len(jobs) != 2 || getString(mapOrNil(jobs[1]), "reason") != "no sponsorship" {
+		t.Fatalf("expected bulk ignore to update and append rows, got %#v", jobs)
+	}
+	staged, err := ListJobsByStage(map[string]any{"user_id": "u1", "stage": "ignored"})
+	if err != nil {
+		t.Fatalf("ListJobsByStage failed: %v", err)
+	}
+	if got, _ := intFromAny(staged["total_jobs"]); got != 2 {
+		t.Fatalf("expected two ignored pipeline jobs, got %#v", staged)
+	}
+}
+
+func TestNormalizeCompanyNameMatchesPunctuationBlanking(t *testing.T) {
+	blank := regexp.MustCompile(`[^A-Za-z0-9\s]`)
+	reference := func(name string) string {
+		tokens := strings.Fields(blank.ReplaceAllString(strings.ToLower(strings.TrimSpace(name)), " "))
+		for len(tokens) > 0 {
+			if _, ok := companyLegalSuffixes[tokens[len(tokens)-1]]; !ok {
+				break
+			}
+			tokens = tokens[:len(tokens)-1]
+		}
+		return strings.Join(tokens, " ")
+	}
+	for _, name := range []string{
+		"Acme, Inc.", "  AT&T Corp ", "Société Générale", "Zoë\tLabs\vLLC", "O'Reilly Media Holdings Group",
+		"3M Co.", "Ünïcode—Dash Ltd", "Inc", "foo\xffbar",
+	} {
+		if got, want := normalizeCompanyName(name), reference(name); got != want {
+			t.Fatalf("normalizeCompanyName(%q) = %q, want %q", name, got, want)
+		}
+	}
+}
+
+func TestLookupSessionResultByPositionAndScan(t *testing.T) {
+	record := map[string]any{
+		"accepted_jobs": []any{
+			map[string]any{"result_id": "s1:1", "job_url": "https://example.com/1"},
+			map[string]any{"job_url": "https://example.com/2"},
+			map[string]any{"result_id": "custom", "job_url": "https://example.com/3"},
+		},
+	}
+	cases := map[string]string{
+		"s1:1":   "https://example.com/1",
+		"s1:2":   "https://example.com/2",
+		"custom": "https://example.com/3",
+		"s1:3":   "",
+		"s1:9":   "",
+	}
+	for resultID, wantURL := range cases {
+		row := lookupSessionResult(record, "s1", resultID)
+		if got := getString(row, "job_url"); got != wantURL {
+			t.Fatalf("lookup %q: expected %q, got %q", resultID, wantURL, got)
+		}
+		if row != nil && getString(row, "result_id") != resultID {
+			t.Fatalf("lookup %q: expected matching result_id, got %#v", resultID, row["result_id"])
+		}
+	}
+}
+
+func TestStagePagesThroughTiedTimestampsWithoutOverlap(t *testing.T) {
+	rows := make([]map[string]any, 0, 200)
+	for i := 1; i <= 200; i++ {
+		updated := "2026-01-01T00:00:00Z"
+		if i%7 == 0 {
+			updated = "2026-01-02T00:00:00Z"
+		}
+		rows = append(rows, map[string]any{"id": i, "updated_at_utc": updated})
+	}
+	seen := map[int]bool{}
+	for offset := 0; offset < 50; offset += 10 {
+		// Each call pages a fresh copy, like each list_jobs_by_stage call.
+		page := firstNSorted(slices.Clone(rows), offset+10, newestStageUpdateFirst)[offset:]
+		for _, row := range page {
+			id := intOrZero(row["id"])
+			if seen[id] {
+				t.Fatalf("row %d returned on more than one page", id)
+			}
+			seen[id] = true
+		}
+	}
+	if len(seen) != 50 {
+		t.Fatalf("expected 50 distinct rows across five pages, got %d", len(seen))
+	}
+}
+
+func TestUpsertJobListBatchRestoresListsOnStageFailure(t *testing.T) {
+	now := utcNowISO()
+	cases := []struct {
+		name    string
+		store   userListStore
+		itemKey string
+		seed    func() error
+		upsert  func(entry map[string]any, byURL map[string]map[string]any, item, resolved map[string]any) (map[string]any, string)
+		stage   func(pipelineEntry map[string]any, item, resolved, row map[string]any) (int, map[string]any, error)
+	}{
+		{
+			name:    "saved",
+			store:   savedJobsStore,
+			itemKey: "saved_job",
+			seed: func() error {
+				_, err := SaveJobForLater(map[string]any{"user_id": "u1", "job_url": "https://example.com/kept", "note": "original"})
+				return err
+			},
+			upsert: func(entry map[string]any, byURL map[string]map[string]any, item, resolved map[string]any) (map[string]any, string) {
+				return upsertSavedJob(entry, byURL, item, resolved, now)
+			},
+			stage: func(pipelineEntry map[string]any, _, resolved, row map[string]any) (int, map[string]any, error) {
+				return stageSavedJob(pipelineEntry, "u1", resolved, row, "test")
+			},
+		},
+		{
+			name:    "ignored",
+			store:   ignoredJobsStore,
+			itemKey: "ignored_job",
+			seed: func() error {
+				_, err := IgnoreJob(map[string]any{"user_id": "u1", "job_url": "https://example.com/kept", "reason": "original"})
+				return err
+			},
+			upsert: func(entry map[string]any, byURL map[string]map[string]any, item, resolved map[string]any) (map[string]any, string) {
+				return upsertIgnoredJob(entry, byURL, item, resolved, now)
+			},
+			stage: func(pipelineEntry map[string]any, item, resolved, row map[string]any) (int, map[string]any, error) {
+				return stageIgnoredJob(pipelineEntry, "u1", item, resolved, row, "test")
+			},
+		},
+	}
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			setupUserToolPaths(t)
+			if err := tc.seed(); err != nil {
+				t.Fatalf("seeding %s list failed: %v", tc.name, err)
+			}
+			before := getUserList(tc.store.path(), "u1", tc.store.listKey)
+			items := []any{
+				map[string]any{"job_url": "https://example.com/a"},
+				map[string]any{"job_url": "https://example.com/rejected"},
+				map[string]any{"job_url": "https://example.com/kept", "note": "changed", "reason": "changed"},
+				map[string]any{"job_url": "https://example.com/b"},
+			}
+			applied, failed, total, err := upsertJobListBatch(tc.store, "u1", items, tc.itemKey, tc.upsert,
+				func(pipelineEntry map[string]any, item, resolved, row map[string]any) (int, map[string]any, error) {
+					if url := getString(item, "job_url"); strings.HasSuffix(url, "/rejected") || strings.HasSuffix(url, "/kept") {
+						return 0, nil, fmt.Errorf("pipeline rejected %s", url)
+					}
+					return tc.stage(pipelineEntry, item, resolved, row)
+				},
+			)
+			if err != nil {
+				t.Fatalf("upsertJobListBatch failed: %v", err)
+			}
+			if len(applied) != 2 || len(failed) != 2 || intOrZero(failed[0]["index"]) != 1 || intOrZero(failed[1]["index"]) != 2 {
+				t.Fatalf("expected entries 1 and 2 to fail and the rest to apply, got applied=%#v failed=%#v", applied, failed)
+			}
+			jobs := getUserList(tc.store.path(), "u1", tc.store.listKey)
+			if total != 3 || len(jobs) != 3 {
+				t.Fatalf("expected the rejected job to stay out of the list, got total=%d jobs=%#v", total, jobs)
+			}
+			if !reflect.DeepEqual(jobs[0], before[0]) {
+				t.Fatalf("expected the rejected update to restore the existing row, got %#v want %#v", jobs[0], before[0])
+			}
+			for _, raw := range jobs[1:] {
+				if url := getString(mapOrNil(raw), "job_url"); url != "https://example.com/a" && url != "https://example.com/b" {
+					t.Fatalf("unexpected %s row after the batch: %#v", tc.name, raw)
+				}
+			}
+		})
+	}
+}
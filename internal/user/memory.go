@@ -2,103 +2,71 @@ package user
 
 import (
 	"fmt"
-	"slices"
 	"strings"
 )
 
 func loadUserBlob() map[string]any {
-	return loadJSONMap(userBlobPath(), map[string]any{"users": map[string]any{}})
+	return memoryLinesStore.load()
 }
 
 func saveUserBlob(data map[string]any) error {
-	return saveJSONMap(userBlobPath(), data)
+	return memoryLinesStore.save(data)
+}
+
+// memorySearchTextKey holds a line's lowercased text, kind and source,
+// computed when the line is written so queries run one substring check per
+// line. Tool responses leave it out; see memoryLineView.
+const memorySearchTextKey = "search_text"
+
+func memoryLineSearchText(line map[string]any) string {
+	return strings.ToLower(stringFromAny(line["text"]) + " " + stringFromAny(line["kind"]) + " " + stringFromAny(line["source"]))
 }
 
 func normalizeMemoryLine(raw any) (map[string]any, bool) {
-	line := mapOrNil(raw)
-	if line == nil {
-		return nil, false
-	}
-	lineID, ok := intFromAny(line["id"])
-	if !ok || lineID < 1 {
-		return nil, false
+	_, line, ok := newNormalizedRow(raw, memoryLineStringFields, 1)
+	if ok {
+		line[memorySearchTextKey] = memoryLineSearchText(line)
 	}
-	return map[string]any{
-		"id":             lineID,
-		"text":           stringFromAny(line["text"]),
-		"kind":           stringFromAny(line["kind"]),
-		"source":         stringFromAny(line["source"]),
-		"created_at_utc": stringFromAny(line["created_at_utc"]),
-	}, true
+	return line, ok
 }
 
-func normalizeMemoryLines(value any) []map[string]any {
-	raw := listOrEmpty(value)
-	out := make([]map[string]any, 0, len(raw))
-	for _, item := range raw {
-		line, ok := normalizeMemoryLine(item)
-		if ok {
-			out = append(out, line)
+// memoryLineView copies line without its stored search text.
+func memoryLineView(line map[string]any) map[string]any {
+	out := make(map[string]any, len(line))
+	for key, value := range line {
+		if key != memorySearchTextKey {
+			out[key] = value
 		}
 	}
-	slices.SortFunc(out, func(a, b map[string]any) int {
-		ai, _ := intFromAny(a["id"])
-		bi, _ := intFromAny(b["id"])
-		return ai - bi
-	})
 	return out
 }
 
-func ensureUserBlobEntry(data map[string]any, userID string) map[string]any {
-	users := ensureUsersMap(data)
-	entry := mapOrNil(users[userID])
-	if entry == nil {
-		entry = map[string]any{}
-		users[userID] = entry
-	}
-
-	lines := normalizeMemoryLines(entry["lines"])
-	entry["lines"] = lines
+// stripMemorySearchText drops the stored search text from a line the caller
+// loaded privately and returns it, instead of copying it like memoryLineView.
+func stripMemorySearchText(line map[string]any) map[string]any {
+	delete(line, memorySearchTextKey)
+	return line
+}
 
-	maxID := 0
-	for _, line := range lines {
-		if id, ok := intFromAny(line["id"]); ok && id > maxID {
-			maxID = id
-		}
-	}
-	nextID, ok := intFromAny(entry["next_id"])
-	if !ok || nextID < 1 {
-		nextID = 1
-	}
-	if nextID <= maxID {
-		nextID = maxID + 1
-	}
-	entry["next_id"] = nextID
-	return entry
+func ensureUserBlobEntry(data map[string]any, userID string) map[string]any {
+	return memoryLinesStore.ensure(data, userID)
 }
 
 func getUserBlobEntry(data map[string]any, userID string) map[string]any {
-	users := getUsersMap(data)
-	entry := mapOrNil(users[userID])
-	if entry == nil {
-		return nil
-	}
-	lines := normalizeMemoryLines(entry["lines"])
-	entry["lines"] = lines
-	return entry
+	return memoryLinesStore.get(data, userID)
 }
 
 func AddUserMemoryLine(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 	content := getString(args, "content")
 	if content == "" {
 		return nil, fmt.Errorf("content is required")
 	}
 
-	data := loadUserBlob()
+	data := memoryLinesStore.loadUser(userID)
 	entry := ensureUserBlobEntry(data, userID)
 	nextID, _ := intFromAny(entry["next_id"])
 
@@ -109,28 +77,35 @@ func AddUserMemoryLine(args map[string]any) (map[string]any, error) {
 		"source":         getString(args, "source"),
 		"created_at_utc": utcNowISO(),
 	}
-	lines := normalizeMemoryLines(entry["lines"])
+	line[memorySearchTextKey] = memoryLineSearchText(line)
+	lines := entry["lines"].([]map[string]any)
 	lines = append(lines, line)
 	entry["lines"] = lines
 	entry["next_id"] = nextID + 1
 	entry["updated_at_utc"] = line["created_at_utc"]
 
-	if err := saveUserBlob(data); err != nil {
+	if err := appendStoreJournal(userBlobPath(), storeJournalRecord{
+		UserID:       userID,
+		ListKey:      "lines",
+		Item:         line,
+		NextID:       nextID + 1,
+		UpdatedAtUTC: getString(line, "created_at_utc"),
+	}); err != nil {
 		return nil, err
 	}
 
 	return map[string]any{
 		"user_id":     userID,
-		"added_line":  line,
+		"added_line":  memoryLineView(line),
 		"total_lines": len(lines),
 		"path":        userBlobPath(),
 	}, nil
 }
 
 func QueryUserMemoryBlob(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 
 	safeLimit := 50
@@ -161,7 +136,7 @@ func QueryUserMemoryBlob(args map[string]any) (map[string]any, error) {
 	query := getString(args, "query")
 	queryLower := strings.ToLower(query)
 
-	data := loadUserBlob()
+	data := memoryLinesStore.loadUser(userID)
 	entry := getUserBlobEntry(data, userID)
 	if entry == nil {
 		return map[string]any{
@@ -177,45 +152,28 @@ func QueryUserMemoryBlob(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 
-	lines := normalizeMemoryLines(entry["lines"])
-	slices.SortFunc(lines, func(a, b map[string]any) int {
-		ai, _ := intFromAny(a["id"])
-		bi, _ := intFromAny(b["id"])
-		return bi - ai
-	})
-
-	filtered := make([]map[string]any, 0, len(lines))
-	for _, line := range lines {
-		if queryLower == "" {
-			filtered = append(filtered, line)
-			continue
+	// Normalized lines are kept in ascending id order, so walking them
+	// backwards yields newest first without sorting. Only the requested page
+	// is collected; the other matches are just counted.
+	lines := entry["lines"].([]map[string]any)
+	pageAny := make([]any, 0, min(safeLimit, len(lines)))
+	totalMatches := 0
+	for i := len(lines) - 1; i >= 0; i-- {
+		line := lines[i]
+		if queryLower != "" {
+			if haystack, _ := line[memorySearchTextKey].(string); !strings.Contains(haystack, queryLower) {
+				continue
+			}
 		}
-		haystack := strings.ToLower(
-			strings.Join([]string{
-				stringFromAny(line["text"]),
-				stringFromAny(line["kind"]),
-				stringFromAny(line["source"]),
-			}, " "),
-		)
-		if strings.Contains(haystack, queryLower) {
-			filtered = append(filtered, line)
+		if totalMatches >= safeOffset && len(pageAny) < safeLimit {
+			// The page is read from this call's own copy of the store.
+			pageAny = append(pageAny, stripMemorySearchText(line))
 		}
+		totalMatches++
 	}
-
-	totalMatches := len(filtered)
 	if safeOffset > totalMatches {
 		safeOffset = totalMatches
 	}
-	pageEnd := safeOffset + safeLimit
-	if pageEnd > totalMatches {
-		pageEnd = totalMatches
-	}
-	page := filtered[safeOffset:pageEnd]
-
-	pageAny := make([]any, 0, len(page))
-	for _, line := range page {
-		pageAny = append(pageAny, line)
-	}
 
 	return map[string]any{
 		"user_id":        userID,
@@ -224,16 +182,16 @@ func QueryUserMemoryBlob(args map[string]any) (map[string]any, error) {
 		"limit":          safeLimit,
 		"total_lines":    len(lines),
 		"total_matches":  totalMatches,
-		"returned_lines": len(page),
+		"returned_lines": len(pageAny),
 		"lines":          pageAny,
 		"path":           userBlobPath(),
 	}, nil
 }
 
 func DeleteUserMemoryLine(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 
 	lineID, hasLineID, err := getOptionalInt(args, "line_id")
@@ -247,7 +205,7 @@ func DeleteUserMemoryLine(args map[string]any) (map[string]any, error) {
 		return nil, fmt.Errorf("line_id must be a positive integer")
 	}
 
-	data := loadUserBlob()
+	data := memoryLinesStore.loadUser(userID)
 	entry := getUserBlobEntry(data, userID)
 	if entry == nil {
 		return map[string]any{
@@ -260,17 +218,8 @@ func DeleteUserMemoryLine(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 
-	lines := normalizeMemoryLines(entry["lines"])
-	remaining := make([]map[string]any, 0, len(lines))
-	var deletedLine map[string]any
-	for _, line := range lines {
-		currentID, _ := intFromAny(line["id"])
-		if deletedLine == nil && currentID == lineID {
-			deletedLine = line
-			continue
-		}
-		remaining = append(remaining, line)
-	}
+	lines := entry["lines"].([]map[string]any)
+	deletedLine := removeEntryRowByID(entry, "lines", lineID)
 
 	if deletedLine == nil {
 		return map[string]any{
@@ -283,9 +232,17 @@ func DeleteUserMemoryLine(args map[string]any) (map[string]any, error) {
 		}, nil
 	}
 
-	entry["lines"] = remaining
-	entry["updated_at_utc"] = utcNowISO()
-	if err := saveUserBlob(data); err != nil {
+	remaining := entry["lines"].([]map[string]any)
+	now := utcNowISO()
+	entry["updated_at_utc"] = now
+	if err := appendStoreJournal(userBlobPath(), storeJournalRecord{
+		Op:           storeJournalOpDelete,
+		UserID:       userID,
+		ListKey:      "lines",
+		Item:         map[string]any{"id": lineID},
+		NextID:       intOrZero(entry["next_id"]),
+		UpdatedAtUTC: now,
+	}); err != nil {
 		return nil, err
 	}
 
@@ -293,7 +250,7 @@ func DeleteUserMemoryLine(args map[string]any) (map[string]any, error) {
 		"user_id":      userID,
 		"line_id":      lineID,
 		"deleted":      true,
-		"deleted_line": deletedLine,
+		"deleted_line": memoryLineView(deletedLine),
 		"total_lines":  len(remaining),
 		"path":         userBlobPath(),
 	}, nil
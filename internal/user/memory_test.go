@@ -1,6 +1,8 @@
 package user
 
 import (
+	"fmt"
+	"os"
 	"path/filepath"
 	"testing"
 )
@@ -69,6 +71,86 @@ func TestMemoryLifecycle(t *testing.T) {
 	}
 }
 
+func TestQueryUserMemoryBlobPagesNewestFirst(t *testing.T) {
+	t.Setenv("VISA_USER_BLOB_PATH", filepath.Join(t.TempDir(), "user_memory_blob.json"))
+	for i := 1; i <= 5; i++ {
+		kind := "note"
+		if i%2 == 1 {
+			kind = "skills"
+		}
+		if _, err := AddUserMemoryLine(map[string]any{"user_id": "u1", "content": fmt.Sprintf("line %d", i), "kind": kind}); err != nil {
+			t.Fatalf("AddUserMemoryLine failed: %v", err)
+		}
+	}
+
+	result, err := QueryUserMemoryBlob(map[string]any{"user_id": "u1", "query": "SKILLS", "limit": 1, "offset": 1})
+	if err != nil {
+		t.Fatalf("QueryUserMemoryBlob failed: %v", err)
+	}
+	if got, _ := result["total_matches"].(int); got != 3 {
+		t.Fatalf("expected total_matches=3, got %#v", result["total_matches"])
+	}
+	lines, _ := result["lines"].([]any)
+	if len(lines) != 1 || result["returned_lines"] != 1 {
+		t.Fatalf("expected a single line page, got %#v", result)
+	}
+	if id, _ := intFromAny(lines[0].(map[string]any)["id"]); id != 3 {
+		t.Fatalf("expected second-newest match id=3, got %d", id)
+	}
+
+	past, err := QueryUserMemoryBlob(map[string]any{"user_id": "u1", "offset": 10})
+	if err != nil {
+		t.Fatalf("QueryUserMemoryBlob failed: %v", err)
+	}
+	if past["offset"] != 5 || past["returned_lines"] != 0 {
+		t.Fatalf("expected offset clamped to total matches, got %#v", past)
+	}
+}
+
+func TestMemorySearchTextIsStoredButNotReturned(t *testing.T) {
+	blobPath := filepath.Join(t.TempDir(), "user_memory_blob.json")
+	t.Setenv("VISA_USER_BLOB_PATH", blobPath)
+	// A line written before search text existed is backfilled on load.
+	legacy := map[string]any{"users": map[string]any{"u1": map[string]any{
+		"lines":              []any{map[string]any{"id": 1, "text": "Prefers Remote", "kind": "Constraint"}},
+		"next_id":            2,
+		normalizedRowsKey:    1,
+		normalizedVersionKey: listRowSchemaVersion - 1,
+	}}}
+	if err := saveJSONMap(blobPath, legacy); err != nil {
+		t.Fatalf("saveJSONMap failed: %v", err)
+	}
+	added, err := AddUserMemoryLine(map[string]any{"user_id": "u1", "content": "Knows Go", "source": "Resume"})
+	if err != nil {
+		t.Fatalf("AddUserMemoryLine failed: %v", err)
+	}
+	if _, ok := added["added_line"].(map[string]any)[memorySearchTextKey]; ok {
+		t.Fatalf("expected added_line without search text, got %#v", added["added_line"])
+	}
+
+	// Run the queries twice: stripping search text from one call's results
+	// must not affect the store the next call loads.
+	for round := 0; round < 2; round++ {
+		for query, wantID := range map[string]int{"remote constraint": 1, "knows go": 2} {
+			result, err := QueryUserMemoryBlob(map[string]any{"user_id": "u1", "query": query})
+			if err != nil {
+				t.Fatalf("QueryUserMemoryBlob failed: %v", err)
+			}
+			lines, _ := result["lines"].([]any)
+			if len(lines) != 1 {
+				t.Fatalf("expected one match for %q, got %#v", query, result["lines"])
+			}
+			line := lines[0].(map[string]any)
+			if id, _ := intFromAny(line["id"]); id != wantID {
+				t.Fatalf("expected line %d for %q, got %#v", wantID, query, line)
+			}
+			if _, ok := line[memorySearchTextKey]; ok {
+				t.Fatalf("expected query results without search text, got %#v", line)
+			}
+		}
+	}
+}
+
 func TestDeleteUserMemoryLineValidation(t *testing.T) {
 	blobPath := filepath.Join(t.TempDir(), "user_memory_blob.json")
 	t.Setenv("VISA_USER_BLOB_PATH", blobPath)
@@ -80,3 +162,104 @@ func TestDeleteUserMemoryLineValidation(t *testing.T) {
 		t.Fatal("expected error for non-positive line_id")
 	}
 }
+
+func TestMemoryLinesAppendToJournalUntilFullSave(t *testing.T) {
+	blobPath := filepath.Join(t.TempDir(), "user_memory_blob.json")
+	t.Setenv("VISA_USER_BLOB_PATH", blobPath)
+
+	for _, content := range []string{"Prefers remote roles", "Open to relocation"} {
+		if _, err := AddUserMemoryLine(map[string]any{"user_id": "u1", "content": content}); err != nil {
+			t.Fatalf("AddUserMemoryLine failed: %v", err)
+		}
+	}
+	if _, err := os.Stat(storeJournalPath(blobPath)); err != nil {
+		t.Fatalf("expected appended lines in journal: %v", err)
+	}
+	entry := getUserBlobEntry(loadUserBlob(), "u1")
+	if got := len(entry["lines"].([]map[string]any)); got != 2 {
+		t.Fatalf("expected 2 lines after journal replay, got %d", got)
+	}
+
+	if _, err := DeleteUserMemoryLine(map[string]any{"user_id": "u1", "line_id": 1}); err != nil {
+		t.Fatalf("DeleteUserMemoryLine failed: %v", err)
+	}
+	entry = getUserBlobEntry(loadUserBlob(), "u1")
+	if got := len(entry["lines"].([]map[string]any)); got != 1 {
+		t.Fatalf("expected journaled delete to drop a line, got %d", got)
+	}
+	if err := saveUserBlob(loadUserBlob()); err != nil {
+		t.Fatalf("saveUserBlob failed: %v", err)
+	}
+	if _, err := os.Stat(storeJournalPath(blobPath)); !os.IsNotExist(err) {
+		t.Fatalf("expected full save to fold the journal away, got %v", err)
+	}
+	entry = getUserBlobEntry(loadUserBlob(), "u1")
+	if got := len(entry["lines"].([]map[string]any)); got != 1 {
+		t.Fatalf("expected 1 line after delete, got %d", got)
+	}
+}
+
+func TestNormalizeEntryListOnlyNormalizesUntrustedRows(t *testing.T) {
+	entry := map[string]any{
+		"lines": []any{
+			map[string]any{"id": 1, "text": "trusted", "raw": true},
+			map[string]any{"id": 3, "text": "appended", "raw": true},
+			map[string]any{"id": 2, "text": "out of order"},
+		},
+		normalizedRowsKey:    1,
+		normalizedVersionKey: listRowSchemaVersion,
+	}
+	lines, maxID := normalizeEntryList(entry, "lines", normalizeMemoryLine)
+	if len(lines) != 3 || maxID != 3 {
+		t.Fatalf("expected 3 lines, got %#v", lines)
+	}
+	if lines[0]["raw"] != true {
+		t.Fatalf("expected trusted row to be kept as-is, got %#v", lines[0])
+	}
+	if ids := []int{intOrZero(lines[1]["id"]), intOrZero(lines[2]["id"])}; ids[0] != 2 || ids[1] != 3 {
+		t.Fatalf("expected rows sorted by id, got %v", ids)
+	}
+	if _, ok := lines[2]["raw"]; ok || lines[2]["text"] != "appended" {
+		t.Fatalf("expected appended row to be normalized, got %#v", lines[2])
+	}
+	if count, _ := intFromAny(entry[normalizedRowsKey]); count != 3 {
+		t.Fatalf("expected normalized row count 3, got %v", entry[normalizedRowsKey])
+	}
+}
+
+func TestRemoveEntryRowByID(t *testing.T) {
+	entry := map[string]any{
+		"jobs":            []map[string]any{{"id": 1}, {"id": 4}, {"id": 7}},
+		normalizedRowsKey: 3,
+	}
+	removed := removeEntryRowByID(entry, "jobs", 4)
+	if removed == nil || intOrZero(removed["id"]) != 4 {
+		t.Fatalf("expected row 4 to be removed, got %#v", removed)
+	}
+	remaining := entry["jobs"].([]map[string]any)
+	if len(remaining) != 2 || intOrZero(remaining[0]["id"]) != 1 || intOrZero(remaining[1]["id"]) != 7 {
+		t.Fatalf("unexpected remaining rows: %#v", remaining)
+	}
+	if count := intOrZero(entry[normalizedRowsKey]); count != 2 {
+		t.Fatalf("expected normalized row count to follow the delete, got %d", count)
+	}
+	if missing := removeEntryRowByID(entry, "jobs", 5); missing != nil || len(entry["jobs"].([]map[string]any)) != 2 {
+		t.Fatalf("expected missing id to leave rows untouched, got %#v", missing)
+	}
+}
+
+func TestNormalizeEntryListRenormalizesOtherSchemaVersions(t *testing.T) {
+	entry := map[string]any{
+		"lines":              []any{map[string]any{"id": 1, "text": "old", "raw": true}},
+		normalizedRowsKey:    1,
+		normalizedVersionKey: listRowSchemaVersion - 1,
+	}
+	lines, _ := normalizeEntryList(entry, "lines", normalizeMemoryLine)
+	if _, ok := lines[0]["raw"]; ok {
+		t.Fatalf("expected rows from an older schema to be normalized, got %#v", lines[0])
+	}
+	again, maxID := normalizeEntryList(entry, "lines", normalizeMemoryLine)
+	if maxID != 1 || &again[0] != &lines[0] {
+		t.Fatalf("expected normalized entry to be returned as-is, got %#v", again)
+	}
+}
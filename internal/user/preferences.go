@@ -4,10 +4,10 @@ import (
 	"encoding/json"
 	"fmt"
 	"os"
-	"path/filepath"
 	"slices"
 	"strconv"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -47,37 +47,115 @@ func prefsPath() string {
 	return defaultUserPrefsPath
 }
 
-func loadPrefs() (map[string]map[string]any, error) {
+type prefsCacheEntry struct {
+	Stamp storeFileStamp
+	Data  map[string]map[string]any
+}
+
+// prefsCache keeps the last parsed prefs store per path until the file
+// changes, so read-mostly tools skip re-parsing it on every call.
+var (
+	prefsCacheMu sync.Mutex
+	prefsCache   = map[string]prefsCacheEntry{}
+)
+
+// cachedPrefs returns the shared parsed prefs store; callers must not modify
+// it. Use loadPrefs for a private copy.
+func cachedPrefs() (map[string]map[string]any, error) {
 	path := prefsPath()
-	raw, err := os.ReadFile(path)
+	file, err := os.Open(path)
 	if err != nil {
 		if os.IsNotExist(err) {
 			return map[string]map[string]any{}, nil
 		}
 		return nil, err
 	}
+	defer file.Close()
+	var stamp storeFileStamp
+	if info, err := file.Stat(); err == nil {
+		stamp = fileStamp(info)
+		prefsCacheMu.Lock()
+		cached, ok := prefsCache[path]
+		prefsCacheMu.Unlock()
+		if ok && cached.Stamp.matches(stamp) {
+			return cached.Data, nil
+		}
+	}
+
 	var parsed map[string]map[string]any
-	if err := json.Unmarshal(raw, &parsed); err != nil {
+	reader := acquireStoreReader(file)
+	defer releaseStoreReader(reader)
+	if err := json.NewDecoder(reader).Decode(&parsed); err != nil {
 		return map[string]map[string]any{}, nil
 	}
 	if parsed == nil {
-		return map[string]map[string]any{}, nil
+		parsed = map[string]map[string]any{}
+	}
+	if !stamp.ModTime.IsZero() {
+		prefsCacheMu.Lock()
+		prefsCache[path] = prefsCacheEntry{Stamp: stamp, Data: parsed}
+		prefsCacheMu.Unlock()
 	}
 	return parsed, nil
 }
 
-func savePrefs(data map[string]map[string]any) error {
-	path := prefsPath()
-	if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
-		return err
+// loadPrefs returns a private copy of the prefs store for callers that modify
+// and save it.
+func loadPrefs() (map[string]map[string]any, error) {
+	prefs, err := cachedPrefs()
+	if err != nil {
+		return nil, err
 	}
-	raw, err := json.MarshalIndent(data, "", "  ")
+	return clonePrefs(prefs), nil
+}
+
+// loadUserPrefs returns a private copy of one user's preferences, or nil when
+// the user has none.
+func loadUserPrefs(userID string) (map[string]any, error) {
+	prefs, err := cachedPrefs()
 	if err != nil {
-		return err
+		return nil, err
+	}
+	user, _ := cloneJSONValue(prefs[userID]).(map[string]any)
+	return user, nil
+}
+
+func clonePrefs(prefs map[string]map[string]any) map[string]map[string]any {
+	out := make(map[string]map[string]any, len(prefs))
+	for userID, user := range prefs {
+		out[userID], _ = cloneJSONValue(user).(map[string]any)
 	}
-	return os.WriteFile(path, raw, 0o644)
+	return out
+}
+
+func savePrefs(data map[string]map[string]any) error {
+	path := prefsPath()
+	err := encodeJSONFile(path, data, true)
+	prefsCacheMu.Lock()
+	if err == nil {
+		prefsCache[path] = prefsCacheEntry{Stamp: statStoreFile(path), Data: clonePrefs(data)}
+	} else {
+		delete(prefsCache, path)
+	}
+	prefsCacheMu.Unlock()
+	userVisaTypesCacheMu.Lock()
+	clear(userVisaTypesCache)
+	userVisaTypesCacheMu.Unlock()
+	return err
+}
+
+type userVisaTypesCacheEntry struct {
+	Prefs     storeFileStamp
+	VisaTypes []string
 }
 
+// userVisaTypesCache memoizes each user's normalized visa types until the
+// prefs file changes, so every search skips re-parsing the prefs store.
+var (
+	userVisaTypesCacheMu sync.Mutex
+	userVisaTypesCache   = map[string]userVisaTypesCacheEntry{}
+)
+
 func getString(args map[string]any, key string) string {
 	value, ok := args[key]
 	if !ok || value == nil {
@@ -171,7 +249,13 @@ func getOptionalBool(args map[string]any, key string) (bool, bool, error) {
 	}
 }
 
+// normalizeVisaType maps a visa type alias to its canonical key. Stored
+// preferences are already canonical, so an exact alias hit skips the case
+// fold.
 func normalizeVisaType(value string) (string, error) {
+	if normalized, ok := visaTypeAliases[value]; ok {
+		return normalized, nil
+	}
 	key := strings.ToLower(strings.TrimSpace(value))
 	normalized, ok := visaTypeAliases[key]
 	if !ok {
@@ -188,8 +272,42 @@ func normalizeWorkMode(value string) (string, error) {
 	return mode, nil
 }
 
+// normalizeStringSet normalizes values and returns them sorted without
+// duplicates. Inputs are a handful of items, so sorting and compacting the
+// slice beats building a set; stored values are usually already sorted.
+func normalizeStringSet(values []string, normalize func(string) (string, error)) ([]string, error) {
+	out := make([]string, 0, len(values))
+	for _, value := range values {
+		normalized, err := normalize(value)
+		if err != nil {
+			return nil, err
+		}
+		out = append(out, normalized)
+	}
+	if !slices.IsSorted(out) {
+		slices.Sort(out)
+	}
+	return slices.Compact(out), nil
+}
+
+var (
+	nowISOMu     sync.Mutex
+	nowISOSecond int64
+	nowISOText   string
+)
+
+// utcNowISO returns the current UTC time at second precision. The formatted
+// string is cached per wall-clock second since store writes call this many
+// times within a single tool call.
 func utcNowISO() string {
-	return time.Now().UTC().Truncate(time.Second).Format(time.RFC3339)
+	sec := time.Now().Unix()
+	nowISOMu.Lock()
+	defer nowISOMu.Unlock()
+	if sec != nowISOSecond || nowISOText == "" {
+		nowISOSecond = sec
+		nowISOText = time.Unix(sec, 0).UTC().Format(time.RFC3339)
+	}
+	return nowISOText
 }
 
 func asMap(value any) map[string]any {
@@ -200,24 +318,14 @@ func asMap(value any) map[string]any {
 }
 
 func SetUserPreferences(args map[string]any) (map[string]any, error) {
-	uid := getString(args, "user_id")
-	if uid == "" {
-		return nil, fmt.Errorf("user_id is required")
-	}
-	visaTypes := getStringList(args, "preferred_visa_types")
-	normalizedSet := map[string]struct{}{}
-	for _, value := range visaTypes {
-		normalized, err := normalizeVisaType(value)
-		if err != nil {
-			return nil, err
-		}
-		normalizedSet[normalized] = struct{}{}
+	uid, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
-	normalizedTypes := make([]string, 0, len(normalizedSet))
-	for value := range normalizedSet {
-		normalizedTypes = append(normalizedTypes, value)
+	normalizedTypes, err := normalizeStringSet(getStringList(args, "preferred_visa_types"), normalizeVisaType)
+	if err != nil {
+		return nil, err
 	}
-	slices.Sort(normalizedTypes)
 
 	prefs, err := loadPrefs()
 	if err != nil {
@@ -241,9 +349,9 @@ func SetUserPreferences(args map[string]any) (map[string]any, error) {
 }
 
 func SetUserConstraints(args map[string]any) (map[string]any, error) {
-	uid := getString(args, "user_id")
-	if uid == "" {
-		return nil, fmt.Errorf("user_id is required")
+	uid, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 
 	prefs, err := loadPrefs()
@@ -268,20 +376,10 @@ func SetUserConstraints(args map[string]any) (map[string]any, error) {
 	}
 
 	if hasKey(args, "work_modes") {
-		modes := getStringList(args, "work_modes")
-		normalizedSet := map[string]struct{}{}
-		for _, mode := range modes {
-			normalized, err := normalizeWorkMode(mode)
-			if err != nil {
-				return nil, err
-			}
-			normalizedSet[normalized] = struct{}{}
-		}
-		normalizedModes := make([]string, 0, len(normalizedSet))
-		for mode := range normalizedSet {
-			normalizedModes = append(normalizedModes, mode)
+		normalizedModes, err := normalizeStringSet(getStringList(args, "work_modes"), normalizeWorkMode)
+		if err != nil {
+			return nil, err
 		}
-		slices.Sort(normalizedModes)
 		constraints["work_modes"] = normalizedModes
 	}
 
@@ -307,15 +405,14 @@ func SetUserConstraints(args map[string]any) (map[string]any, error) {
 }
 
 func GetUserPreferences(args map[string]any) (map[string]any, error) {
-	uid := getString(args, "user_id")
-	if uid == "" {
-		return nil, fmt.Errorf("user_id is required")
+	uid, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
-	prefs, err := loadPrefs()
+	user, err := loadUserPrefs(uid)
 	if err != nil {
 		return nil, err
 	}
-	user := prefs[uid]
 	if user == nil {
 		user = map[string]any{}
 	}
@@ -346,30 +443,27 @@ func getOptionalUserVisaTypes(userID string) ([]string, error) {
 	if uid == "" {
 		return nil, nil
 	}
-	prefs, err := loadPrefs()
+	path := prefsPath()
+	cacheKey := path + "\x00" + uid
+	stamp := statStoreFile(path)
+	userVisaTypesCacheMu.Lock()
+	cached, ok := userVisaTypesCache[cacheKey]
+	userVisaTypesCacheMu.Unlock()
+	if ok && cached.Prefs.matches(stamp) {
+		return slices.Clone(cached.VisaTypes), nil
+	}
+
+	prefs, err := cachedPrefs()
 	if err != nil {
 		return nil, err
 	}
-	user := prefs[uid]
-	if user == nil {
-		return []string{}, nil
-	}
-	rawTypes := getStringList(user, "preferred_visa_types")
-	if len(rawTypes) == 0 {
-		return []string{}, nil
-	}
-	normalizedSet := map[string]struct{}{}
-	for _, raw := range rawTypes {
-		normalized, err := normalizeVisaType(raw)
-		if err != nil {
-			return nil, err
-		}
-		normalizedSet[normalized] = struct{}{}
-	}
-	normalized := make([]string, 0, len(normalizedSet))
-	for key := range normalizedSet {
-		normalized = append(normalized, key)
+	normalized, err := normalizeStringSet(getStringList(prefs[uid], "preferred_visa_types"), normalizeVisaType)
+	if err != nil {
+		return nil, err
 	}
-	slices.Sort(normalized)
-	return normalized, nil
+
+	userVisaTypesCacheMu.Lock()
+	userVisaTypesCache[cacheKey] = userVisaTypesCacheEntry{Prefs: stamp, VisaTypes: normalized}
+	userVisaTypesCacheMu.Unlock()
+	return slices.Clone(normalized), nil
 }
@@ -150,3 +150,78 @@ func TestGetUserReadiness(t *testing.T) {
 		t.Fatalf("expected is_stale=false, got true with freshness=%#v", freshness)
 	}
 }
+
+func TestUTCNowISOFormat(t *testing.T) {
+	first := utcNowISO()
+	parsed, err := time.Parse(time.RFC3339, first)
+	if err != nil {
+		t.Fatalf("expected RFC3339 timestamp, got %q: %v", first, err)
+	}
+	if parsed.Nanosecond() != 0 {
+		t.Fatalf("expected second precision, got %q", first)
+	}
+	if delta := time.Since(parsed); delta < 0 || delta > 2*time.Second {
+		t.Fatalf("expected current timestamp, got %q", first)
+	}
+}
+
+func TestOptionalUserVisaTypesFollowPrefsChanges(t *testing.T) {
+	t.Setenv("VISA_USER_PREFS_PATH", filepath.Join(t.TempDir(), "prefs.json"))
+	if _, err := SetUserPreferences(map[string]any{"user_id": "u1", "preferred_visa_types": []any{"h1b"}}); err != nil {
+		t.Fatalf("SetUserPreferences returned error: %v", err)
+	}
+	first, err := getOptionalUserVisaTypes("u1")
+	if err != nil || len(first) != 1 || first[0] != "h1b" {
+		t.Fatalf("unexpected visa types: %v %v", first, err)
+	}
+	first[0] = "mutated"
+	if again, _ := getOptionalUserVisaTypes("u1"); again[0] != "h1b" {
+		t.Fatalf("expected cached visa types to be copied, got %v", again)
+	}
+	if _, err := SetUserPreferences(map[string]any{"user_id": "u1", "preferred_visa_types": []any{"E-3", "h1b"}}); err != nil {
+		t.Fatalf("SetUserPreferences returned error: %v", err)
+	}
+	if updated, _ := getOptionalUserVisaTypes("u1"); len(updated) != 2 {
+		t.Fatalf("expected updated visa types after save, got %v", updated)
+	}
+}
+
+func TestCachedPrefsCopiesAndFollowsExternalEdits(t *testing.T) {
+	prefsFile := filepath.Join(t.TempDir(), "prefs.json")
+	t.Setenv("VISA_USER_PREFS_PATH", prefsFile)
+	if _, err := SetUserPreferences(map[string]any{"user_id": "u1", "preferred_visa_types": []any{"h1b"}}); err != nil {
+		t.Fatalf("SetUserPreferences returned error: %v", err)
+	}
+
+	payload, err := GetUserPreferences(map[string]any{"user_id": "u1"})
+	if err != nil {
+		t.Fatalf("GetUserPreferences returned error: %v", err)
+	}
+	payload["preferences"].(map[string]any)["preferred_visa_types"] = []any{"mutated"}
+	prefs, err := loadPrefs()
+	if err != nil {
+		t.Fatalf("loadPrefs returned error: %v", err)
+	}
+	if got := getStringList(prefs["u1"], "preferred_visa_types"); len(got) != 1 || got[0] != "h1b" {
+		t.Fatalf("expected cached prefs to be isolated from callers, got %v", got)
+	}
+
+	raw := []byte(`{"u1": {"preferred_visa_types": ["e3_australian"]}, "u2": {}}`)
+	if err := os.WriteFile(prefsFile, raw, 0o644); err != nil {
+		t.Fatalf("write prefs: %v", err)
+	}
+	future := time.Now().Add(time.Minute)
+	if err := os.Chtimes(prefsFile, future, future); err != nil {
+		t.Fatalf("chtimes prefs: %v", err)
+	}
+	user, err := loadUserPrefs("u1")
+	if err != nil {
+		t.Fatalf("loadUserPrefs returned error: %v", err)
+	}
+	if got := getStringList(user, "preferred_visa_types"); len(got) != 1 || got[0] != "e3_australian" {
+		t.Fatalf("expected prefs reloaded after external edit, got %v", got)
+	}
+	if missing, _ := loadUserPrefs("nobody"); missing != nil {
+		t.Fatalf("expected nil prefs for unknown user, got %v", missing)
+	}
+}
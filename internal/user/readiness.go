@@ -1,9 +1,9 @@
 package user
 
 import (
-	"encoding/json"
 	"os"
 	"strings"
+	"sync"
 	"time"
 )
 
@@ -19,6 +19,11 @@ const (
 	defaultJobDBPath            = "data/app/visa_jobs.db"
 )
 
+const (
+	datasetStaleAfterDays    = 30
+	datasetStaleAfterSeconds = datasetStaleAfterDays * 86400
+)
+
 func envOrDefault(name, fallback string) string {
 	if value := os.Getenv(name); value != "" {
 		return value
@@ -26,36 +31,70 @@ func envOrDefault(name, fallback string) string {
 	return fallback
 }
 
+// parseManifestTime reads only run_at_utc from the pipeline manifest; the
+// decoder skips the other fields instead of building a map for them.
 func parseManifestTime(path string) time.Time {
-	raw, err := os.ReadFile(path)
-	if err != nil {
-		return time.Time{}
+	var manifest struct {
+		RunAtUTC string `json:"run_at_utc"`
 	}
-	var parsed map[string]any
-	if err := json.Unmarshal(raw, &parsed); err != nil {
+	if err := decodeJSONFile(path, &manifest); err != nil || manifest.RunAtUTC == "" {
 		return time.Time{}
 	}
-	text, ok := parsed["run_at_utc"].(string)
-	if !ok || text == "" {
-		return time.Time{}
-	}
-	t, err := time.Parse(time.RFC3339, text)
+	t, err := time.Parse(time.RFC3339, manifest.RunAtUTC)
 	if err != nil {
 		return time.Time{}
 	}
 	return t.UTC()
 }
 
-func datasetFreshness(datasetPath, manifestPath string) map[string]any {
-	now := time.Now().UTC()
-	manifestTime := parseManifestTime(manifestPath)
+type manifestTimeCacheEntry struct {
+	Manifest storeFileStamp
+	RunAt    time.Time
+}
+
+// manifestTimeCache keeps each manifest's parsed run time until the pipeline
+// rewrites the file. Freshness itself depends on the current time, so only
+// the parse is cached.
+var (
+	manifestTimeCacheMu sync.Mutex
+	manifestTimeCache   = map[string]manifestTimeCacheEntry{}
+)
+
+func cachedManifestTime(path string) time.Time {
+	stamp := statStoreFile(path)
+	if stamp.ModTime.IsZero() {
+		return time.Time{}
+	}
+	manifestTimeCacheMu.Lock()
+	cached, ok := manifestTimeCache[path]
+	manifestTimeCacheMu.Unlock()
+	if ok && cached.Manifest.matches(stamp) {
+		return cached.RunAt
+	}
+
+	runAt := parseManifestTime(path)
+	manifestTimeCacheMu.Lock()
+	manifestTimeCache[path] = manifestTimeCacheEntry{Manifest: stamp, RunAt: runAt}
+	manifestTimeCacheMu.Unlock()
+	return runAt
+}
 
+func datasetFreshness(datasetPath, manifestPath string) map[string]any {
 	datasetExists := false
 	var fileTime time.Time
 	if info, err := os.Stat(datasetPath); err == nil {
 		datasetExists = true
 		fileTime = info.ModTime().UTC()
 	}
+	return datasetFreshnessAt(datasetPath, manifestPath, datasetExists, fileTime)
+}
+
+// datasetFreshnessAt reports freshness for a dataset whose existence and
+// modification time the caller already knows, e.g. from loading it, so the
+// file is not stat'ed a second time.
+func datasetFreshnessAt(datasetPath, manifestPath string, datasetExists bool, fileTime time.Time) map[string]any {
+	now := time.Now().UTC()
+	manifestTime := cachedManifestTime(manifestPath)
 
 	refTime := manifestTime
 	source := "manifest"
@@ -77,7 +116,7 @@ func datasetFreshness(datasetPath, manifestPath string) map[string]any {
 		}
 		ageSeconds = seconds
 		daysSinceRefresh = seconds / 86400.0
-		isStale = (seconds / 86400.0) >= 30.0
+		isStale = seconds >= datasetStaleAfterSeconds
 	}
 
 	lastUpdated := any(nil)
@@ -98,7 +137,7 @@ func datasetFreshness(datasetPath, manifestPath string) map[string]any {
 		"dataset_last_updated_at_utc":     lastUpdated,
 		"days_since_refresh":              daysSinceRefresh,
 		"age_seconds":                     ageSeconds,
-		"stale_after_days":                30,
+		"stale_after_days":                datasetStaleAfterDays,
 		"is_stale":                        isStale,
 		"source":                          source,
 		"manifest_output_matches_dataset": false,
@@ -106,9 +145,9 @@ func datasetFreshness(datasetPath, manifestPath string) map[string]any {
 }
 
 func GetUserReadiness(args map[string]any) (map[string]any, error) {
-	uid := getString(args, "user_id")
-	if uid == "" {
-		return nil, errRequired("user_id")
+	uid, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
 
 	datasetPath := datasetPathOrDefault(getString(args, "dataset_path"))
@@ -117,11 +156,37 @@ func GetUserReadiness(args map[string]any) (map[string]any, error) {
 		manifestPath = envOrDefault("VISA_DOL_MANIFEST_PATH", defaultManifestPath)
 	}
 
-	prefs, err := loadPrefs()
-	if err != nil {
-		return nil, err
+	// Each count comes from its own store file; read them concurrently so a
+	// cold call waits on the slowest file rather than the sum of them.
+	var (
+		user                  map[string]any
+		prefsErr              error
+		memoryLinesCount      int
+		savedJobsCount        int
+		ignoredJobsCount      int
+		ignoredCompaniesCount int
+		activeSearchRunsCount int
+		freshness             map[string]any
+		wg                    sync.WaitGroup
+	)
+	load := func(fn func()) {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			fn()
+		}()
+	}
+	load(func() { user, prefsErr = loadUserPrefs(uid) })
+	load(func() { memoryLinesCount = len(getUserList(userBlobPath(), uid, "lines")) })
+	load(func() { savedJobsCount = len(getUserList(savedJobsPath(), uid, "jobs")) })
+	load(func() { ignoredJobsCount = len(getUserList(ignoredJobsPath(), uid, "jobs")) })
+	load(func() { ignoredCompaniesCount = len(getUserList(ignoredCompaniesPath(), uid, "companies")) })
+	load(func() { activeSearchRunsCount = countActiveSearchRuns(uid) })
+	load(func() { freshness = datasetFreshness(datasetPath, manifestPath) })
+	wg.Wait()
+	if prefsErr != nil {
+		return nil, prefsErr
 	}
-	user := prefs[uid]
 	if user == nil {
 		user = map[string]any{}
 	}
@@ -142,34 +207,9 @@ func GetUserReadiness(args map[string]any) (map[string]any, error) {
 	}
 	hasPreferences := len(preferredVisaTypes) > 0
 	constraints := asMap(user["constraints"])
-	memoryLinesCount := len(getUserList(userBlobPath(), uid, "lines"))
-	savedJobsCount := len(getUserList(savedJobsPath(), uid, "jobs"))
-	ignoredJobsCount := len(getUserList(ignoredJobsPath(), uid, "jobs"))
-	ignoredCompaniesCount := len(getUserList(ignoredCompaniesPath(), uid, "companies"))
-
-	activeSearchRunsCount := 0
-	runs := mapOrNil(loadSearchRuns()["runs"])
-	for _, runAny := range runs {
-		run := mapOrNil(runAny)
-		if run == nil {
-			continue
-		}
-		query := mapOrNil(run["query"])
-		if query == nil || getString(query, "user_id") != uid {
-			continue
-		}
-		status := strings.ToLower(getString(run, "status"))
-		if status == "pending" || status == "running" || status == "cancelling" {
-			activeSearchRunsCount++
-		}
-	}
 
-	datasetExists := false
-	if _, err := os.Stat(datasetPath); err == nil {
-		datasetExists = true
-	}
-
-	freshness := datasetFreshness(datasetPath, manifestPath)
+	// datasetFreshness already stats the dataset; reuse its answer.
+	datasetExists, _ := freshness["dataset_exists"].(bool)
 
 	nextActions := []string{}
 	if !hasPreferences {
@@ -182,18 +222,11 @@ func GetUserReadiness(args map[string]any) (map[string]any, error) {
 		nextActions = append(nextActions, "Dataset may be stale; refresh data/companies.csv via pipeline.")
 	}
 
-	stageCounts := map[string]int{
-		"new": 0, "saved": 0, "applied": 0, "interview": 0, "offer": 0, "rejected": 0, "ignored": 0,
-	}
-	pipeline := getPipelineEntry(loadJobPipeline(), uid)
-	if pipeline != nil {
-		for _, app := range pipeline["applications"].([]map[string]any) {
-			stage := getString(app, "stage")
-			if _, ok := stageCounts[stage]; ok {
-				stageCounts[stage]++
-			}
-		}
-	}
+	stageCounts := countJobStages(getPipelineEntry(loadJobPipelineUser(uid), uid))
+
+	paths := userStorePaths(2)
+	paths["dataset_path"] = datasetPath
+	paths["manifest_path"] = manifestPath
 
 	return map[string]any{
 		"user_id": uid,
@@ -214,21 +247,79 @@ func GetUserReadiness(args map[string]any) (map[string]any, error) {
 			"applied_jobs_count":       0,
 		},
 		"dataset_freshness": freshness,
-		"paths": map[string]any{
-			"dataset_path":           datasetPath,
-			"manifest_path":          manifestPath,
-			"preferences_path":       prefsPath(),
-			"memory_blob_path":       userBlobPath(),
-			"saved_jobs_path":        savedJobsPath(),
-			"ignored_jobs_path":      ignoredJobsPath(),
-			"ignored_companies_path": ignoredCompaniesPath(),
-			"search_runs_path":       searchRunsPath(),
-			"job_db_path":            jobDBPath(),
-		},
-		"next_actions": nextActions,
+		"paths":             paths,
+		"next_actions":      nextActions,
 	}, nil
 }
 
+type searchRunsByUserCacheEntry struct {
+	Store storeFileStamp
+	Runs  map[string]map[string]string
+}
+
+// searchRunsByUserCache indexes the runs store as user_id -> run_id ->
+// lowercased status until the file changes, so readiness counts only the
+// caller's runs instead of copying and scanning every user's.
+var (
+	searchRunsByUserCacheMu sync.Mutex
+	searchRunsByUserCache   = map[string]searchRunsByUserCacheEntry{}
+)
+
+func searchRunsByUser() map[string]map[string]string {
+	path := searchRunsPath()
+	stamp := statStoreFile(path)
+	searchRunsByUserCacheMu.Lock()
+	cached, ok := searchRunsByUserCache[path]
+	searchRunsByUserCacheMu.Unlock()
+	if ok && cached.Store.matches(stamp) {
+		return cached.Runs
+	}
+
+	index := map[string]map[string]string{}
+	for runID, runAny := range mapOrNil(loadSearchRuns()["runs"]) {
+		run := mapOrNil(runAny)
+		if run == nil {
+			continue
+		}
+		query := mapOrNil(run["query"])
+		if query == nil {
+			continue
+		}
+		userID := getString(query, "user_id")
+		if index[userID] == nil {
+			index[userID] = map[string]string{}
+		}
+		index[userID][runID] = strings.ToLower(getString(run, "status"))
+	}
+
+	searchRunsByUserCacheMu.Lock()
+	searchRunsByUserCache[path] = searchRunsByUserCacheEntry{Store: stamp, Runs: index}
+	searchRunsByUserCacheMu.Unlock()
+	return index
+}
+
+var activeSearchRunStatuses = map[string]struct{}{"pending": {}, "running": {}, "cancelling": {}}
+
+func countActiveSearchRuns(userID string) int {
+	count := 0
+	for _, status := range searchRunsByUser()[userID] {
+		if _, ok := activeSearchRunStatuses[status]; ok {
+			count++
+		}
+	}
+	return count
+}
+
+// requireUserID returns the trimmed user_id argument, which every user-scoped
+// tool requires.
+func requireUserID(args map[string]any) (string, error) {
+	userID := getString(args, "user_id")
+	if userID == "" {
+		return "", errRequired("user_id")
+	}
+	return userID, nil
+}
+
 func errRequired(name string) error {
 	return &requiredFieldError{name: name}
 }
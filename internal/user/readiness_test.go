@@ -0,0 +1,61 @@
+package user
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+func TestCountActiveSearchRunsFollowsRunsStore(t *testing.T) {
+	runsFile := filepath.Join(t.TempDir(), "runs.json")
+	t.Setenv("VISA_SEARCH_RUNS_PATH", runsFile)
+	if err := saveSearchRuns(map[string]any{"runs": map[string]any{
+		"r1": map[string]any{"status": "running", "query": map[string]any{"user_id": "u1"}},
+		"r2": map[string]any{"status": "Completed", "query": map[string]any{"user_id": "u1"}},
+		"r3": map[string]any{"status": "pending", "query": map[string]any{"user_id": "u2"}},
+	}}); err != nil {
+		t.Fatalf("saveSearchRuns returned error: %v", err)
+	}
+	if got := countActiveSearchRuns("u1"); got != 1 {
+		t.Fatalf("expected 1 active run for u1, got %d", got)
+	}
+
+	if err := saveSearchRuns(map[string]any{"runs": map[string]any{
+		"r1": map[string]any{"status": "cancelling", "query": map[string]any{"user_id": "u1"}},
+		"r4": map[string]any{"status": "pending", "query": map[string]any{"user_id": "u1"}},
+	}}); err != nil {
+		t.Fatalf("saveSearchRuns returned error: %v", err)
+	}
+	if got := countActiveSearchRuns("u1"); got != 2 {
+		t.Fatalf("expected index rebuilt after runs store changed, got %d", got)
+	}
+	if got := countActiveSearchRuns("u2"); got != 0 {
+		t.Fatalf("expected no active runs for u2, got %d", got)
+	}
+}
+
+func TestDatasetFreshnessRereadsRewrittenManifest(t *testing.T) {
+	tmpDir := t.TempDir()
+	manifestPath := filepath.Join(tmpDir, "last_run.json")
+	writeManifest := func(runAt time.Time, modTime time.Time) {
+		raw, _ := json.Marshal(map[string]any{"run_at_utc": runAt.Format(time.RFC3339)})
+		if err := os.WriteFile(manifestPath, raw, 0o644); err != nil {
+			t.Fatalf("write manifest: %v", err)
+		}
+		if err := os.Chtimes(manifestPath, modTime, modTime); err != nil {
+			t.Fatalf("chtimes manifest: %v", err)
+		}
+	}
+	now := time.Now().UTC()
+	writeManifest(now.Add(-60*24*time.Hour), now.Add(-time.Minute))
+	if stale, _ := datasetFreshness(filepath.Join(tmpDir, "companies.csv"), manifestPath)["is_stale"].(bool); !stale {
+		t.Fatalf("expected an old manifest to be stale")
+	}
+	writeManifest(now.Add(-time.Hour), now)
+	freshness := datasetFreshness(filepath.Join(tmpDir, "companies.csv"), manifestPath)
+	if stale, _ := freshness["is_stale"].(bool); stale {
+		t.Fatalf("expected rewritten manifest to be fresh, got %#v", freshness)
+	}
+}
@@ -2,14 +2,24 @@ package user
 
 import (
 	"crypto/rand"
+	"encoding/binary"
 	"encoding/hex"
+	"sync/atomic"
+	"time"
 )
 
+var runIDFallbackSeq atomic.Uint32
+
+// newRunID returns an opaque 24-character hex id for search runs and
+// sessions. The random bytes live on the stack; only the hex string is
+// allocated.
 func newRunID() string {
-	buf := make([]byte, 12)
-	if _, err := rand.Read(buf); err == nil {
-		return hex.EncodeToString(buf)
+	var buf [12]byte
+	if _, err := rand.Read(buf[:]); err != nil {
+		// Fallback to clock + counter entropy if crypto/rand is unavailable,
+		// keeping ids unique within the same second and the same length.
+		binary.BigEndian.PutUint64(buf[:8], uint64(time.Now().UnixNano()))
+		binary.BigEndian.PutUint32(buf[8:], runIDFallbackSeq.Add(1))
 	}
-	// Fallback to timestamp-based entropy if crypto/rand is unavailable.
-	return hex.EncodeToString([]byte(utcNowISO()))
+	return hex.EncodeToString(buf[:])
 }
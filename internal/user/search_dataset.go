@@ -51,26 +51,75 @@ func datasetPathOrDefault(raw string) string {
 	if path != "" {
 		return path
 	}
+	return resolvedDefaultDatasetPath()
+}
+
+// resolvedDefaultDatasetPathValue remembers where the default dataset was
+// found, so searches and readiness checks stop statting every packaged-install
+// candidate. Only a path that existed is remembered, a remembered path that
+// has since gone missing is resolved again, and a project-local dataset still
+// wins over a remembered packaged one. refreshDefaultDatasetPath drops it,
+// e.g. when the dataset cache is refreshed.
+var (
+	resolvedDefaultDatasetPathMu    sync.Mutex
+	resolvedDefaultDatasetPathValue string
+)
+
+func resolvedDefaultDatasetPath() string {
+	resolvedDefaultDatasetPathMu.Lock()
+	defer resolvedDefaultDatasetPathMu.Unlock()
+	if remembered := resolvedDefaultDatasetPathValue; remembered != "" {
+		if remembered != defaultDatasetPath {
+			if _, err := os.Stat(defaultDatasetPath); err == nil {
+				resolvedDefaultDatasetPathValue = defaultDatasetPath
+				return defaultDatasetPath
+			}
+		}
+		if _, err := os.Stat(remembered); err == nil {
+			return remembered
+		}
+		resolvedDefaultDatasetPathValue = ""
+	}
+	path, found := resolveDefaultDatasetPath()
+	if found {
+		resolvedDefaultDatasetPathValue = path
+	}
+	return path
+}
 
+func refreshDefaultDatasetPath() {
+	resolvedDefaultDatasetPathMu.Lock()
+	resolvedDefaultDatasetPathValue = ""
+	resolvedDefaultDatasetPathMu.Unlock()
+}
+
+// resolveDefaultDatasetPath returns the first default dataset location that
+// exists, or the project-local path with found=false when none does.
+func resolveDefaultDatasetPath() (path string, found bool) {
 	// Prefer explicit project-local path when available.
 	if _, err := os.Stat(defaultDatasetPath); err == nil {
-		return defaultDatasetPath
+		return defaultDatasetPath, true
 	}
 
 	// Fallbacks for packaged installs (Homebrew/tarball layouts).
-	exePath, err := os.Executable()
-	if err != nil {
-		return defaultDatasetPath
-	}
-	candidates := datasetFallbackCandidates(exePath)
-	for _, candidate := range candidates {
+	for _, candidate := range packagedDatasetCandidates() {
 		if _, err := os.Stat(candidate); err == nil {
-			return candidate
+			return candidate, true
 		}
 	}
-	return defaultDatasetPath
+	return defaultDatasetPath, false
 }
 
+// packagedDatasetCandidates builds the packaged-install dataset paths once;
+// the executable location cannot change while the process runs.
+var packagedDatasetCandidates = sync.OnceValue(func() []string {
+	exePath, err := os.Executable()
+	if err != nil {
+		return nil
+	}
+	return datasetFallbackCandidates(exePath)
+})
+
 func datasetFallbackCandidates(exePath string) []string {
 	exeDir := filepath.Dir(exePath)
 	return []string{
@@ -89,22 +138,44 @@ func parseIntCSV(text string) int {
 	return value
 }
 
-func normalizedHeaderMap(headers []string) map[string]int {
-	out := map[string]int{}
-	for idx, raw := range headers {
-		key := strings.ToLower(strings.TrimSpace(raw))
-		out[key] = idx
+type datasetColumnAlias struct {
+	Canonical string
+	Rank      int
+}
+
+// datasetColumnByAlias inverts datasetColumnAliases once so header
+// resolution is a single map probe per column. Rank keeps the alias
+// preference order when a file carries more than one spelling.
+var datasetColumnByAlias = buildDatasetColumnByAlias()
+
+func buildDatasetColumnByAlias() map[string]datasetColumnAlias {
+	out := map[string]datasetColumnAlias{}
+	for canonical, aliases := range datasetColumnAliases {
+		for rank, alias := range aliases {
+			out[strings.ToLower(strings.TrimSpace(alias))] = datasetColumnAlias{Canonical: canonical, Rank: rank}
+		}
 	}
 	return out
 }
 
-func findColumnIndex(indexByHeader map[string]int, aliases []string) int {
-	for _, alias := range aliases {
-		if idx, ok := indexByHeader[strings.ToLower(strings.TrimSpace(alias))]; ok {
-			return idx
+func resolveDatasetColumns(headers []string) map[string]int {
+	out := make(map[string]int, len(datasetColumnAliases))
+	ranks := make(map[string]int, len(datasetColumnAliases))
+	for canonical := range datasetColumnAliases {
+		out[canonical] = -1
+	}
+	for idx, raw := range headers {
+		alias, ok := datasetColumnByAlias[strings.ToLower(strings.TrimSpace(raw))]
+		if !ok {
+			continue
+		}
+		if out[alias.Canonical] >= 0 && ranks[alias.Canonical] < alias.Rank {
+			continue
 		}
+		out[alias.Canonical] = idx
+		ranks[alias.Canonical] = alias.Rank
 	}
-	return -1
+	return out
 }
 
 func readCSVColumn(row []string, idx int) string {
@@ -161,12 +232,7 @@ func loadCompanyDataset(datasetPath string) (companyDataset, error) {
 	if err != nil {
 		return companyDataset{}, fmt.Errorf("read dataset header: %w", err)
 	}
-	headerIndex := normalizedHeaderMap(header)
-
-	canonicalIndex := map[string]int{}
-	for canonical, aliases := range datasetColumnAliases {
-		canonicalIndex[canonical] = findColumnIndex(headerIndex, aliases)
-	}
+	canonicalIndex := resolveDatasetColumns(header)
 	required := []string{"company_name", "h1b", "h1b1_chile", "h1b1_singapore", "e3_australian", "green_card"}
 	missing := []string{}
 	for _, key := range required {
@@ -179,7 +245,8 @@ func loadCompanyDataset(datasetPath string) (companyDataset, error) {
 	}
 
 	out := companyDataset{
-		ByNormalizedCompany: map[string]companyDatasetRecord{},
+		ByNormalizedCompany: map[string]*companyDatasetRecord{},
+		ModTime:             info.ModTime().UTC(),
 	}
 	for {
 		row, err := reader.Read()
@@ -192,7 +259,7 @@ func loadCompanyDataset(datasetPath string) (companyDataset, error) {
 			continue
 		}
 
-		record := companyDatasetRecord{
+		record := &companyDatasetRecord{
 			CompanyName:      companyName,
 			CompanyTier:      readCSVColumn(row, canonicalIndex["company_tier"]),
 			H1B:              parseIntCSV(readCSVColumn(row, canonicalIndex["h1b"])),
@@ -214,7 +281,7 @@ func loadCompanyDataset(datasetPath string) (companyDataset, error) {
 	datasetCacheMu.Lock()
 	datasetCache[path] = datasetCacheEntry{
 		Path:    path,
-		ModTime: info.ModTime().UTC(),
+		ModTime: out.ModTime,
 		Data:    out,
 	}
 	datasetCacheMu.Unlock()
@@ -228,7 +295,7 @@ func clearDatasetCache(datasetPath string) {
 	datasetCacheMu.Unlock()
 }
 
-func visaCountsFromRecord(record companyDatasetRecord) map[string]int {
+func visaCountsFromRecord(record *companyDatasetRecord) map[string]int {
 	return map[string]int{
 		"h1b":            record.H1B,
 		"h1b1_chile":     record.H1B1Chile,
@@ -239,7 +306,7 @@ func visaCountsFromRecord(record companyDatasetRecord) map[string]int {
 	}
 }
 
-func desiredVisaCount(record companyDatasetRecord, desired []string) int {
+func desiredVisaCount(record *companyDatasetRecord, desired []string) int {
 	total := 0
 	for _, visa := range desired {
 		switch visa {
@@ -1,6 +1,7 @@
 package user
 
 import (
+	"os"
 	"path/filepath"
 	"strings"
 	"testing"
@@ -24,3 +25,97 @@ func TestDatasetFallbackCandidates(t *testing.T) {
 		t.Fatalf("expected packaged share data candidate, got %#v", candidates)
 	}
 }
+
+func TestResolveDatasetColumnsPrefersFirstAlias(t *testing.T) {
+	columns := resolveDatasetColumns([]string{" Employer ", "H-1B", "company_name", "Green Card"})
+	if got := columns["company_name"]; got != 2 {
+		t.Fatalf("expected company_name to win over employer alias, got index %d", got)
+	}
+	if got := columns["h1b"]; got != 1 {
+		t.Fatalf("expected h1b alias at index 1, got %d", got)
+	}
+	if got := columns["green_card"]; got != 3 {
+		t.Fatalf("expected green_card alias at index 3, got %d", got)
+	}
+	if got := columns["e3_australian"]; got != -1 {
+		t.Fatalf("expected missing column to resolve to -1, got %d", got)
+	}
+}
+
+func TestLoadedDatasetFreshnessMatchesStat(t *testing.T) {
+	tmpDir := t.TempDir()
+	datasetPath := filepath.Join(tmpDir, "companies.csv")
+	csv := "company_name,h1b,h1b1_chile,h1b1_singapore,e3_australian,green_card\nAcme,1,0,0,0,0\n"
+	if err := os.WriteFile(datasetPath, []byte(csv), 0o644); err != nil {
+		t.Fatalf("write dataset: %v", err)
+	}
+	dataset, err := loadCompanyDataset(datasetPath)
+	if err != nil {
+		t.Fatalf("loadCompanyDataset failed: %v", err)
+	}
+	manifestPath := filepath.Join(tmpDir, "last_run.json")
+	got := datasetFreshnessAt(datasetPath, manifestPath, true, dataset.ModTime)
+	want := datasetFreshness(datasetPath, manifestPath)
+	for _, key := range []string{"dataset_exists", "dataset_last_updated_at_utc", "source", "is_stale"} {
+		if got[key] != want[key] {
+			t.Fatalf("expected %s=%#v from the loaded dataset, got %#v", key, want[key], got[key])
+		}
+	}
+}
+
+func TestDefaultDatasetPathRemembersOnlyExistingPaths(t *testing.T) {
+	t.Setenv("VISA_COMPANY_DATASET_PATH", "")
+	workDir := t.TempDir()
+	previousDir, err := os.Getwd()
+	if err != nil {
+		t.Fatalf("getwd: %v", err)
+	}
+	if err := os.Chdir(workDir); err != nil {
+		t.Fatalf("chdir: %v", err)
+	}
+	t.Cleanup(func() {
+		_ = os.Chdir(previousDir)
+		refreshDefaultDatasetPath()
+	})
+	refreshDefaultDatasetPath()
+	remembered := func() string {
+		resolvedDefaultDatasetPathMu.Lock()
+		defer resolvedDefaultDatasetPathMu.Unlock()
+		return resolvedDefaultDatasetPathValue
+	}
+	writeDataset := func(path string) {
+		if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+			t.Fatalf("mkdir: %v", err)
+		}
+		if err := os.WriteFile(path, []byte("company_tier\n"), 0o644); err != nil {
+			t.Fatalf("write dataset: %v", err)
+		}
+	}
+
+	if got := datasetPathOrDefault(""); got != defaultDatasetPath || remembered() != "" {
+		t.Fatalf("expected an unremembered miss on %q, got %q (remembered %q)", defaultDatasetPath, got, remembered())
+	}
+
+	packaged := filepath.Join(t.TempDir(), "companies.csv")
+	writeDataset(packaged)
+	resolvedDefaultDatasetPathMu.Lock()
+	resolvedDefaultDatasetPathValue = packaged
+	resolvedDefaultDatasetPathMu.Unlock()
+	if got := datasetPathOrDefault(""); got != packaged {
+		t.Fatalf("expected the remembered packaged path, got %q", got)
+	}
+
+	writeDataset(filepath.Join(workDir, defaultDatasetPath))
+	if got := datasetPathOrDefault(""); got != defaultDatasetPath {
+		t.Fatalf("expected a new project-local dataset to win, got %q", got)
+	}
+	if err := os.Remove(filepath.Join(workDir, defaultDatasetPath)); err != nil {
+		t.Fatalf("remove dataset: %v", err)
+	}
+	if err := os.Remove(packaged); err != nil {
+		t.Fatalf("remove dataset: %v", err)
+	}
+	if got := datasetPathOrDefault(""); got != defaultDatasetPath || remembered() != "" {
+		t.Fatalf("expected missing datasets to be resolved again, got %q (remembered %q)", got, remembered())
+	}
+}
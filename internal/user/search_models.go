@@ -44,9 +44,13 @@ type companyDatasetRecord struct {
 	EmployerContacts []map[string]any
 }
 
+// companyDataset keeps records behind pointers so per-job company lookups
+// during a scan do not copy every record.
 type companyDataset struct {
 	Rows                int
-	ByNormalizedCompany map[string]companyDatasetRecord
+	ByNormalizedCompany map[string]*companyDatasetRecord
+	// ModTime is the dataset file's modification time when it was loaded.
+	ModTime time.Time
 }
 
 type linkedInJob struct {
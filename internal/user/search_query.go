@@ -25,20 +25,25 @@ func executeSearchQuery(
 	}
 
 	onProgress("dataset", "Loading sponsor dataset.", 5, nil)
-	dataset := companyDataset{Rows: 0, ByNormalizedCompany: map[string]companyDatasetRecord{}}
+	dataset := companyDataset{Rows: 0, ByNormalizedCompany: map[string]*companyDatasetRecord{}}
 	datasetPath := datasetPathOrDefault(query.DatasetPath)
 	dataset, err = loadCompanyDataset(datasetPath)
 	datasetLoadWarning := ""
 	if err != nil {
-		dataset = companyDataset{Rows: 0, ByNormalizedCompany: map[string]companyDatasetRecord{}}
+		dataset = companyDataset{Rows: 0, ByNormalizedCompany: map[string]*companyDatasetRecord{}}
 		datasetLoadWarning = err.Error()
 		onProgress("dataset", "Dataset unavailable; continuing with live listing signals only.", 8, map[string]any{
 			"warning": datasetLoadWarning,
 		})
 	}
-	freshness := datasetFreshness(datasetPath, envOrDefault("VISA_DOL_MANIFEST_PATH", defaultManifestPath))
-	ignoredJobs := ignoredJobURLSet(query.UserID)
-	ignoredCompanies := ignoredCompanySet(query.UserID)
+	manifestPath := envOrDefault("VISA_DOL_MANIFEST_PATH", defaultManifestPath)
+	var freshness map[string]any
+	if datasetLoadWarning == "" {
+		// The load already stat'ed the dataset.
+		freshness = datasetFreshnessAt(datasetPath, manifestPath, true, dataset.ModTime)
+	} else {
+		freshness = datasetFreshness(datasetPath, manifestPath)
+	}
 
 	requiredAccepted := query.ResultsWanted
 	if query.Offset+query.MaxReturned > requiredAccepted {
@@ -118,6 +123,13 @@ func executeSearchQuery(
 		filterDetail = "Evaluating role relevance."
 	}
 	onProgress("filter", filterDetail, 76, map[string]any{"raw_jobs_scanned": len(rawJobs)})
+	// The ignore lists only filter scraped jobs, so they are loaded once the
+	// scan is over and skipped when it found nothing.
+	var ignoredJobs, ignoredCompanies map[string]struct{}
+	if len(rawJobs) > 0 {
+		ignoredJobs = ignoredJobURLSet(query.UserID)
+		ignoredCompanies = ignoredCompanySet(query.UserID)
+	}
 	accepted := []map[string]any{}
 	descriptionFetches := 0
 	descriptionFetchLimit := maxDescriptionFetches()
@@ -145,21 +157,17 @@ func executeSearchQuery(
 		record, hasCompany := dataset.ByNormalizedCompany[normalizedCompany]
 		desiredCount := 0
 		totalCount := 0
-		visaCounts := map[string]int{
-			"h1b":            0,
-			"h1b1_chile":     0,
-			"h1b1_singapore": 0,
-			"e3_australian":  0,
-			"green_card":     0,
-			"total_visas":    0,
-		}
-		contacts := []map[string]any{}
+		var visaCounts map[string]int
+		var contacts []map[string]any
 		if hasCompany {
 			stats.CompanyMatches++
 			desiredCount = desiredVisaCount(record, desiredVisaTypes)
 			totalCount = record.TotalVisas
 			visaCounts = visaCountsFromRecord(record)
 			contacts = record.EmployerContacts
+		} else {
+			visaCounts = visaCountsFromRecord(&companyDatasetRecord{})
+			contacts = []map[string]any{}
 		}
 
 		descriptionText := ""
@@ -339,13 +347,8 @@ func executeSearchQuery(
 		return nil, nil, "", err
 	}
 	sessionID := getString(sessionRecord, "session_id")
-	acceptedWithIDs := []map[string]any{}
-	for _, raw := range listOrEmpty(sessionRecord["accepted_jobs"]) {
-		row := mapOrNil(raw)
-		if row != nil {
-			acceptedWithIDs = append(acceptedWithIDs, row)
-		}
-	}
+	// The session already attached result ids; page its rows as they are.
+	acceptedWithIDs, _ := sessionRecord["accepted_jobs"].([]map[string]any)
 
 	page, pagination := sliceAcceptedJobs(acceptedWithIDs, query.Offset, query.MaxReturned, rawScanTarget, query.MaxScanResults, scanExhausted)
 	stats.AcceptedJobs = len(acceptedWithIDs)
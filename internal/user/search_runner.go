@@ -2,19 +2,100 @@ package user
 
 import (
 	"errors"
+	"sync"
+	"time"
 )
 
-func runCancelled(runID string) bool {
-	cancelRequested := false
-	_ = withSearchRunStore(false, func(store map[string]any) error {
-		runs := mapOrNil(store["runs"])
-		run := mapOrNil(runs[runID])
-		if run != nil {
-			cancelRequested = boolOrFalse(run["cancel_requested"])
+// searchRunEventFlushInterval bounds how long progress events may sit in
+// memory before they are written to the run store.
+const searchRunEventFlushInterval = time.Second
+
+type pendingRunEvent struct {
+	AtUTC   string
+	Phase   string
+	Detail  string
+	Percent float64
+	Payload map[string]any
+}
+
+// runEventBatch coalesces progress events so a search run rewrites the run
+// store once per phase change or flush interval instead of once per event.
+// Buffered events are also flushed by a timer, so status polls see progress
+// during a slow fetch that emits nothing further.
+type runEventBatch struct {
+	mu        sync.Mutex
+	runID     string
+	pending   []pendingRunEvent
+	lastPhase string
+	lastFlush time.Time
+	timer     *time.Timer
+}
+
+func (b *runEventBatch) add(phase, detail string, pct float64, payload map[string]any) {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	b.pending = append(b.pending, pendingRunEvent{
+		AtUTC:   utcNowISO(),
+		Phase:   phase,
+		Detail:  detail,
+		Percent: pct,
+		Payload: payload,
+	})
+	if wait := searchRunEventFlushInterval - time.Since(b.lastFlush); phase != b.lastPhase || wait <= 0 {
+		_ = b.flushLocked(nil)
+	} else if b.timer == nil {
+		b.timer = time.AfterFunc(wait, b.flushDue)
+	}
+	b.lastPhase = phase
+}
+
+// flushDue writes events still buffered when the flush interval runs out.
+func (b *runEventBatch) flushDue() {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	b.timer = nil
+	if len(b.pending) > 0 {
+		_ = b.flushLocked(nil)
+	}
+}
+
+// flush writes pending events and then applies updater, if any, in the same
+// run store update.
+func (b *runEventBatch) flush(updater func(run map[string]any) error) error {
+	b.mu.Lock()
+	defer b.mu.Unlock()
+	return b.flushLocked(updater)
+}
+
+func (b *runEventBatch) flushLocked(updater func(run map[string]any) error) error {
+	if b.timer != nil {
+		b.timer.Stop()
+		b.timer = nil
+	}
+	pending := b.pending
+	b.pending = nil
+	b.lastFlush = time.Now()
+	if len(pending) == 0 && updater == nil {
+		return nil
+	}
+	return updateRun(b.runID, func(run map[string]any) error {
+		for _, event := range pending {
+			appendRunEventAt(run, event.AtUTC, event.Phase, event.Detail, event.Percent, event.Payload)
+		}
+		if updater != nil {
+			return updater(run)
 		}
 		return nil
 	})
-	return cancelRequested
+}
+
+// runCancelled reports whether cancellation was requested for runID. Searches
+// poll it for every page and scanned job, so it reads the shared cached run
+// store, reparsed only when the file changes, instead of copying and pruning
+// every run under searchRunMu.
+func runCancelled(runID string) bool {
+	run := mapOrNil(mapOrNil(loadSharedJSONMap(searchRunsPath(), nil)["runs"])[runID])
+	return boolOrFalse(run["cancel_requested"])
 }
 
 func executeSearchRun(runID string) {
@@ -79,18 +160,12 @@ func executeSearchRun(runID string) {
 		query.MaxScanResults = max(defaultSearchMaxScanResults, query.ResultsWanted)
 	}
 
-	progress := func(phase, detail string, pct float64, payload map[string]any) {
-		_ = updateRun(runID, func(run map[string]any) error {
-			appendRunEvent(run, phase, detail, pct, payload)
-			return nil
-		})
-	}
-
-	response, stats, sessionID, err := executeSearchQuery(query, progress, func() bool {
+	events := &runEventBatch{runID: runID, lastFlush: time.Now()}
+	response, stats, sessionID, err := executeSearchQuery(query, events.add, func() bool {
 		return runCancelled(runID)
 	})
 	if err != nil {
-		_ = updateRun(runID, func(run map[string]any) error {
+		_ = events.flush(func(run map[string]any) error {
 			if errors.Is(err, errSearchRunCancelled) || boolOrFalse(run["cancel_requested"]) {
 				run["status"] = "cancelled"
 				run["error"] = ""
@@ -106,7 +181,7 @@ func executeSearchRun(runID string) {
 		})
 		return
 	}
-	_ = updateRun(runID, func(run map[string]any) error {
+	_ = events.flush(func(run map[string]any) error {
 		run["status"] = "completed"
 		run["search_session_id"] = sessionID
 		run["latest_response"] = response
@@ -3,93 +3,123 @@ package user
 import (
 	"fmt"
 	"strings"
+	"sync"
 )
 
+type ignoredJobURLCacheEntry struct {
+	Store   storeFileStamp
+	Journal storeFileStamp
+	URLs    map[string]struct{}
+}
+
+// ignoredJobURLCache keeps each user's ignored URL set until the ignored jobs
+// store or its journal changes on disk, so repeated searches skip reloading
+// and lowercasing every ignored row.
+var (
+	ignoredJobURLCacheMu sync.Mutex
+	ignoredJobURLCache   = map[string]ignoredJobURLCacheEntry{}
+)
+
+// ignoredJobURLSet returns the lowercased URLs the user has ignored. The set
+// is shared with the cache and must not be modified.
 func ignoredJobURLSet(userID string) map[string]struct{} {
-	store := loadIgnoredJobs()
-	entry := getUserListEntry(store, userID, "jobs", normalizeIgnoredJob)
-	if entry == nil {
-		return map[string]struct{}{}
+	path := ignoredJobsPath()
+	cacheKey := path + "\x00" + userID
+	storeStamp := statStoreFile(path)
+	journalStamp := statStoreFile(storeJournalPath(path))
+
+	ignoredJobURLCacheMu.Lock()
+	cached, ok := ignoredJobURLCache[cacheKey]
+	ignoredJobURLCacheMu.Unlock()
+	if ok && cached.Store.matches(storeStamp) && cached.Journal.matches(journalStamp) {
+		return cached.URLs
 	}
-	out := map[string]struct{}{}
-	for _, row := range entry["jobs"].([]map[string]any) {
-		url := strings.ToLower(getString(row, "job_url"))
-		if url != "" {
-			out[url] = struct{}{}
+
+	var out map[string]struct{}
+	store := ignoredJobsStore.loadUser(userID)
+	if entry := ignoredJobsStore.get(store, userID); entry != nil {
+		jobs := entry["jobs"].([]map[string]any)
+		out = make(map[string]struct{}, len(jobs))
+		for _, row := range jobs {
+			// Normalized rows already hold trimmed strings.
+			if url, _ := row["job_url"].(string); url != "" {
+				out[strings.ToLower(url)] = struct{}{}
+			}
 		}
+	} else {
+		out = map[string]struct{}{}
 	}
+
+	ignoredJobURLCacheMu.Lock()
+	ignoredJobURLCache[cacheKey] = ignoredJobURLCacheEntry{Store: storeStamp, Journal: journalStamp, URLs: out}
+	ignoredJobURLCacheMu.Unlock()
 	return out
 }
 
+type ignoredCompanyCacheEntry struct {
+	Store storeFileStamp
+	Names map[string]struct{}
+}
+
+// ignoredCompanyCache keeps each user's normalized ignored company names until
+// the ignored companies store changes, so searches neither copy every user's
+// entry nor rebuild the set.
+var (
+	ignoredCompanyCacheMu sync.Mutex
+	ignoredCompanyCache   = map[string]ignoredCompanyCacheEntry{}
+)
+
+// ignoredCompanySet returns the normalized company names the user has
+// ignored. The set is shared with the cache and must not be modified.
 func ignoredCompanySet(userID string) map[string]struct{} {
-	store := loadIgnoredCompanies()
-	entry := getUserListEntry(store, userID, "companies", normalizeIgnoredCompany)
-	if entry == nil {
-		return map[string]struct{}{}
+	path := ignoredCompaniesPath()
+	cacheKey := path + "\x00" + userID
+	stamp := statStoreFile(path)
+
+	ignoredCompanyCacheMu.Lock()
+	cached, ok := ignoredCompanyCache[cacheKey]
+	ignoredCompanyCacheMu.Unlock()
+	if ok && cached.Store.matches(stamp) {
+		return cached.Names
 	}
+
 	out := map[string]struct{}{}
-	for _, row := range entry["companies"].([]map[string]any) {
-		name := getString(row, "normalized_company")
-		if name != "" {
-			out[name] = struct{}{}
+	store := loadJSONUserSubtree(path, userID)
+	if entry := getUserListEntry(store, userID, "companies", normalizeIgnoredCompany); entry != nil {
+		companies := entry["companies"].([]map[string]any)
+		out = make(map[string]struct{}, len(companies))
+		for _, row := range companies {
+			if name, _ := row["normalized_company"].(string); name != "" {
+				out[name] = struct{}{}
+			}
 		}
 	}
+
+	ignoredCompanyCacheMu.Lock()
+	ignoredCompanyCache[cacheKey] = ignoredCompanyCacheEntry{Store: stamp, Names: out}
+	ignoredCompanyCacheMu.Unlock()
 	return out
 }
 
+// attachResultIDs returns the jobs with result ids set. The rows are fresh
+// maps built for this search, so each is copied one level deep with room for
+// the id instead of deep-cloning every nested contact and visa list. Rows that
+// already carry a result id are reused as they are.
 func attachResultIDs(sessionID string, jobs []map[string]any) []map[string]any {
 	out := make([]map[string]any, 0, len(jobs))
 	for idx, item := range jobs {
-		job := cloneMap(item)
-		resultID := getString(job, "result_id")
-		if resultID == "" {
-			resultID = fmt.Sprintf("%s:%d", sessionID, idx+1)
-		}
-		job["result_id"] = resultID
-		out = append(out, job)
-	}
-	return out
-}
-
-func buildResultIndex(jobs []map[string]any) map[string]any {
-	index := map[string]any{}
-	for _, job := range jobs {
-		resultID := getString(job, "result_id")
-		if resultID == "" {
+		if getString(item, "result_id") != "" {
+			out = append(out, item)
 			continue
 		}
-		index[resultID] = map[string]any{
-			"result_id":                resultID,
-			"job_url":                  getString(job, "job_url"),
-			"title":                    getString(job, "title"),
-			"company":                  getString(job, "company"),
-			"location":                 getString(job, "location"),
-			"site":                     getString(job, "site"),
-			"description_fetched":      boolOrFalse(job["description_fetched"]),
-			"description":              getString(job, "description"),
-			"description_excerpt":      getString(job, "description_excerpt"),
-			"salary_text":              getString(job, "salary_text"),
-			"salary_currency":          getString(job, "salary_currency"),
-			"salary_interval":          getString(job, "salary_interval"),
-			"salary_min_amount":        job["salary_min_amount"],
-			"salary_max_amount":        job["salary_max_amount"],
-			"salary_source":            getString(job, "salary_source"),
-			"job_type":                 getString(job, "job_type"),
-			"job_level":                getString(job, "job_level"),
-			"company_industry":         getString(job, "company_industry"),
-			"job_function":             getString(job, "job_function"),
-			"job_url_direct":           getString(job, "job_url_direct"),
-			"is_remote":                job["is_remote"],
-			"employer_contacts":        listOrEmpty(job["employer_contacts"]),
-			"visa_counts":              asMap(job["visa_counts"]),
-			"visas_sponsored":          listOrEmpty(job["visas_sponsored"]),
-			"visa_match_strength":      getString(job, "visa_match_strength"),
-			"eligibility_reasons":      listOrEmpty(job["eligibility_reasons"]),
-			"confidence_score":         job["confidence_score"],
-			"confidence_model_version": job["confidence_model_version"],
+		job := make(map[string]any, len(item)+1)
+		for key, value := range item {
+			job[key] = value
 		}
+		job["result_id"] = fmt.Sprintf("%s:%d", sessionID, idx+1)
+		out = append(out, job)
 	}
-	return index
+	return out
 }
 
 func saveSearchSessionRecord(
@@ -103,7 +133,6 @@ func saveSearchSessionRecord(
 	now := utcNowISO()
 	expiresAt := futureISO(searchSessionTTLSeconds())
 	accepted := attachResultIDs(sessionID, acceptedJobs)
-	index := buildResultIndex(accepted)
 
 	record := map[string]any{
 		"created_at_utc": now,
@@ -123,37 +152,27 @@ func saveSearchSessionRecord(
 			"strictness_mode":            query.StrictnessMode,
 			"preferred_visa_types":       desiredVisaTypes,
 		},
+		// Jobs are stored once; result ids are resolved by scanning them, so
+		// every session rewrite skips a second copy of each description.
 		"accepted_jobs": func() []any {
-			out := []any{}
+			out := make([]any, 0, len(accepted))
 			for _, job := range accepted {
 				out = append(out, job)
 			}
 			return out
 		}(),
-		"result_id_index":     index,
 		"accepted_jobs_total": len(accepted),
 		"latest_scan_target":  rawScanTarget,
 		"scan_exhausted":      scanExhausted,
 	}
 
-	err := withSearchSessionStore(true, func(store map[string]any) error {
-		sessions := mapOrNil(store["sessions"])
-		if sessions == nil {
-			sessions = map[string]any{}
-		}
-		sessions[sessionID] = record
-		store["sessions"] = sessions
-		enforceUserSessionLimitLocked(store, query.UserID)
-		return nil
-	})
-	if err != nil {
+	if err := insertSearchSession(sessionID, query.UserID, record); err != nil {
 		return nil, err
 	}
 	return map[string]any{
-		"session_id":      sessionID,
-		"expires_at_utc":  expiresAt,
-		"accepted_jobs":   accepted,
-		"result_id_index": index,
+		"session_id":     sessionID,
+		"expires_at_utc": expiresAt,
+		"accepted_jobs":  accepted,
 	}, nil
 }
 
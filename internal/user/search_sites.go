@@ -5,12 +5,19 @@ import (
 	"strings"
 )
 
+const defaultSearchSite = "linkedin"
+
+// normalizeSearchSite accepts the default site, which every search passes at
+// least once, before trimming and lowercasing anything else.
 func normalizeSearchSite(site string) (string, error) {
+	if site == "" || site == defaultSearchSite {
+		return defaultSearchSite, nil
+	}
 	clean := strings.ToLower(strings.TrimSpace(site))
 	if clean == "" {
-		clean = "linkedin"
+		clean = defaultSearchSite
 	}
-	if clean != "linkedin" {
+	if clean != defaultSearchSite {
 		return "", fmt.Errorf("only linkedin is supported right now: %q", clean)
 	}
 	return clean, nil
@@ -7,3 +7,12 @@ func TestNewSiteClientRejectsUnsupportedSite(t *testing.T) {
 		t.Fatal("expected error for unsupported site")
 	}
 }
+
+func TestNormalizeSearchSiteAcceptsDefaultSpellings(t *testing.T) {
+	for _, site := range []string{"", "linkedin", "  LinkedIn "} {
+		got, err := normalizeSearchSite(site)
+		if err != nil || got != "linkedin" {
+			t.Fatalf("expected %q to normalize to linkedin, got %q (%v)", site, got, err)
+		}
+	}
+}
@@ -1,6 +1,7 @@
 package user
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"slices"
@@ -12,16 +13,38 @@ import (
 var searchRunMu sync.Mutex
 var searchSessionMu sync.Mutex
 
+// parsedISOTimeLimit bounds the parse cache; prune passes re-read the same
+// created/updated/expires timestamps on every store access.
+const parsedISOTimeLimit = 4096
+
+var parsedISOTimeMu sync.Mutex
+var parsedISOTimes = map[string]time.Time{}
+
 func parseISOTime(value any) time.Time {
-	text := strings.TrimSpace(fmt.Sprint(value))
+	text, ok := value.(string)
+	if !ok {
+		text = fmt.Sprint(value)
+	}
+	text = strings.TrimSpace(text)
 	if text == "" {
 		return time.Time{}
 	}
+	parsedISOTimeMu.Lock()
+	defer parsedISOTimeMu.Unlock()
+	if cached, ok := parsedISOTimes[text]; ok {
+		return cached
+	}
 	t, err := time.Parse(time.RFC3339, text)
 	if err != nil {
-		return time.Time{}
+		t = time.Time{}
+	} else {
+		t = t.UTC()
 	}
-	return t.UTC()
+	if len(parsedISOTimes) >= parsedISOTimeLimit {
+		clear(parsedISOTimes)
+	}
+	parsedISOTimes[text] = t
+	return t
 }
 
 func toISO(t time.Time) string {
@@ -33,14 +56,10 @@ func futureISO(seconds int) string {
 }
 
 func cloneMap(value map[string]any) map[string]any {
-	raw, err := json.Marshal(value)
-	if err != nil {
-		return map[string]any{}
-	}
-	var out map[string]any
-	if err := json.Unmarshal(raw, &out); err != nil {
-		return map[string]any{}
+	if value == nil {
+		return nil
 	}
+	out, _ := cloneJSONValue(value).(map[string]any)
 	return out
 }
 
@@ -50,12 +69,23 @@ func appendRunEvent(
 	detail string,
 	progressPercent float64,
 	payload map[string]any,
+) {
+	appendRunEventAt(run, utcNowISO(), phase, detail, progressPercent, payload)
+}
+
+func appendRunEventAt(
+	run map[string]any,
+	atUTC string,
+	phase string,
+	detail string,
+	progressPercent float64,
+	payload map[string]any,
 ) {
 	events := listOrEmpty(run["events"])
 	nextEventID := intOrZero(run["next_event_id"])
 	event := map[string]any{
 		"event_id": nextEventID,
-		"at_utc":   utcNowISO(),
+		"at_utc":   atUTC,
 		"phase":    phase,
 		"detail":   detail,
 	}
@@ -73,6 +103,45 @@ func appendRunEvent(
 	run["next_event_id"] = nextEventID + 1
 }
 
+// capNewestRecords keeps the limit most recently updated records, falling
+// back to created_at_utc, with ties broken by id. A limit of zero or less
+// keeps everything. Records within the limit are returned as is.
+func capNewestRecords(records map[string]any, limit int) map[string]any {
+	if records == nil {
+		return map[string]any{}
+	}
+	if limit <= 0 || len(records) <= limit {
+		return records
+	}
+	type recordPair struct {
+		ID   string
+		Time time.Time
+	}
+	pairs := make([]recordPair, 0, len(records))
+	for id, raw := range records {
+		record := mapOrNil(raw)
+		updated := parseISOTime(record["updated_at_utc"])
+		if updated.IsZero() {
+			updated = parseISOTime(record["created_at_utc"])
+		}
+		pairs = append(pairs, recordPair{ID: id, Time: updated})
+	}
+	slices.SortFunc(pairs, func(a, b recordPair) int {
+		if a.Time.Equal(b.Time) {
+			return strings.Compare(a.ID, b.ID)
+		}
+		if a.Time.After(b.Time) {
+			return -1
+		}
+		return 1
+	})
+	trimmed := make(map[string]any, limit)
+	for _, pair := range pairs[:limit] {
+		trimmed[pair.ID] = records[pair.ID]
+	}
+	return trimmed
+}
+
 func pruneSearchRunsLocked(store map[string]any) map[string]any {
 	runs := mapOrNil(store["runs"])
 	if runs == nil {
@@ -94,40 +163,7 @@ func pruneSearchRunsLocked(store map[string]any) map[string]any {
 		valid[runID] = run
 	}
 
-	if len(valid) > searchMaxRuns() && searchMaxRuns() > 0 {
-		type runPair struct {
-			ID   string
-			Time time.Time
-		}
-		pairs := make([]runPair, 0, len(valid))
-		for runID, raw := range valid {
-			run := mapOrNil(raw)
-			updated := parseISOTime(run["updated_at_utc"])
-			if updated.IsZero() {
-				updated = parseISOTime(run["created_at_utc"])
-			}
-			pairs = append(pairs, runPair{ID: runID, Time: updated})
-		}
-		slices.SortFunc(pairs, func(a, b runPair) int {
-			if a.Time.Equal(b.Time) {
-				return strings.Compare(a.ID, b.ID)
-			}
-			if a.Time.After(b.Time) {
-				return -1
-			}
-			return 1
-		})
-		trimmed := map[string]any{}
-		for idx, pair := range pairs {
-			if idx >= searchMaxRuns() {
-				break
-			}
-			trimmed[pair.ID] = valid[pair.ID]
-		}
-		valid = trimmed
-	}
-
-	store["runs"] = valid
+	store["runs"] = capNewestRecords(valid, searchMaxRuns())
 	return store
 }
 
@@ -136,8 +172,12 @@ func loadSearchRunsPrunedLocked() map[string]any {
 	return pruneSearchRunsLocked(store)
 }
 
+// saveSearchRunsPrunedLocked saves a store loaded through
+// loadSearchRunsPrunedLocked. Expired runs were dropped on load, so only the
+// run cap, which an added run may exceed, is applied again.
 func saveSearchRunsPrunedLocked(store map[string]any) error {
-	return saveSearchRuns(pruneSearchRunsLocked(store))
+	store["runs"] = capNewestRecords(mapOrNil(store["runs"]), searchMaxRuns())
+	return saveSearchRuns(store)
 }
 
 func withSearchRunStore(write bool, fn func(store map[string]any) error) error {
@@ -238,39 +278,7 @@ func pruneSearchSessionsLocked(store map[string]any) map[string]any {
 		valid[sessionID] = session
 	}
 
-	if maxSessions := searchMaxSessions(); maxSessions > 0 && len(valid) > maxSessions {
-		type sessionPair struct {
-			ID   string
-			Time time.Time
-		}
-		pairs := make([]sessionPair, 0, len(valid))
-		for sessionID, raw := range valid {
-			session := mapOrNil(raw)
-			updated := parseISOTime(session["updated_at_utc"])
-			if updated.IsZero() {
-				updated = parseISOTime(session["created_at_utc"])
-			}
-			pairs = append(pairs, sessionPair{ID: sessionID, Time: updated})
-		}
-		slices.SortFunc(pairs, func(a, b sessionPair) int {
-			if a.Time.Equal(b.Time) {
-				return strings.Compare(a.ID, b.ID)
-			}
-			if a.Time.After(b.Time) {
-				return -1
-			}
-			return 1
-		})
-		trimmed := map[string]any{}
-		for idx, pair := range pairs {
-			if idx >= maxSessions {
-				break
-			}
-			trimmed[pair.ID] = valid[pair.ID]
-		}
-		valid = trimmed
-	}
-	store["sessions"] = valid
+	store["sessions"] = capNewestRecords(valid, searchMaxSessions())
 	return store
 }
 
@@ -336,8 +344,82 @@ func loadSearchSessionsPruned() map[string]any {
 	return pruneSearchSessionsLocked(store)
 }
 
+// saveSearchSessionsPruned saves a store loaded through
+// loadSearchSessionsPruned, re-applying only the session cap.
 func saveSearchSessionsPruned(store map[string]any) error {
-	return saveSearchSessions(pruneSearchSessionsLocked(store))
+	store["sessions"] = capNewestRecords(mapOrNil(store["sessions"]), searchMaxSessions())
+	return saveSearchSessions(store)
+}
+
+// storedSessionHeader holds the fields pruning reads from a stored session.
+type storedSessionHeader struct {
+	CreatedAtUTC any            `json:"created_at_utc"`
+	UpdatedAtUTC any            `json:"updated_at_utc"`
+	ExpiresAtUTC any            `json:"expires_at_utc"`
+	Query        map[string]any `json:"query"`
+}
+
+// rawSessionStore is a session store holding json.RawMessage values. Its own
+// type keeps encodeJSONFile from caching it as a parsed map[string]any store.
+type rawSessionStore map[string]any
+
+// insertSearchSession adds record to the session store, applying the same
+// expiry, per-user and global limits as withSearchSessionStore. Existing
+// sessions are carried over as raw JSON: only the fields pruning needs are
+// decoded, and surviving sessions, accepted jobs and all, are written back
+// byte for byte instead of being rebuilt as maps and re-encoded.
+func insertSearchSession(sessionID, userID string, record map[string]any) error {
+	searchSessionMu.Lock()
+	defer searchSessionMu.Unlock()
+
+	path := searchSessionsPath()
+	var top map[string]json.RawMessage
+	var sessions map[string]json.RawMessage
+	if decodeJSONFile(path, &top) == nil && top != nil {
+		if json.Unmarshal(top["sessions"], &sessions) != nil {
+			sessions = nil
+		}
+	}
+
+	// Prune a store of headers alone, then keep the raw sessions it retains.
+	headers := make(map[string]any, len(sessions)+1)
+	for id, raw := range sessions {
+		if trimmed := bytes.TrimSpace(raw); len(trimmed) == 0 || trimmed[0] != '{' {
+			continue
+		}
+		var header storedSessionHeader
+		// A mistyped field is left empty, as mapOrNil would leave it.
+		_ = json.Unmarshal(raw, &header)
+		entry := map[string]any{
+			"created_at_utc": header.CreatedAtUTC,
+			"updated_at_utc": header.UpdatedAtUTC,
+			"expires_at_utc": header.ExpiresAtUTC,
+		}
+		if header.Query != nil {
+			entry["query"] = header.Query
+		}
+		headers[id] = entry
+	}
+	headers[sessionID] = record
+	headerStore := pruneSearchSessionsLocked(map[string]any{"sessions": headers})
+	enforceUserSessionLimitLocked(headerStore, userID)
+	headerStore["sessions"] = capNewestRecords(mapOrNil(headerStore["sessions"]), searchMaxSessions())
+
+	kept := mapOrNil(headerStore["sessions"])
+	out := make(map[string]any, len(kept))
+	for id := range kept {
+		if id == sessionID {
+			out[id] = record
+		} else {
+			out[id] = sessions[id]
+		}
+	}
+	store := make(rawSessionStore, len(top)+1)
+	for key, raw := range top {
+		store[key] = raw
+	}
+	store["sessions"] = out
+	return encodeJSONFile(path, store, false)
 }
 
 func withSearchSessionStore(write bool, fn func(store map[string]any) error) error {
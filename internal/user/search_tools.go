@@ -209,11 +209,11 @@ func GetJobSearchStatus(args map[string]any) (map[string]any, error) {
 }
 
 func getJobSearchStatus(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	runID := getString(args, "run_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
+	runID := getString(args, "run_id")
 	if runID == "" {
 		return nil, fmt.Errorf("run_id is required")
 	}
@@ -281,11 +281,11 @@ func GetJobSearchResults(args map[string]any) (map[string]any, error) {
 }
 
 func getJobSearchResults(args map[string]any, statusToolName string) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	runID := getString(args, "run_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
+	runID := getString(args, "run_id")
 	if runID == "" {
 		return nil, fmt.Errorf("run_id is required")
 	}
@@ -384,18 +384,18 @@ func CancelJobSearch(args map[string]any) (map[string]any, error) {
 }
 
 func cancelJobSearch(args map[string]any) (map[string]any, error) {
-	userID := getString(args, "user_id")
-	runID := getString(args, "run_id")
-	if userID == "" {
-		return nil, fmt.Errorf("user_id is required")
+	userID, err := requireUserID(args)
+	if err != nil {
+		return nil, err
 	}
+	runID := getString(args, "run_id")
 	if runID == "" {
 		return nil, fmt.Errorf("run_id is required")
 	}
 
 	status := ""
 	cancelRequested := false
-	err := withSearchRunStore(true, func(store map[string]any) error {
+	err = withSearchRunStore(true, func(store map[string]any) error {
 		runs := mapOrNil(store["runs"])
 		if runs == nil {
 			return fmt.Errorf("search run store is unavailable")
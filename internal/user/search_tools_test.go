@@ -506,3 +506,168 @@ func TestStartVisaJobSearchWithoutPreferencesIsNotBlocked(t *testing.T) {
 	}
 	waitForTerminalRunStatus(t, "u-no-visa-2", runID, 3*time.Second)
 }
+
+func TestRunEventBatchCoalescesProgressWrites(t *testing.T) {
+	setupUserToolPaths(t)
+	if err := saveSearchRuns(map[string]any{"runs": map[string]any{
+		"run-1": map[string]any{
+			"status":         "running",
+			"query":          map[string]any{"user_id": "u1"},
+			"events":         []any{},
+			"next_event_id":  1,
+			"expires_at_utc": futureISO(3600),
+		},
+	}}); err != nil {
+		t.Fatalf("saveSearchRuns failed: %v", err)
+	}
+
+	batch := &runEventBatch{runID: "run-1", lastPhase: "filter", lastFlush: time.Now()}
+	batch.add("filter", "Scoring job relevance.", 80, nil)
+	batch.add("filter", "Scoring job relevance.", 85, nil)
+	run, err := loadRunByID("run-1")
+	if err != nil {
+		t.Fatalf("loadRunByID failed: %v", err)
+	}
+	if got := len(listOrEmpty(run["events"])); got != 0 {
+		t.Fatalf("expected same-phase events to stay buffered, got %d stored", got)
+	}
+
+	if err := batch.flush(func(run map[string]any) error {
+		run["status"] = "completed"
+		return nil
+	}); err != nil {
+		t.Fatalf("flush failed: %v", err)
+	}
+	run, err = loadRunByID("run-1")
+	if err != nil {
+		t.Fatalf("loadRunByID failed: %v", err)
+	}
+	if got := len(listOrEmpty(run["events"])); got != 2 {
+		t.Fatalf("expected 2 flushed events, got %d", got)
+	}
+	if got := getString(run, "status"); got != "completed" {
+		t.Fatalf("expected status=completed, got %q", got)
+	}
+}
+
+func TestRunEventBatchFlushesIdleEventsAfterInterval(t *testing.T) {
+	setupUserToolPaths(t)
+	if err := saveSearchRuns(map[string]any{"runs": map[string]any{
+		"run-1": map[string]any{
+			"status":         "running",
+			"query":          map[string]any{"user_id": "u1"},
+			"events":         []any{},
+			"next_event_id":  1,
+			"expires_at_utc": futureISO(3600),
+		},
+	}}); err != nil {
+		t.Fatalf("saveSearchRuns failed: %v", err)
+	}
+
+	batch := &runEventBatch{runID: "run-1", lastPhase: "scan", lastFlush: time.Now()}
+	batch.add("scan", "Fetching job page.", 40, nil)
+	deadline := time.Now().Add(searchRunEventFlushInterval + 2*time.Second)
+	for {
+		run, err := loadRunByID("run-1")
+		if err != nil {
+			t.Fatalf("loadRunByID failed: %v", err)
+		}
+		if events := listOrEmpty(run["events"]); len(events) == 1 {
+			if got := getString(mapOrNil(events[0]), "detail"); got != "Fetching job page." {
+				t.Fatalf("unexpected flushed event %#v", events[0])
+			}
+			break
+		}
+		if time.Now().After(deadline) {
+			t.Fatalf("expected the buffered event to be flushed after %v without further events", searchRunEventFlushInterval)
+		}
+		time.Sleep(50 * time.Millisecond)
+	}
+	if err := batch.flush(nil); err != nil {
+		t.Fatalf("flush failed: %v", err)
+	}
+}
+
+func TestInsertSearchSessionPrunesAndKeepsOtherSessionsVerbatim(t *testing.T) {
+	setupUserToolPaths(t)
+	t.Setenv("VISA_MAX_SEARCH_SESSIONS_PER_USER", "2")
+	future := futureISO(3600)
+	older := time.Now().UTC().Add(-2 * time.Hour).Format(time.RFC3339)
+	old := time.Now().UTC().Add(-time.Hour).Format(time.RFC3339)
+	stored := `{"sessions":{` +
+		`"expired":{"expires_at_utc":"2000-01-01T00:00:00Z","query":{"user_id":"u1"}},` +
+		`"u1-older":{"updated_at_utc":"` + older + `","expires_at_utc":"` + future + `","query":{"user_id":"u1"}},` +
+		`"u1-old":{"updated_at_utc":"` + old + `","expires_at_utc":"` + future + `","query":{"user_id":"u1"}},` +
+		`"u2":{"expires_at_utc":"` + future + `","query":{"user_id":"u2"},"accepted_jobs":[{"description":"<b>Go</b> & more"}]}` +
+		`},"extra":{"kept":true}}`
+	if err := os.WriteFile(searchSessionsPath(), []byte(stored), 0o644); err != nil {
+		t.Fatalf("write sessions: %v", err)
+	}
+
+	now := utcNowISO()
+	record := map[string]any{"created_at_utc": now, "updated_at_utc": now, "expires_at_utc": future, "query": map[string]any{"user_id": "u1"}}
+	if err := insertSearchSession("new", "u1", record); err != nil {
+		t.Fatalf("insertSearchSession failed: %v", err)
+	}
+
+	data, err := os.ReadFile(searchSessionsPath())
+	if err != nil {
+		t.Fatalf("read sessions: %v", err)
+	}
+	if !strings.Contains(string(data), `"accepted_jobs":[{"description":"<b>Go</b> & more"}]`) {
+		t.Fatalf("expected other sessions to be written back verbatim, got %s", data)
+	}
+	store := loadSearchSessions()
+	sessions := mapOrNil(store["sessions"])
+	for _, id := range []string{"new", "u1-old", "u2"} {
+		if mapOrNil(sessions[id]) == nil {
+			t.Fatalf("expected session %q to be kept, got %#v", id, sessions)
+		}
+	}
+	if len(sessions) != 3 {
+		t.Fatalf("expected expired and over-limit sessions to be pruned, got %#v", sessions)
+	}
+	if mapOrNil(store["extra"]) == nil {
+		t.Fatalf("expected other top-level keys to survive, got %#v", store)
+	}
+}
+
+func TestCapNewestRecordsKeepsMostRecentlyUpdated(t *testing.T) {
+	records := map[string]any{
+		"a": map[string]any{"updated_at_utc": "2026-01-01T00:00:00Z"},
+		"b": map[string]any{"created_at_utc": "2026-03-01T00:00:00Z"},
+		"c": map[string]any{"updated_at_utc": "2026-02-01T00:00:00Z"},
+		"d": map[string]any{"updated_at_utc": "2026-02-01T00:00:00Z"},
+	}
+	kept := capNewestRecords(records, 3)
+	if len(kept) != 3 || kept["b"] == nil || kept["c"] == nil || kept["d"] == nil {
+		t.Fatalf("expected the three newest records, got %#v", kept)
+	}
+	if kept = capNewestRecords(records, 2); len(kept) != 2 || kept["b"] == nil || kept["c"] == nil {
+		t.Fatalf("expected ties broken by id, got %#v", kept)
+	}
+	if got := capNewestRecords(records, 0); len(got) != len(records) {
+		t.Fatalf("expected no cap for a zero limit, got %#v", got)
+	}
+}
+
+func TestAttachResultIDsLeavesInputRowsUntouched(t *testing.T) {
+	jobs := []map[string]any{
+		{"job_url": "https://example.com/1"},
+		{"job_url": "https://example.com/2", "result_id": "kept"},
+	}
+	out := attachResultIDs("s1", jobs)
+	if got := getString(out[0], "result_id"); got != "s1:1" {
+		t.Fatalf("expected generated result id, got %q", got)
+	}
+	if got := getString(out[1], "result_id"); got != "kept" {
+		t.Fatalf("expected existing result id to be kept, got %q", got)
+	}
+	out[1]["marker"] = true
+	if jobs[1]["marker"] != true {
+		t.Fatalf("expected rows with a result id to be reused without a copy")
+	}
+	if _, ok := jobs[0]["result_id"]; ok {
+		t.Fatalf("expected input row to stay untouched, got %#v", jobs[0])
+	}
+}
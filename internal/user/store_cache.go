@@ -0,0 +1,176 @@
+package user
+
+import (
+	"encoding/json"
+	"fmt"
+	"os"
+	"sync"
+)
+
+// jsonStoreCache keeps the last parsed copy of each JSON store keyed by path,
+// valid while the file's mtime and size are unchanged. Tool calls load the
+// same stores over and over; a cache hit costs a stat and a deep copy instead
+// of a read and a full JSON decode.
+type jsonStoreCacheEntry struct {
+	Stamp storeFileStamp
+	Data  map[string]any
+}
+
+var jsonStoreCacheMu sync.Mutex
+var jsonStoreCache = map[string]jsonStoreCacheEntry{}
+
+func jsonStoreCacheRemember(path string, info os.FileInfo, data map[string]any) {
+	entry := jsonStoreCacheEntry{Stamp: fileStamp(info), Data: cloneOrEmptyMap(data)}
+	jsonStoreCacheMu.Lock()
+	jsonStoreCache[path] = entry
+	jsonStoreCacheMu.Unlock()
+}
+
+func jsonStoreCacheForget(path string) {
+	jsonStoreCacheMu.Lock()
+	delete(jsonStoreCache, path)
+	jsonStoreCacheMu.Unlock()
+}
+
+// loadJSONMap returns a private copy of the store at path; callers are free
+// to mutate it.
+func loadJSONMap(path string, fallback map[string]any) map[string]any {
+	info, err := os.Stat(path)
+	if err != nil {
+		return cloneOrEmptyMap(fallback)
+	}
+	jsonStoreCacheMu.Lock()
+	cached, ok := jsonStoreCache[path]
+	jsonStoreCacheMu.Unlock()
+	if ok && cached.Stamp.matches(fileStamp(info)) {
+		return cloneOrEmptyMap(cached.Data)
+	}
+
+	var parsed map[string]any
+	if err := decodeJSONFile(path, &parsed); err != nil {
+		return cloneOrEmptyMap(fallback)
+	}
+	if parsed == nil {
+		return cloneOrEmptyMap(fallback)
+	}
+	jsonStoreCacheMu.Lock()
+	jsonStoreCache[path] = jsonStoreCacheEntry{Stamp: fileStamp(info), Data: cloneOrEmptyMap(parsed)}
+	jsonStoreCacheMu.Unlock()
+	return parsed
+}
+
+// loadSharedJSONMap returns the cached store at path without copying it.
+// The result is shared with the cache and later callers and must not be
+// mutated; read-only tools use it to skip the deep copy loadJSONMap makes.
+func loadSharedJSONMap(path string, fallback map[string]any) map[string]any {
+	info, err := os.Stat(path)
+	if err != nil {
+		return fallback
+	}
+	jsonStoreCacheMu.Lock()
+	cached, ok := jsonStoreCache[path]
+	jsonStoreCacheMu.Unlock()
+	if ok && cached.Stamp.matches(fileStamp(info)) {
+		return cached.Data
+	}
+
+	var parsed map[string]any
+	if err := decodeJSONFile(path, &parsed); err != nil || parsed == nil {
+		return fallback
+	}
+	jsonStoreCacheMu.Lock()
+	jsonStoreCache[path] = jsonStoreCacheEntry{Stamp: fileStamp(info), Data: parsed}
+	jsonStoreCacheMu.Unlock()
+	return parsed
+}
+
+// loadJSONUserSubtree returns a private {"users": {userID: entry}} view of a
+// user-scoped store for read-only tools.
+func loadJSONUserSubtree(path, userID string) map[string]any {
+	return loadJSONSubtree(path, "users", userID)
+}
+
+// loadJSONSubtree returns a private {group: {key: entry}} view of a store
+// for read-only tools. A cached store clones just that entry; otherwise the
+// file is streamed and sibling entries are skipped without being decoded
+// into maps.
+func loadJSONSubtree(path, group, key string) map[string]any {
+	entries := map[string]any{}
+	out := map[string]any{group: entries}
+	info, err := os.Stat(path)
+	if err != nil {
+		return out
+	}
+	jsonStoreCacheMu.Lock()
+	cached, ok := jsonStoreCache[path]
+	jsonStoreCacheMu.Unlock()
+	if ok && cached.Stamp.matches(fileStamp(info)) {
+		if entry, found := mapOrNil(cached.Data[group])[key]; found {
+			entries[key] = cloneJSONValue(entry)
+		}
+		return out
+	}
+	if entry, err := decodeJSONStoreEntry(path, group, key); err == nil && entry != nil {
+		entries[key] = entry
+	}
+	return out
+}
+
+// decodeJSONStoreEntry streams a store file and decodes only group[key].
+func decodeJSONStoreEntry(path, group, key string) (any, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return nil, err
+	}
+	defer file.Close()
+	reader := acquireStoreReader(file)
+	defer releaseStoreReader(reader)
+	decoder := json.NewDecoder(reader)
+	if err := expectJSONDelim(decoder, '{'); err != nil {
+		return nil, err
+	}
+	for decoder.More() {
+		token, err := decoder.Token()
+		if err != nil {
+			return nil, err
+		}
+		if token != group {
+			var skipped json.RawMessage
+			if err := decoder.Decode(&skipped); err != nil {
+				return nil, err
+			}
+			continue
+		}
+		if err := expectJSONDelim(decoder, '{'); err != nil {
+			return nil, err
+		}
+		for decoder.More() {
+			entryKey, err := decoder.Token()
+			if err != nil {
+				return nil, err
+			}
+			if entryKey == key {
+				var entry any
+				err := decoder.Decode(&entry)
+				return entry, err
+			}
+			var skipped json.RawMessage
+			if err := decoder.Decode(&skipped); err != nil {
+				return nil, err
+			}
+		}
+		return nil, nil
+	}
+	return nil, nil
+}
+
+func expectJSONDelim(decoder *json.Decoder, delim json.Delim) error {
+	token, err := decoder.Token()
+	if err != nil {
+		return err
+	}
+	if token != delim {
+		return fmt.Errorf("expected %v in JSON store, got %v", delim, token)
+	}
+	return nil
+}
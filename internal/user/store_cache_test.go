@@ -0,0 +1,81 @@
+package user
+
+import (
+	"os"
+	"path/filepath"
+	"reflect"
+	"testing"
+)
+
+func TestLoadJSONMapCacheReturnsPrivateCopiesAndSeesExternalWrites(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "store.json")
+	if err := saveJSONMap(path, map[string]any{"users": map[string]any{"u1": map[string]any{"next_id": 1}}}); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+
+	first := loadJSONMap(path, nil)
+	mapOrNil(first["users"])["u2"] = map[string]any{}
+	second := loadJSONMap(path, nil)
+	if _, leaked := mapOrNil(second["users"])["u2"]; leaked {
+		t.Fatal("expected cached loads to return independent copies")
+	}
+
+	if err := os.WriteFile(path, []byte(`{"users":{"u3":{"next_id":7}}}`), 0o644); err != nil {
+		t.Fatalf("external write failed: %v", err)
+	}
+	third := loadJSONMap(path, nil)
+	if _, ok := mapOrNil(third["users"])["u3"]; !ok {
+		t.Fatalf("expected external write to invalidate cache, got %#v", third)
+	}
+}
+
+func TestLoadSharedJSONMapSkipsCopiesUntilTheFileChanges(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "store.json")
+	if err := saveJSONMap(path, map[string]any{"runs": map[string]any{"r1": map[string]any{}}}); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+
+	first := loadSharedJSONMap(path, nil)
+	second := loadSharedJSONMap(path, nil)
+	if reflect.ValueOf(first).Pointer() != reflect.ValueOf(second).Pointer() {
+		t.Fatal("expected shared loads to reuse the cached store")
+	}
+	private := loadJSONMap(path, nil)
+	mapOrNil(private["runs"])["r2"] = map[string]any{}
+	if _, leaked := mapOrNil(second["runs"])["r2"]; leaked {
+		t.Fatal("expected private loads not to alias the shared store")
+	}
+
+	if err := saveJSONMap(path, private); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+	if _, ok := mapOrNil(loadSharedJSONMap(path, nil)["runs"])["r2"]; !ok {
+		t.Fatal("expected a save to replace the shared store")
+	}
+}
+
+func TestLoadJSONUserSubtreeReturnsOnlyRequestedUser(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "saved_jobs.json")
+	raw := `{"version":1,"users":{"u0":{"jobs":[{"id":1}]},"u1":{"jobs":[{"id":2,"title":"Go"}],"next_id":3},"u2":{}}}`
+	if err := os.WriteFile(path, []byte(raw), 0o644); err != nil {
+		t.Fatalf("write store: %v", err)
+	}
+	// First load streams the file; the second is served from the parsed cache.
+	loadJSONMap(path, nil)
+	for _, label := range []string{"cached", "streamed"} {
+		if label == "streamed" {
+			jsonStoreCacheForget(path)
+		}
+		users := getUsersMap(loadJSONUserSubtree(path, "u1"))
+		if len(users) != 1 {
+			t.Fatalf("%s: expected only u1, got %#v", label, users)
+		}
+		jobs := listOrEmpty(mapOrNil(users["u1"])["jobs"])
+		if len(jobs) != 1 || mapOrNil(jobs[0])["title"] != "Go" {
+			t.Fatalf("%s: unexpected u1 entry: %#v", label, users["u1"])
+		}
+		if missing := getUsersMap(loadJSONUserSubtree(path, "nobody")); len(missing) != 0 {
+			t.Fatalf("%s: expected no entry for unknown user, got %#v", label, missing)
+		}
+	}
+}
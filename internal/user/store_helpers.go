@@ -1,24 +1,28 @@
 package user
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"strconv"
 	"strings"
+	"sync"
+	"time"
 )
 
 func userBlobPath() string {
-	return envOrDefault("VISA_USER_BLOB_PATH", defaultUserBlobPath)
+	return memoryLinesStore.path()
 }
 
 func savedJobsPath() string {
-	return envOrDefault("VISA_SAVED_JOBS_PATH", defaultSavedJobsPath)
+	return savedJobsStore.path()
 }
 
 func ignoredJobsPath() string {
-	return envOrDefault("VISA_IGNORED_JOBS_PATH", defaultIgnoredJobsPath)
+	return ignoredJobsStore.path()
 }
 
 func ignoredCompaniesPath() string {
@@ -37,49 +41,259 @@ func jobDBPath() string {
 	return envOrDefault("VISA_JOB_DB_PATH", defaultJobDBPath)
 }
 
-func loadJSONMap(path string, fallback map[string]any) map[string]any {
-	raw, err := os.ReadFile(path)
+// userStorePaths reports where each user-scoped store lives, sized for extra
+// caller-specific entries. Paths follow env overrides, so they are resolved
+// per call rather than fixed at startup.
+func userStorePaths(extra int) map[string]any {
+	paths := make(map[string]any, 8+extra)
+	paths["preferences_path"] = prefsPath()
+	paths["memory_blob_path"] = userBlobPath()
+	paths["saved_jobs_path"] = savedJobsPath()
+	paths["ignored_jobs_path"] = ignoredJobsPath()
+	paths["ignored_companies_path"] = ignoredCompaniesPath()
+	paths["search_sessions_path"] = searchSessionsPath()
+	paths["search_runs_path"] = searchRunsPath()
+	paths["job_db_path"] = jobDBPath()
+	return paths
+}
+
+// storeFileStamp identifies one version of a store file on disk; the zero
+// value stands for a missing file.
+type storeFileStamp struct {
+	ModTime time.Time
+	Size    int64
+}
+
+func statStoreFile(path string) storeFileStamp {
+	info, err := os.Stat(path)
 	if err != nil {
-		if os.IsNotExist(err) {
-			return cloneOrEmptyMap(fallback)
-		}
-		return cloneOrEmptyMap(fallback)
+		return storeFileStamp{}
 	}
-	var parsed map[string]any
-	if err := json.Unmarshal(raw, &parsed); err != nil {
-		return cloneOrEmptyMap(fallback)
+	return fileStamp(info)
+}
+
+func fileStamp(info os.FileInfo) storeFileStamp {
+	return storeFileStamp{ModTime: info.ModTime(), Size: info.Size()}
+}
+
+// matches reports whether s and o describe the same version of a file, so a
+// value cached under s is still current.
+func (s storeFileStamp) matches(o storeFileStamp) bool {
+	return s.Size == o.Size && s.ModTime.Equal(o.ModTime)
+}
+
+// storeIOBufferSize sizes the buffered readers used for JSON stores; most
+// stores fit in one or two fills.
+const storeIOBufferSize = 64 << 10
+
+// Store read buffers are pooled so each load reuses a buffer instead of
+// allocating a fresh 64 KiB one.
+var storeReaderPool = sync.Pool{New: func() any { return bufio.NewReaderSize(nil, storeIOBufferSize) }}
+
+// acquireStoreReader returns a pooled buffered reader over r. Hand it back
+// with releaseStoreReader once nothing reads from it any more.
+func acquireStoreReader(r io.Reader) *bufio.Reader {
+	reader := storeReaderPool.Get().(*bufio.Reader)
+	reader.Reset(r)
+	return reader
+}
+
+func releaseStoreReader(reader *bufio.Reader) {
+	reader.Reset(nil)
+	storeReaderPool.Put(reader)
+}
+
+// decodeJSONFile decodes a JSON document straight from a buffered file reader
+// instead of materializing the whole file in memory first.
+func decodeJSONFile(path string, out any) error {
+	file, err := os.Open(path)
+	if err != nil {
+		return err
 	}
-	if parsed == nil {
-		return cloneOrEmptyMap(fallback)
+	defer file.Close()
+	reader := acquireStoreReader(file)
+	defer releaseStoreReader(reader)
+	return json.NewDecoder(reader).Decode(out)
+}
+
+// storeDirsReady records parent directories already created by this process
+// so repeated saves skip the MkdirAll walk.
+var storeDirsReady sync.Map
+
+func ensureStoreDir(path string) error {
+	dir := filepath.Dir(path)
+	if _, ok := storeDirsReady.Load(dir); ok {
+		return nil
+	}
+	if err := os.MkdirAll(dir, 0o755); err != nil {
+		return err
 	}
-	return parsed
+	storeDirsReady.Store(dir, struct{}{})
+	return nil
 }
 
-func saveJSONMap(path string, data map[string]any) error {
-	if err := os.MkdirAll(filepath.Dir(path), 0o755); err != nil {
+func createStoreTempFile(path string) (*os.File, error) {
+	if err := ensureStoreDir(path); err != nil {
+		return nil, err
+	}
+	dir, base := filepath.Split(path)
+	file, err := os.CreateTemp(dir, base+".*.tmp")
+	if err != nil && os.IsNotExist(err) {
+		// The directory was removed since it was first created; recreate it.
+		storeDirsReady.Delete(filepath.Dir(path))
+		if err := ensureStoreDir(path); err != nil {
+			return nil, err
+		}
+		file, err = os.CreateTemp(dir, base+".*.tmp")
+	}
+	return file, err
+}
+
+// encodeJSONFile writes JSON into a temporary sibling and renames it over
+// path, so a failed write never leaves a truncated store behind. Hot stores
+// pass indent=false to skip the whitespace that indentation adds.
+func encodeJSONFile(path string, value any, indent bool) error {
+	file, err := createStoreTempFile(path)
+	if err != nil {
+		return err
+	}
+	tmpPath := file.Name()
+	fail := func(err error) error {
+		file.Close()
+		os.Remove(tmpPath)
 		return err
 	}
-	raw, err := json.MarshalIndent(data, "", "  ")
+	// The encoder renders the whole document into its own reused buffer and
+	// hands it to the file in a single write, so no extra buffering is needed.
+	encoder := json.NewEncoder(file)
+	// Stores are never embedded in HTML; escaping <, > and & in job
+	// descriptions only inflates the output.
+	encoder.SetEscapeHTML(false)
+	if indent {
+		encoder.SetIndent("", "  ")
+	}
+	if err := encoder.Encode(value); err != nil {
+		return fail(err)
+	}
+	if err := file.Chmod(0o644); err != nil {
+		return fail(err)
+	}
+	// Make the new contents durable before the rename publishes them, so a
+	// crash cannot leave an empty store in place of the old one.
+	if err := file.Sync(); err != nil {
+		return fail(err)
+	}
+	// The rename keeps the temp file's mod time and size, so its open handle
+	// stamps the cache without another stat by path.
+	info, err := file.Stat()
 	if err != nil {
+		return fail(err)
+	}
+	if err := file.Close(); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	if err := os.Rename(tmpPath, path); err != nil {
+		os.Remove(tmpPath)
+		jsonStoreCacheForget(path)
 		return err
 	}
-	return os.WriteFile(path, raw, 0o644)
+	if data, ok := value.(map[string]any); ok {
+		jsonStoreCacheRemember(path, info, data)
+	} else {
+		jsonStoreCacheForget(path)
+	}
+	return nil
+}
+
+// saveJSONMap writes a store compactly; set VISA_JOBS_PRETTY_JSON to indent
+// the stores for debugging.
+func saveJSONMap(path string, data map[string]any) error {
+	return encodeJSONFile(path, data, strings.TrimSpace(os.Getenv("VISA_JOBS_PRETTY_JSON")) != "")
+}
+
+// saveCompactJSONMap always writes without indentation, for stores that are
+// rewritten on every search poll.
+func saveCompactJSONMap(path string, data map[string]any) error {
+	return encodeJSONFile(path, data, false)
 }
 
 func cloneOrEmptyMap(value map[string]any) map[string]any {
 	if value == nil {
 		return map[string]any{}
 	}
+	out, _ := cloneJSONValue(value).(map[string]any)
+	if out == nil {
+		return map[string]any{}
+	}
+	return out
+}
+
+// cloneJSONValue deep-copies a decoded JSON value with the same result as a
+// json.Marshal/json.Unmarshal round trip, without serializing the common
+// map/slice/scalar shapes. Unknown types still go through encoding/json.
+func cloneJSONValue(value any) any {
+	switch typed := value.(type) {
+	case nil, string, bool, float64:
+		return typed
+	case int:
+		return float64(typed)
+	case int64:
+		return float64(typed)
+	case map[string]any:
+		if typed == nil {
+			return nil
+		}
+		out := make(map[string]any, len(typed))
+		for key, item := range typed {
+			out[key] = cloneJSONValue(item)
+		}
+		return out
+	case []any:
+		if typed == nil {
+			return nil
+		}
+		out := make([]any, len(typed))
+		for idx, item := range typed {
+			out[idx] = cloneJSONValue(item)
+		}
+		return out
+	case []string:
+		if typed == nil {
+			return nil
+		}
+		out := make([]any, len(typed))
+		for idx, item := range typed {
+			out[idx] = item
+		}
+		return out
+	case []map[string]any:
+		if typed == nil {
+			return nil
+		}
+		out := make([]any, len(typed))
+		for idx, item := range typed {
+			out[idx] = cloneJSONValue(item)
+		}
+		return out
+	case map[string]int:
+		// Per-job visa_counts, saved with every search run response.
+		if typed == nil {
+			return nil
+		}
+		out := make(map[string]any, len(typed))
+		for key, item := range typed {
+			out[key] = float64(item)
+		}
+		return out
+	}
 	raw, err := json.Marshal(value)
 	if err != nil {
-		return map[string]any{}
+		return nil
 	}
-	var out map[string]any
+	var out any
 	if err := json.Unmarshal(raw, &out); err != nil {
-		return map[string]any{}
-	}
-	if out == nil {
-		return map[string]any{}
+		return nil
 	}
 	return out
 }
@@ -1,6 +1,13 @@
 package user
 
-import "testing"
+import (
+	"bytes"
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"reflect"
+	"testing"
+)
 
 func TestListOrEmptySupportsStringSlices(t *testing.T) {
 	values := listOrEmpty([]string{"a", "b"})
@@ -11,3 +18,110 @@ func TestListOrEmptySupportsStringSlices(t *testing.T) {
 		t.Fatalf("expected first value 'a', got %#v", values[0])
 	}
 }
+
+func TestSaveAndLoadJSONMapRoundTrip(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "nested", "store.json")
+	if err := saveJSONMap(path, map[string]any{"users": map[string]any{"u1": map[string]any{"next_id": 2}}}); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+	loaded := loadJSONMap(path, map[string]any{"users": map[string]any{}})
+	user := mapOrNil(mapOrNil(loaded["users"])["u1"])
+	if intOrZero(user["next_id"]) != 2 {
+		t.Fatalf("expected next_id=2 after round trip, got %#v", loaded)
+	}
+
+	if err := os.WriteFile(path, []byte("{not json"), 0o644); err != nil {
+		t.Fatalf("write corrupt store: %v", err)
+	}
+	fallback := loadJSONMap(path, map[string]any{"users": map[string]any{}})
+	if _, ok := fallback["users"].(map[string]any); !ok {
+		t.Fatalf("expected fallback for corrupt store, got %#v", fallback)
+	}
+}
+
+func TestCloneOrEmptyMapMatchesJSONRoundTrip(t *testing.T) {
+	source := map[string]any{
+		"id":     3,
+		"title":  "Engineer",
+		"tags":   []string{"a", "b"},
+		"nested": map[string]any{"items": []any{1, "x", nil, true}},
+		"jobs":   []map[string]any{{"job_url": "https://example.com/1"}},
+		"counts": map[string]int{"h1b": 2, "e3": 0},
+	}
+	raw, err := json.Marshal(source)
+	if err != nil {
+		t.Fatalf("marshal source: %v", err)
+	}
+	var expected map[string]any
+	if err := json.Unmarshal(raw, &expected); err != nil {
+		t.Fatalf("unmarshal source: %v", err)
+	}
+
+	cloned := cloneOrEmptyMap(source)
+	if !reflect.DeepEqual(cloned, expected) {
+		t.Fatalf("expected clone %#v, got %#v", expected, cloned)
+	}
+	mapOrNil(cloned["nested"])["items"] = nil
+	if mapOrNil(source["nested"])["items"] == nil {
+		t.Fatal("expected clone to be independent of the source map")
+	}
+}
+
+func TestSaveJSONMapRecreatesRemovedStoreDir(t *testing.T) {
+	dir := filepath.Join(t.TempDir(), "stores")
+	path := filepath.Join(dir, "store.json")
+	if err := saveJSONMap(path, map[string]any{"users": map[string]any{}}); err != nil {
+		t.Fatalf("first save returned error: %v", err)
+	}
+	if err := os.RemoveAll(dir); err != nil {
+		t.Fatalf("remove store dir: %v", err)
+	}
+	if err := saveJSONMap(path, map[string]any{"users": map[string]any{}}); err != nil {
+		t.Fatalf("save after removal returned error: %v", err)
+	}
+	if _, err := os.Stat(path); err != nil {
+		t.Fatalf("expected store file to exist: %v", err)
+	}
+}
+
+func TestSaveJSONMapLeavesNoTempFiles(t *testing.T) {
+	dir := t.TempDir()
+	path := filepath.Join(dir, "runs.json")
+	for i := 0; i < 2; i++ {
+		if err := saveCompactJSONMap(path, map[string]any{"runs": map[string]any{}}); err != nil {
+			t.Fatalf("saveCompactJSONMap returned error: %v", err)
+		}
+	}
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		t.Fatalf("read store dir: %v", err)
+	}
+	if len(entries) != 1 || entries[0].Name() != "runs.json" {
+		t.Fatalf("expected only runs.json after atomic saves, got %v", entries)
+	}
+	info, err := os.Stat(path)
+	if err != nil {
+		t.Fatalf("stat store: %v", err)
+	}
+	if info.Mode().Perm() != 0o644 {
+		t.Fatalf("expected 0644 store permissions, got %v", info.Mode().Perm())
+	}
+}
+
+func TestSaveJSONMapIsCompactUnlessPrettyRequested(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "store.json")
+	data := map[string]any{"users": map[string]any{"u1": map[string]any{"next_id": 1}}}
+	if err := saveJSONMap(path, data); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+	if raw, _ := os.ReadFile(path); bytes.Count(raw, []byte("\n")) != 1 {
+		t.Fatalf("expected compact single-line store, got %q", raw)
+	}
+	t.Setenv("VISA_JOBS_PRETTY_JSON", "1")
+	if err := saveJSONMap(path, data); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+	if raw, _ := os.ReadFile(path); !bytes.Contains(raw, []byte("\n  ")) {
+		t.Fatalf("expected indented store, got %q", raw)
+	}
+}
@@ -0,0 +1,382 @@
+package user
+
+import (
+	"bytes"
+	"encoding/json"
+	"errors"
+	"os"
+	"slices"
+	"sync"
+)
+
+// User-scoped list stores (saved jobs, ignored jobs, memory lines) keep an
+// append-only JSON Lines journal next to the main JSON file. Adding, updating
+// or deleting a record writes one compact line instead of re-encoding the
+// whole store; the journal is folded back into the main file on the next full
+// save, or once it outgrows both storeJournalCompactBytes and the main file.
+
+const storeJournalCompactBytes = 256 * 1024
+
+// Journal operations. Records without an op append a new item; ids are never
+// reused, so every operation can be replayed more than once safely.
+const (
+	storeJournalOpUpsert = "upsert"
+	storeJournalOpDelete = "delete"
+)
+
+type storeJournalRecord struct {
+	Op           string         `json:"op,omitempty"`
+	UserID       string         `json:"user_id"`
+	ListKey      string         `json:"list_key"`
+	Item         map[string]any `json:"item"`
+	NextID       int            `json:"next_id"`
+	UpdatedAtUTC string         `json:"updated_at_utc,omitempty"`
+}
+
+func storeJournalPath(path string) string {
+	return path + ".journal.jsonl"
+}
+
+func loadJournaledStore(path string) map[string]any {
+	return loadReplayedStore(path, "")
+}
+
+// loadJournaledUserStore loads only userID's entry of a journaled store, for
+// tools that read a single user and never save the result.
+func loadJournaledUserStore(path, userID string) map[string]any {
+	return loadReplayedStore(path, userID)
+}
+
+type replayedStoreCacheEntry struct {
+	Store   storeFileStamp
+	Journal storeFileStamp
+	Data    map[string]any
+}
+
+// replayedStoreCache keeps stores with the journal already applied, keyed by
+// path and the user the load was limited to, until the main file or the
+// journal changes on disk. Bursts of reads between writes then skip decoding
+// every journal line again. Stores without a journal are served by the
+// loadJSONMap cache alone.
+var (
+	replayedStoreCacheMu sync.Mutex
+	replayedStoreCache   = map[string]replayedStoreCacheEntry{}
+)
+
+func loadReplayedStore(path, onlyUserID string) map[string]any {
+	load := func() map[string]any {
+		if onlyUserID == "" {
+			return loadJSONMap(path, map[string]any{"users": map[string]any{}})
+		}
+		return loadJSONUserSubtree(path, onlyUserID)
+	}
+	journalStamp := statStoreFile(storeJournalPath(path))
+	if journalStamp == (storeFileStamp{}) {
+		return load()
+	}
+	storeStamp := statStoreFile(path)
+	cacheKey := path + "\x00" + onlyUserID
+
+	replayedStoreCacheMu.Lock()
+	cached, ok := replayedStoreCache[cacheKey]
+	replayedStoreCacheMu.Unlock()
+	if ok && cached.Store.matches(storeStamp) && cached.Journal.matches(journalStamp) {
+		return cloneOrEmptyMap(cached.Data)
+	}
+
+	data := load()
+	replayStoreJournal(path, data, onlyUserID)
+	replayedStoreCacheMu.Lock()
+	replayedStoreCache[cacheKey] = replayedStoreCacheEntry{Store: storeStamp, Journal: journalStamp, Data: cloneOrEmptyMap(data)}
+	replayedStoreCacheMu.Unlock()
+	return data
+}
+
+// replayStoreJournal applies journal records on top of data, limited to
+// onlyUserID when it is set. Records whose id is already present are skipped,
+// so a journal left behind by an interrupted compaction never duplicates rows.
+func replayStoreJournal(path string, data map[string]any, onlyUserID string) {
+	file, err := os.Open(storeJournalPath(path))
+	if err != nil {
+		return
+	}
+	defer file.Close()
+
+	seen := map[string]map[int]struct{}{}
+	reader := acquireStoreReader(file)
+	defer releaseStoreReader(reader)
+	for {
+		line, readErr := reader.ReadBytes('\n')
+		if len(line) > 0 {
+			var record storeJournalRecord
+			// A torn final line from a crashed append fails to decode and is dropped.
+			if json.Unmarshal(line, &record) == nil && record.UserID != "" && record.ListKey != "" &&
+				(onlyUserID == "" || record.UserID == onlyUserID) {
+				applyStoreJournalRecord(data, record, seen)
+			}
+		}
+		if readErr != nil {
+			return
+		}
+	}
+}
+
+func applyStoreJournalRecord(data map[string]any, record storeJournalRecord, seen map[string]map[int]struct{}) {
+	users := ensureUsersMap(data)
+	entry := mapOrNil(users[record.UserID])
+	if entry == nil {
+		entry = map[string]any{}
+		users[record.UserID] = entry
+	}
+	list := listOrEmpty(entry[record.ListKey])
+	seenKey := record.UserID + "\x00" + record.ListKey
+	ids, ok := seen[seenKey]
+	if !ok {
+		ids = make(map[int]struct{}, len(list))
+		for _, raw := range list {
+			if id, ok := intFromAny(mapOrNil(raw)["id"]); ok {
+				ids[id] = struct{}{}
+			}
+		}
+		seen[seenKey] = ids
+	}
+	id, hasID := intFromAny(record.Item["id"])
+	_, exists := ids[id]
+	switch {
+	case record.Op == storeJournalOpDelete:
+		if !hasID || !exists {
+			break
+		}
+		idx := journalListIndex(list, id)
+		entry[record.ListKey] = slices.Delete(list, idx, idx+1)
+		delete(ids, id)
+		// Keep the trusted normalized prefix from sliding over journaled rows.
+		if trusted, _ := intFromAny(entry[normalizedRowsKey]); idx < trusted {
+			entry[normalizedRowsKey] = trusted - 1
+		}
+	case record.Op == storeJournalOpUpsert && hasID && exists:
+		list[journalListIndex(list, id)] = record.Item
+		entry[record.ListKey] = list
+	case exists:
+		// Already in the store, e.g. a journal left by an interrupted compaction.
+	default:
+		if !hasID {
+			entry[record.ListKey] = append(list, record.Item)
+			break
+		}
+		ids[id] = struct{}{}
+		entry[record.ListKey] = insertJournalItemSorted(entry, list, id, record.Item)
+	}
+	if current, _ := intFromAny(entry["next_id"]); record.NextID > current {
+		entry["next_id"] = record.NextID
+	}
+	if record.UpdatedAtUTC != "" {
+		entry["updated_at_utc"] = record.UpdatedAtUTC
+	}
+}
+
+// insertJournalItemSorted appends item, or inserts it at its id position in
+// the rare case it is older than the last row (e.g. an upsert replayed after
+// its row was deleted), so loads never have to sort the list. The trusted
+// normalized prefix is cut to end before an inserted row.
+func insertJournalItemSorted(entry map[string]any, list []any, id int, item map[string]any) []any {
+	if len(list) == 0 {
+		return append(list, item)
+	}
+	if lastID, ok := intFromAny(mapOrNil(list[len(list)-1])["id"]); !ok || lastID < id {
+		return append(list, item)
+	}
+	idx, _ := slices.BinarySearchFunc(list, id, func(raw any, target int) int {
+		rowID, _ := intFromAny(mapOrNil(raw)["id"])
+		return rowID - target
+	})
+	if trusted, _ := intFromAny(entry[normalizedRowsKey]); idx < trusted {
+		entry[normalizedRowsKey] = idx
+	}
+	return slices.Insert(list, idx, any(item))
+}
+
+// journalListIndex locates the row with id in a replayed list. Lists are
+// written sorted by id and journal inserts keep them sorted, so a binary
+// search finds the row without a scan; a legacy list that was never sorted
+// falls back to scanning when the search misses.
+func journalListIndex(list []any, id int) int {
+	idx, found := slices.BinarySearchFunc(list, id, func(raw any, target int) int {
+		rowID, _ := intFromAny(mapOrNil(raw)["id"])
+		return rowID - target
+	})
+	if found {
+		return idx
+	}
+	return slices.IndexFunc(list, func(raw any) bool {
+		rowID, ok := intFromAny(mapOrNil(raw)["id"])
+		return ok && rowID == id
+	})
+}
+
+// saveJournaledStore rewrites the main file with the full store and drops the
+// journal it now contains. It holds the journal's writer while doing so, but a
+// store loaded before the call can still miss appends made since; callers
+// that load, change and save a whole store use updateJournaledStore instead.
+func saveJournaledStore(path string, data map[string]any) error {
+	writer := storeJournalWriterFor(storeJournalPath(path))
+	writer.fileMu.Lock()
+	defer writer.fileMu.Unlock()
+	return replaceJournaledStoreLocked(path, data)
+}
+
+// updateJournaledStore loads the full store, journal included, hands it to
+// update and, when update reports a change, rewrites the main file and drops
+// the journal. The journal's writer is held from the load to the removal, so
+// an append for another user waits and lands in the next journal instead of
+// being deleted with this one.
+func updateJournaledStore(path string, update func(store map[string]any) (bool, error)) error {
+	writer := storeJournalWriterFor(storeJournalPath(path))
+	writer.fileMu.Lock()
+	defer writer.fileMu.Unlock()
+	store := loadJournaledStore(path)
+	changed, err := update(store)
+	if err != nil || !changed {
+		return err
+	}
+	return replaceJournaledStoreLocked(path, store)
+}
+
+func replaceJournaledStoreLocked(path string, data map[string]any) error {
+	if err := saveJSONMap(path, data); err != nil {
+		return err
+	}
+	if err := os.Remove(storeJournalPath(path)); err != nil && !errors.Is(err, os.ErrNotExist) {
+		return err
+	}
+	return nil
+}
+
+// appendStoreJournal persists one list item change. Callers mutate only the
+// user entry they loaded with loadJournaledUserStore; when the journal is due,
+// the full store, which now replays the new record, is loaded and compacted.
+func appendStoreJournal(path string, record storeJournalRecord) error {
+	line, err := encodeStoreJournalRecord(record)
+	if err != nil {
+		return err
+	}
+	size, err := storeJournalWriterFor(storeJournalPath(path)).append(line)
+	if err != nil {
+		return err
+	}
+	if storeJournalDue(path, size) {
+		return updateJournaledStore(path, func(map[string]any) (bool, error) { return true, nil })
+	}
+	return nil
+}
+
+// storeJournalDue reports whether a journal of journalSize bytes should be
+// folded into the main file at path. Besides the fixed floor, the journal
+// must have grown to the size of the main file, so each compaction rewrites
+// at most as many bytes as were appended since the last one instead of
+// rewriting a large store every storeJournalCompactBytes.
+func storeJournalDue(path string, journalSize int64) bool {
+	if journalSize < storeJournalCompactBytes {
+		return false
+	}
+	return journalSize >= statStoreFile(path).Size
+}
+
+// encodeStoreJournalRecord renders record as one newline-terminated journal
+// line. Like the main store files, lines skip HTML escaping, which otherwise
+// inflates every <, > and & in job descriptions to six bytes.
+func encodeStoreJournalRecord(record storeJournalRecord) ([]byte, error) {
+	var buf bytes.Buffer
+	encoder := json.NewEncoder(&buf)
+	encoder.SetEscapeHTML(false)
+	if err := encoder.Encode(record); err != nil {
+		return nil, err
+	}
+	return buf.Bytes(), nil
+}
+
+// storeJournalWriter coalesces concurrent appends to one journal file: the
+// first caller writes every line queued while it holds the file, so a burst of
+// tool calls for different users costs one open, write and fsync instead of
+// one per record. Each caller still returns only after its own line is synced
+// to disk, as durable as the atomic full-store save.
+type storeJournalWriter struct {
+	path    string
+	mu      sync.Mutex
+	writing bool
+	pending []byte
+	waiters []chan storeJournalWriteResult
+	// fileMu is held while a batch is written and while the store is
+	// compacted, so no line is appended to a journal about to be removed.
+	fileMu sync.Mutex
+}
+
+type storeJournalWriteResult struct {
+	size int64
+	err  error
+}
+
+var storeJournalWriters sync.Map
+
+func storeJournalWriterFor(journalPath string) *storeJournalWriter {
+	if writer, ok := storeJournalWriters.Load(journalPath); ok {
+		return writer.(*storeJournalWriter)
+	}
+	writer, _ := storeJournalWriters.LoadOrStore(journalPath, &storeJournalWriter{path: journalPath})
+	return writer.(*storeJournalWriter)
+}
+
+// append queues line and returns the journal size after it was synced.
+func (w *storeJournalWriter) append(line []byte) (int64, error) {
+	done := make(chan storeJournalWriteResult, 1)
+	w.mu.Lock()
+	w.pending = append(w.pending, line...)
+	w.waiters = append(w.waiters, done)
+	if w.writing {
+		w.mu.Unlock()
+		result := <-done
+		return result.size, result.err
+	}
+	w.writing = true
+	for len(w.waiters) > 0 {
+		batch, waiters := w.pending, w.waiters
+		w.pending, w.waiters = nil, nil
+		w.mu.Unlock()
+		size, err := w.write(batch)
+		for _, waiter := range waiters {
+			waiter <- storeJournalWriteResult{size: size, err: err}
+		}
+		w.mu.Lock()
+	}
+	w.writing = false
+	w.mu.Unlock()
+	result := <-done
+	return result.size, result.err
+}
+
+func (w *storeJournalWriter) write(batch []byte) (int64, error) {
+	w.fileMu.Lock()
+	defer w.fileMu.Unlock()
+	if err := ensureStoreDir(w.path); err != nil {
+		return 0, err
+	}
+	file, err := os.OpenFile(w.path, os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0o644)
+	if err != nil {
+		return 0, err
+	}
+	if _, err := file.Write(batch); err != nil {
+		file.Close()
+		return 0, err
+	}
+	if err := file.Sync(); err != nil {
+		file.Close()
+		return 0, err
+	}
+	// Size the journal through the open handle instead of a stat by path.
+	info, err := file.Stat()
+	if err != nil {
+		file.Close()
+		return 0, err
+	}
+	return info.Size(), file.Close()
+}
@@ -0,0 +1,256 @@
+package user
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"testing"
+)
+
+func TestStoreJournalReplaySkipsRecordsAlreadyInStore(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "store.json")
+	line := map[string]any{"id": 1, "text": "hello"}
+	record := storeJournalRecord{UserID: "u1", ListKey: "lines", Item: line, NextID: 2}
+	if err := appendStoreJournal(path, record); err != nil {
+		t.Fatalf("appendStoreJournal failed: %v", err)
+	}
+	if err := saveJSONMap(path, map[string]any{"users": map[string]any{
+		"u1": map[string]any{"lines": []any{line}, "next_id": 2},
+	}}); err != nil {
+		t.Fatalf("saveJSONMap failed: %v", err)
+	}
+
+	loaded := loadJournaledStore(path)
+	lines := listOrEmpty(mapOrNil(getUsersMap(loaded)["u1"])["lines"])
+	if len(lines) != 1 {
+		t.Fatalf("expected journal replay to skip duplicate id, got %#v", lines)
+	}
+}
+
+func TestStoreJournalReplaysUpsertsAndDeletes(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "saved_jobs.json")
+	base := map[string]any{"users": map[string]any{"u1": map[string]any{
+		"jobs":    []any{map[string]any{"id": 1, "note": "old"}, map[string]any{"id": 2}},
+		"next_id": 3,
+	}}}
+	if err := saveJSONMap(path, base); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+	records := []storeJournalRecord{
+		{Op: storeJournalOpUpsert, UserID: "u1", ListKey: "jobs", Item: map[string]any{"id": 1, "note": "new"}, NextID: 3},
+		{Op: storeJournalOpDelete, UserID: "u1", ListKey: "jobs", Item: map[string]any{"id": 2}, NextID: 3},
+	}
+	for _, record := range records {
+		if err := appendStoreJournal(path, record); err != nil {
+			t.Fatalf("appendStoreJournal returned error: %v", err)
+		}
+	}
+	// Replaying on top of a store that already holds the changes is a no-op.
+	for i := 0; i < 2; i++ {
+		jobs := listOrEmpty(mapOrNil(getUsersMap(loadJournaledStore(path))["u1"])["jobs"])
+		if len(jobs) != 1 || mapOrNil(jobs[0])["note"] != "new" {
+			t.Fatalf("unexpected replayed jobs on pass %d: %#v", i, jobs)
+		}
+		if i == 0 {
+			if err := saveJSONMap(path, loadJournaledStore(path)); err != nil {
+				t.Fatalf("saveJSONMap returned error: %v", err)
+			}
+		}
+	}
+}
+
+func TestStoreJournalWriterKeepsConcurrentAppends(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "user_memory_blob.json")
+	const writers = 16
+	errs := make(chan error, writers)
+	for i := 1; i <= writers; i++ {
+		go func(id int) {
+			errs <- appendStoreJournal(path, storeJournalRecord{
+				UserID:  fmt.Sprintf("u%d", id),
+				ListKey: "lines",
+				Item:    map[string]any{"id": 1, "text": "hello"},
+				NextID:  2,
+			})
+		}(i)
+	}
+	for i := 0; i < writers; i++ {
+		if err := <-errs; err != nil {
+			t.Fatalf("appendStoreJournal returned error: %v", err)
+		}
+	}
+	if users := getUsersMap(loadJournaledStore(path)); len(users) != writers {
+		t.Fatalf("expected %d users replayed from the journal, got %d", writers, len(users))
+	}
+}
+
+func TestStoreJournalReplayInsertsOlderIDsInOrder(t *testing.T) {
+	data := map[string]any{"users": map[string]any{"u1": map[string]any{
+		"lines":              []any{map[string]any{"id": 1}, map[string]any{"id": 5}},
+		normalizedRowsKey:    2,
+		normalizedVersionKey: listRowSchemaVersion,
+	}}}
+	record := storeJournalRecord{Op: storeJournalOpUpsert, UserID: "u1", ListKey: "lines", Item: map[string]any{"id": 3, "text": " raw "}}
+	applyStoreJournalRecord(data, record, map[string]map[int]struct{}{})
+	entry := mapOrNil(getUsersMap(data)["u1"])
+	lines, _ := normalizeEntryList(entry, "lines", normalizeMemoryLine)
+	if len(lines) != 3 || intOrZero(lines[1]["id"]) != 3 || intOrZero(lines[2]["id"]) != 5 {
+		t.Fatalf("expected replayed id 3 between 1 and 5, got %#v", lines)
+	}
+	if lines[1]["text"] != "raw" {
+		t.Fatalf("expected inserted row to be normalized, got %#v", lines[1])
+	}
+}
+
+func TestStoreJournalLinesKeepMarkupUnescaped(t *testing.T) {
+	blobPath := filepath.Join(t.TempDir(), "user_memory_blob.json")
+	t.Setenv("VISA_USER_BLOB_PATH", blobPath)
+
+	if _, err := AddUserMemoryLine(map[string]any{"user_id": "u1", "content": "Likes <Go> & Rust"}); err != nil {
+		t.Fatalf("AddUserMemoryLine failed: %v", err)
+	}
+	raw, err := os.ReadFile(storeJournalPath(blobPath))
+	if err != nil {
+		t.Fatalf("read journal: %v", err)
+	}
+	if !strings.Contains(string(raw), "Likes <Go> & Rust") || strings.Count(string(raw), "\n") != 1 {
+		t.Fatalf("expected one unescaped journal line, got %q", raw)
+	}
+	entry := getUserBlobEntry(loadUserBlob(), "u1")
+	if lines := entry["lines"].([]map[string]any); len(lines) != 1 || getString(lines[0], "text") != "Likes <Go> & Rust" {
+		t.Fatalf("expected the journaled line to replay, got %#v", lines)
+	}
+}
+
+func TestJournalListIndexFindsRowsInSortedAndLegacyLists(t *testing.T) {
+	sorted := []any{map[string]any{"id": 1.0}, map[string]any{"id": 4.0}, map[string]any{"id": 7.0}}
+	if got := journalListIndex(sorted, 7); got != 2 {
+		t.Fatalf("expected id 7 at index 2, got %d", got)
+	}
+	if got := journalListIndex(sorted, 5); got != -1 {
+		t.Fatalf("expected a missing id to report -1, got %d", got)
+	}
+	legacy := []any{map[string]any{"id": 9.0}, map[string]any{"id": 2.0}, map[string]any{"id": 5.0}}
+	if got := journalListIndex(legacy, 9); got != 0 {
+		t.Fatalf("expected an unsorted list to fall back to a scan, got %d", got)
+	}
+}
+
+func TestReplayedStoreCacheFollowsJournalAppends(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "saved_jobs.json")
+	base := map[string]any{"users": map[string]any{"u1": map[string]any{"jobs": []any{map[string]any{"id": 1}}, "next_id": 2}}}
+	if err := saveJSONMap(path, base); err != nil {
+		t.Fatalf("saveJSONMap returned error: %v", err)
+	}
+	record := storeJournalRecord{UserID: "u1", ListKey: "jobs", Item: map[string]any{"id": 2}, NextID: 3}
+	if err := appendStoreJournal(path, record); err != nil {
+		t.Fatalf("appendStoreJournal returned error: %v", err)
+	}
+	first := loadJournaledUserStore(path, "u1")
+	if jobs := listOrEmpty(mapOrNil(getUsersMap(first)["u1"])["jobs"]); len(jobs) != 2 {
+		t.Fatalf("expected the journaled row to be replayed, got %#v", jobs)
+	}
+	// Callers own the returned copy.
+	mapOrNil(getUsersMap(first)["u1"])["jobs"] = []any{}
+	if jobs := listOrEmpty(mapOrNil(getUsersMap(loadJournaledUserStore(path, "u1"))["u1"])["jobs"]); len(jobs) != 2 {
+		t.Fatalf("expected a cached load to be unaffected by caller edits, got %#v", jobs)
+	}
+
+	record = storeJournalRecord{UserID: "u1", ListKey: "jobs", Item: map[string]any{"id": 3}, NextID: 4}
+	if err := appendStoreJournal(path, record); err != nil {
+		t.Fatalf("appendStoreJournal returned error: %v", err)
+	}
+	if jobs := listOrEmpty(mapOrNil(getUsersMap(loadJournaledUserStore(path, "u1"))["u1"])["jobs"]); len(jobs) != 3 {
+		t.Fatalf("expected a new journal line to invalidate the cache, got %#v", jobs)
+	}
+}
+
+func TestStoreJournalDueScalesWithMainFile(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "saved_jobs.json")
+	if storeJournalDue(path, storeJournalCompactBytes-1) {
+		t.Fatalf("expected a journal under the floor not to be due")
+	}
+	if !storeJournalDue(path, storeJournalCompactBytes) {
+		t.Fatalf("expected a journal at the floor to be due without a main file")
+	}
+	if err := os.WriteFile(path, make([]byte, 2*storeJournalCompactBytes), 0o644); err != nil {
+		t.Fatalf("write main file: %v", err)
+	}
+	if storeJournalDue(path, storeJournalCompactBytes) {
+		t.Fatalf("expected a journal smaller than the main file not to be due")
+	}
+	if !storeJournalDue(path, 2*storeJournalCompactBytes) {
+		t.Fatalf("expected a journal as large as the main file to be due")
+	}
+}
+
+func TestStoreJournalCompactionKeepsOtherUsers(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "store.json")
+	if err := saveJSONMap(path, map[string]any{"users": map[string]any{
+		"u2": map[string]any{"lines": []any{map[string]any{"id": 1, "text": "other user"}}, "next_id": 2},
+	}}); err != nil {
+		t.Fatalf("saveJSONMap failed: %v", err)
+	}
+	text := strings.Repeat("x", 1024)
+	for id := 1; ; id++ {
+		record := storeJournalRecord{UserID: "u1", ListKey: "lines", Item: map[string]any{"id": id, "text": text}, NextID: id + 1}
+		if err := appendStoreJournal(path, record); err != nil {
+			t.Fatalf("appendStoreJournal failed: %v", err)
+		}
+		if _, err := os.Stat(storeJournalPath(path)); os.IsNotExist(err) {
+			break
+		}
+		if id > 1000 {
+			t.Fatalf("expected the journal to be compacted")
+		}
+	}
+	users := getUsersMap(loadJSONMap(path, nil))
+	if len(listOrEmpty(mapOrNil(users["u2"])["lines"])) != 1 || len(listOrEmpty(mapOrNil(users["u1"])["lines"])) < 2 {
+		t.Fatalf("expected compaction to fold u1's journal in and keep u2, got %#v", users["u2"])
+	}
+}
+
+func TestStoreJournalAppendsSurviveConcurrentRewrites(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "store.json")
+	if err := saveJSONMap(path, map[string]any{"users": map[string]any{}}); err != nil {
+		t.Fatalf("saveJSONMap failed: %v", err)
+	}
+	const users, perUser = 8, 25
+	var appends sync.WaitGroup
+	for u := 0; u < users; u++ {
+		appends.Add(1)
+		go func(userID string) {
+			defer appends.Done()
+			for id := 1; id <= perUser; id++ {
+				record := storeJournalRecord{UserID: userID, ListKey: "lines", Item: map[string]any{"id": id, "text": "line"}, NextID: id + 1}
+				if err := appendStoreJournal(path, record); err != nil {
+					t.Errorf("appendStoreJournal failed: %v", err)
+					return
+				}
+			}
+		}(fmt.Sprintf("u%d", u))
+	}
+	done := make(chan struct{})
+	go func() {
+		appends.Wait()
+		close(done)
+	}()
+	// Full-store rewrites, as bulk tools and data deletion make, racing the appends.
+	for rewriting := true; rewriting; {
+		select {
+		case <-done:
+			rewriting = false
+		default:
+		}
+		if err := updateJournaledStore(path, func(map[string]any) (bool, error) { return true, nil }); err != nil {
+			t.Fatalf("updateJournaledStore failed: %v", err)
+		}
+	}
+	stored := getUsersMap(loadJournaledStore(path))
+	for u := 0; u < users; u++ {
+		if got := len(listOrEmpty(mapOrNil(stored[fmt.Sprintf("u%d", u)])["lines"])); got != perUser {
+			t.Fatalf("expected u%d to keep %d lines, got %d", u, perUser, got)
+		}
+	}
+}
@@ -27,6 +27,21 @@ def _load_capabilities() -> dict[str, Any]:
     return caps
 
 
+def _capabilities_payload(caps: dict[str, Any]) -> dict[str, Any]:
+    """Mirror what get_mcp_capabilities() returns: the contract plus a
+    name/description ``tools_index``."""
+    payload = dict(caps)
+    tools = caps.get("tools", [])
+    if not isinstance(tools, list):
+        tools = []
+    payload["tools_index"] = [
+        {"name": tool.get("name", ""), "description": tool.get("description", "")}
+        for tool in tools
+        if isinstance(tool, dict)
+    ]
+    return payload
+
+
 def _format_list(values: list[str]) -> str:
     if not values:
         return "-"
@@ -84,6 +99,12 @@ def _render_markdown_contract(caps: dict[str, Any]) -> str:
         lines.append(f"- `{key}`: `{defaults[key]}`")
     lines.append("")
     lines.append("### Tools")
+    lines.append(
+        "`get_mcp_capabilities()` lists tools in `tools_index` (name and description); "
+        "call `get_mcp_tool_contract(tool_name)` for a tool's inputs and input schema. "
+        "The full `tools` list is still returned but deprecated."
+    )
+    lines.append("")
     lines.append("| Tool | Description | Required Inputs | Optional Inputs |")
     lines.append("|---|---|---|---|")
     for tool in tools:
@@ -175,6 +196,12 @@ def _render_html_contract(caps: dict[str, Any]) -> str:
     )
     out.append("      </ul>")
     out.append("      <p><strong>Tools</strong></p>")
+    out.append(
+        "      <p><code>get_mcp_capabilities()</code> lists tools in <code>tools_index</code> "
+        "(name and description); call <code>get_mcp_tool_contract(tool_name)</code> for a "
+        "tool's inputs and input schema. The full <code>tools</code> list is still returned "
+        "but deprecated.</p>"
+    )
     out.append("      <ul>")
     for tool in tools:
         if not isinstance(tool, dict):
@@ -247,7 +274,7 @@ def main() -> None:
     index_html = root / "index.html"
     json_out = root / "docs" / "mcp-contract.json"
 
-    caps = _load_capabilities()
+    caps = _capabilities_payload(_load_capabilities())
     markdown = _render_markdown_contract(caps)
     html_block = _render_html_contract(caps)
 